@@ -0,0 +1,88 @@
+"""
+Compares the two ways GetOrderById answers from cache:
+
+  json     orders:{id} JSON -> json.loads -> domain Order -> OrderDto -> OrderData -> bytes
+  proto    order_pb:{id} OrderData bytes -> framed OrderResponse bytes
+
+Only the CPU work after the Redis read is measured; both paths make one GET.
+
+    python -m benchmarks.order_response_cache_benchmark [--items 3] [--number 20000]
+"""
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import argparse
+import json
+import timeit
+from datetime import datetime, timezone
+
+from src.application.dtos.order_dto import OrderDto
+from src.domain.entities.order import Order, OrderStatus
+from src.domain.entities.order_items import OrderItem
+from src.domain.entities.payment_details import PaymentDetails
+from src.domain.value_objects.money import Money
+from src.infrastructure.database.mappers.entity_mapper import EntityMapper
+from src.infrastructure.grpc.generated.order_service_pb2 import OrderResponse, OrderSuccess
+from src.infrastructure.redis.order_response_cache import order_response_bytes
+
+
+def sample_order(item_count: int) -> Order:
+    now = datetime.now(timezone.utc)
+    return Order(
+        id="2f7c1e9a-6d41-4d7e-9b0a-3c5e8f1a2b4d",
+        user_id="8a1d3c5e-7f92-4b6a-a0c1-d2e3f4a5b6c7",
+        idempotency_key="idem-2f7c1e9a",
+        items=[OrderItem(id=f"item-{i}", course_id=f"course-{i}", price=499.0 + i) for i in range(item_count)],
+        amount=Money(499.0 * item_count, "INR"),
+        sub_total=499 * item_count,
+        sales_tax=0,
+        discount=0,
+        status=OrderStatus.PENDING_PAYMENT,
+        payment_details=PaymentDetails(
+            id="pd-1",
+            payment_id="pay_9f8e7d6c",
+            provider="razorpay",
+            provider_order_id="order_5a4b3c2d",
+            payment_status="pending",
+            updated_at=now,
+        ),
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def json_path(cached_json: str) -> bytes:
+    order = EntityMapper.deserialize_json_to_order(json.loads(cached_json))
+    return OrderResponse(success=OrderSuccess(order=OrderDto.from_domain(order).to_response_data())).SerializeToString()
+
+
+def proto_path(cached_order_data: bytes) -> bytes:
+    return order_response_bytes(cached_order_data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=3, help="order items per order")
+    parser.add_argument("--number", type=int, default=20000, help="iterations per path")
+    args = parser.parse_args()
+
+    order = sample_order(args.items)
+    cached_json = EntityMapper.serialize_order_to_json(order)
+    cached_order_data = OrderDto.from_domain(order).to_response_data().SerializeToString()
+
+    # Both paths must put the same response on the wire
+    assert json_path(cached_json) == proto_path(cached_order_data)
+
+    results = {}
+    for name, fn, arg in (("json", json_path, cached_json), ("proto", proto_path, cached_order_data)):
+        seconds = min(timeit.repeat(lambda: fn(arg), number=args.number, repeat=5))
+        results[name] = seconds / args.number * 1e6
+        print(f"{name:>6}: {results[name]:8.2f} us/op")
+    print(f"speedup: {results['json'] / results['proto']:.1f}x "
+          f"({len(cached_json)} B JSON vs {len(cached_order_data)} B protobuf cached)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ from src.infrastructure.database.database import Base
 from src.infrastructure.config.settings import settings
 from src.infrastructure.database.models.order_model import OrderModel, PaymentDetailsModel, OrderItemModel
 from src.infrastructure.database.models.session_booking_model import SessionBookingModel
+from src.infrastructure.database.models.outbox_model import OutboxEventModel
 
 config = context.config
 
@@ -0,0 +1,26 @@
+"""add outbox events sent_at index
+
+Revision ID: 3a7f5c2e9b18
+Revises: 8c41f0a7d2e6
+Create Date: 2026-10-18 16:05:47.261903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a7f5c2e9b18'
+down_revision: Union[str, None] = '8c41f0a7d2e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_outbox_events_sent_at', 'outbox_events', ['sent_at'], unique=False, postgresql_where=sa.text('sent_at IS NOT NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('idx_outbox_events_sent_at', table_name='outbox_events', postgresql_where=sa.text('sent_at IS NOT NULL'))
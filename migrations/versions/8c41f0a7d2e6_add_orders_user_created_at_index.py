@@ -0,0 +1,26 @@
+"""add orders user created_at index
+
+Revision ID: 8c41f0a7d2e6
+Revises: 5b7e2c91d4a3
+Create Date: 2026-10-18 14:32:05.118274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41f0a7d2e6'
+down_revision: Union[str, None] = '5b7e2c91d4a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_orders_user_id_created_at_id', 'orders', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_orders_user_id_created_at_id', table_name='orders')
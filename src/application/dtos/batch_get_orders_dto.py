@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field, field_validator
+
+from src.infrastructure.config.settings import settings
+
+
+class BatchGetOrdersDto(BaseModel):
+    order_ids: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.BATCH_GET_ORDERS_MAX_IDS,
+        description="IDs of the orders to fetch",
+    )
+
+    @field_validator("order_ids")
+    @classmethod
+    def validate_order_ids(cls, value):
+        if any(not order_id or not order_id.strip() for order_id in value):
+            raise ValueError("order_ids cannot contain empty ids")
+        return value
@@ -0,0 +1,36 @@
+from pydantic import BaseModel, Field, field_validator
+
+from src.infrastructure.grpc.generated.order_service_pb2 import StreamOrdersRequest
+
+
+class StreamOrdersDto(BaseModel):
+    user_id: str = Field(..., description="ID of the user")
+    status: str | None = Field(default=None, description="Filter by order status (optional)")
+    sort_order: str = Field(default="desc", description="asc or desc by creation time")
+    cursor: str | None = Field(default=None, description="Resume after the order this cursor came with (optional)")
+    limit: int | None = Field(default=None, ge=1, description="Maximum number of orders (optional)")
+
+    @classmethod
+    def from_proto(cls, proto_obj: StreamOrdersRequest):
+        return cls(
+            user_id=proto_obj.user_id,
+            status=proto_obj.status or None,
+            sort_order=proto_obj.sort_order or "desc",
+            cursor=proto_obj.cursor or None,
+            limit=proto_obj.limit or None,
+        )
+
+    @field_validator("user_id")
+    @classmethod
+    def validate_user_id(cls, value):
+        if not value or not value.strip():
+            raise ValueError("user_id is required and cannot be empty")
+        return value
+
+    @field_validator("sort_order")
+    @classmethod
+    def validate_sort_order(cls, value):
+        value = value.strip().lower()
+        if value not in ("asc", "desc"):
+            raise ValueError("sort_order must be 'asc' or 'desc'")
+        return value
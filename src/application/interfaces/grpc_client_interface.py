@@ -19,7 +19,11 @@ class CourseEnrollmentResult(TypedDict):
 
 class IUserServiceClient(ABC):
     @abstractmethod
-    async def get_user(self, user_id: str) -> dict:
+    async def get_user(self, user_id: str) -> dict | None:
+        pass
+
+    @abstractmethod
+    async def get_users_by_ids(self, user_ids: list[str]) -> List[dict]:
         pass
 
     @abstractmethod
@@ -40,6 +44,14 @@ class ICourseServiceClient(ABC):
     async def get_courses_by_ids(self, course_ids: list[str]) -> List[CourseInfo]:
         pass
 
+    @abstractmethod
+    async def get_user_enrolled_course_ids(self, user_id: str) -> set[str]:
+        """
+        Returns the ids of every course the user is enrolled in, fetched in as few
+        round trips as the upstream pagination allows.
+        """
+        pass
+
     @abstractmethod
     async def close(self) -> None:
         pass
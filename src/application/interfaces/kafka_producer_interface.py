@@ -9,6 +9,10 @@ class IKafkaProducer(ABC, Generic[T]):
     @abstractmethod
     async def publish_event(self, topic: str, event: T, schema: Schema | None) -> None:
         pass
+
+    @abstractmethod
+    async def publish_events(self, events: list[tuple[str, dict]]) -> list[BaseException | None]:
+        pass
     @abstractmethod
     async def start(self) -> None:
         pass
@@ -10,7 +10,15 @@ class IMetricsService(ABC):
         pass
 
     @abstractmethod
-    def request_latency(self, method: str, endpoint: str, latency: float) -> None:
+    def request_latency(self, method: str, endpoint: str, latency: float, trace_id: str | None = None) -> None:
+        pass
+
+    @abstractmethod
+    def requests_in_flight(self, method: str, delta: int) -> None:
+        pass
+
+    @abstractmethod
+    def response_size(self, method: str, size_bytes: int) -> None:
         pass
 
     @abstractmethod
@@ -27,4 +35,52 @@ class IMetricsService(ABC):
 
     @abstractmethod
     def saga_failures(self, step: str) -> None:
+        pass
+
+    @abstractmethod
+    def admission_limit(self, method: str, limit: int, in_flight: int) -> None:
+        pass
+
+    @abstractmethod
+    def admission_rejections(self, method: str) -> None:
+        pass
+
+    @abstractmethod
+    def stage_latency(self, pipeline: str, stage: str, status: str, latency: float) -> None:
+        pass
+
+    @abstractmethod
+    def upstream_in_flight(self, upstream: str, delta: int) -> None:
+        pass
+
+    @abstractmethod
+    def upstream_channels(self, upstream: str, state: str, count: int) -> None:
+        pass
+
+    @abstractmethod
+    def upstream_bulkhead(self, upstream: str, method: str, limit: int, in_flight: int, queue_depth: int) -> None:
+        pass
+
+    @abstractmethod
+    def upstream_rejections(self, upstream: str, method: str) -> None:
+        pass
+
+    @abstractmethod
+    def upstream_hedges(self, upstream: str, method: str, result: str) -> None:
+        pass
+
+    @abstractmethod
+    def bloom_filter_checks(self, filter: str, result: str) -> None:
+        pass
+
+    @abstractmethod
+    def bloom_filter_stats(
+        self,
+        filter: str,
+        bits: int,
+        hash_functions: int,
+        capacity: int,
+        fill_ratio: float,
+        estimated_false_positive_rate: float,
+    ) -> None:
         pass
\ No newline at end of file
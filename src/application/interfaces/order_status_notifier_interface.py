@@ -0,0 +1,26 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import AsyncContextManager, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.order import OrderStatus
+
+
+class IOrderStatusNotifier(ABC):
+    @abstractmethod
+    def publish_after_commit(self, session: AsyncSession, order_id: str, status: OrderStatus | str) -> None:
+        """
+        Announces that `order_id` moves to `status` once `session` commits. Nothing is
+        published if the transaction rolls back.
+        """
+        pass
+
+    @abstractmethod
+    def watch(self, order_id: str) -> AsyncContextManager["asyncio.Queue[Optional[str]]"]:
+        """
+        Subscribes to status changes of `order_id` for the duration of the context.
+        The queue yields each new status value, or None when notifications may have
+        been missed (e.g. after a reconnect) and the status should be re-read.
+        """
+        pass
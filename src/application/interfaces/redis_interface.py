@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Any, AsyncContextManager
+from typing import Optional, Any, AsyncContextManager, Sequence
 
 from redis.asyncio import client
 
@@ -17,6 +17,41 @@ class IRedisService(ABC):
     async def set(self, key: str, value: Any, expire: int | None) -> None:
         pass
 
+    @abstractmethod
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """Like `get`, but returns the raw value without decoding it as text."""
+        pass
+
+    @abstractmethod
+    async def get_many(self, keys: list[str]) -> list[Optional[str]]:
+        """Fetches several keys in one round trip; values line up with `keys`."""
+        pass
+
+    @abstractmethod
+    async def set_many(
+        self,
+        values: dict[str, Any],
+        expire: int | None,
+        clear_indexes: Sequence[str] = (),
+        delete: Sequence[str] = (),
+    ) -> None:
+        """
+        Sets several keys, each with the same expiry, in one pipelined round trip.
+        Any `clear_indexes` are emptied (see `delete_indexed`) and `delete` keys
+        removed in that same round trip.
+        """
+        pass
+
+    @abstractmethod
+    async def set_indexed(self, key: str, value: Any, index: str, expire: int | None) -> None:
+        """Sets `key` and records it in the `index` set, so it can be dropped with `delete_indexed`."""
+        pass
+
+    @abstractmethod
+    async def delete_indexed(self, index: str) -> None:
+        """Deletes every key recorded in `index` by `set_indexed`, and the index itself, without a SCAN."""
+        pass
+
     @abstractmethod
     async def delete(self, key: str) -> None:
         pass
@@ -0,0 +1,85 @@
+import json
+from typing import Any
+
+from src.application.interfaces.logging_interface import ILoggingService
+from src.application.interfaces.metrics_interface import IMetricsService
+from src.application.interfaces.redis_interface import IRedisService
+from src.application.use_cases.order.place_order_use_case import PlaceOrderUseCase
+from src.domain.events.course_changed_event import CourseChangedEventDto
+from src.shared.events.topics import EVENT_TOPICS
+from src.shared.utils.ttl_cache import TTLCache
+
+
+class SyncCoursePriceUseCase:
+    """
+    Keeps the course_price:* cache (Redis and the in-process snapshot) in step with
+    the course service, so PlaceOrderUseCase can cache prices far longer than it could
+    if it relied on expiry alone.
+
+    PlaceOrderUseCase writes fetched prices back with SET NX, so a price written here
+    wins over a fetch that was already in flight. Evictions leave a short-lived
+    tombstone in the key for the same reason; readers treat it as a miss.
+    """
+
+    # Outlasts any course price fetch in flight when the eviction lands
+    # (bounded by GRPC_CLIENT_TIMEOUT_SEC)
+    EVICTION_TOMBSTONE_SEC = 60
+
+    EVICTING_TOPICS = {
+        EVENT_TOPICS.COURSE_UNPUBLISHED.value,
+        EVENT_TOPICS.COURSE_DELETED.value,
+        EVENT_TOPICS.COURSE_ARCHIVED.value,
+    }
+
+    def __init__(
+        self,
+        redis: IRedisService,
+        price_snapshot: TTLCache[str, dict[str, Any]],
+        logging_service: ILoggingService,
+        metrics_service: IMetricsService,
+    ):
+        self._cache = redis
+        self._price_snapshot = price_snapshot
+        self._logger = logging_service.get_logger("SyncCoursePriceUseCase")
+        self._metrics = metrics_service
+
+    async def execute(self, topic: str, dto: CourseChangedEventDto) -> None:
+        payload = dto.payload
+        course_id = payload.course_id
+        cache_key = f"course_price:{course_id}"
+
+        status = (payload.status or "").lower()
+        is_published = status == "published" or (
+            not status and topic == EVENT_TOPICS.COURSE_PUBLISHED.value)
+
+        if (
+            topic in self.EVICTING_TOPICS
+            or not is_published
+            or payload.price is None
+            or payload.instructor_id is None
+        ):
+            # Either the course can no longer be ordered or the event does not carry
+            # enough to rebuild the entry; the next PlaceOrder refetches from gRPC.
+            await self._cache.client.set(
+                cache_key,
+                json.dumps({"status": status or "unknown"}),
+                ex=self.EVICTION_TOMBSTONE_SEC,
+            )
+            self._price_snapshot.delete(course_id)
+            self._logger.info(
+                f"Evicted cached price for course {course_id} on {topic} (status: {status or 'unknown'})")
+            return
+
+        price_obj = {
+            "discounted_price": float(
+                payload.discount_price if payload.discount_price is not None else payload.price),
+            "price": float(payload.price),
+            "instructor_id": payload.instructor_id,
+        }
+        await self._cache.client.set(
+            cache_key,
+            json.dumps(price_obj),
+            ex=PlaceOrderUseCase.CACHE_EXPIRATION_SEC,
+        )
+        self._price_snapshot.set(course_id, price_obj)
+        self._logger.info(f"Refreshed cached price for course {course_id} on {topic}")
@@ -0,0 +1,48 @@
+from typing import TypedDict
+from src.application.dtos.batch_get_orders_dto import BatchGetOrdersDto
+from src.infrastructure.database.database import get_db
+from src.application.interfaces.logging_interface import ILoggingService
+from src.application.interfaces.metrics_interface import IMetricsService
+from src.domain.repositories.order_repository import IOrderRepository
+from src.application.dtos.order_dto import OrderDto
+from tenacity import retry, stop_after_attempt, wait_exponential
+
+from src.shared.utils.deadline import stop_on_deadline
+
+
+class BatchOrdersUseCaseResponse(TypedDict):
+    orders: list[OrderDto]
+    missing_ids: list[str]
+
+
+class BatchGetOrdersUseCase:
+    def __init__(
+        self,
+        order_repository: IOrderRepository,
+        logging_service: ILoggingService,
+        metrics_service: IMetricsService,
+    ):
+        self._order_repository = order_repository
+        self._logger = logging_service.get_logger("BatchGetOrdersUseCase")
+        self._metrics = metrics_service
+
+    @retry(
+        stop=(stop_after_attempt(3) | stop_on_deadline),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+    )
+    async def execute(self, dto: BatchGetOrdersDto) -> BatchOrdersUseCaseResponse:
+        order_ids = list(dict.fromkeys(dto.order_ids))
+        self._logger.info(
+            f"Executing BatchGetOrdersUseCase for {len(order_ids)} orders")
+
+        async with get_db() as session:
+            found = await self._order_repository.find_by_ids(order_ids, session)
+
+        missing_ids = [order_id for order_id in order_ids if order_id not in found]
+        self._logger.debug(
+            f"Fetched {len(found)} orders, {len(missing_ids)} not found")
+
+        return {
+            "orders": [OrderDto.from_domain(found[order_id]) for order_id in order_ids if order_id in found],
+            "missing_ids": missing_ids,
+        }
@@ -3,6 +3,7 @@ from src.application.interfaces.logging_interface import ILoggingService
 from src.application.interfaces.metrics_interface import IMetricsService
 from src.application.interfaces.redis_interface import IRedisService
 from src.domain.repositories.order_repository import IOrderRepository
+from src.domain.repositories.outbox_repository import IOutboxRepository
 from src.domain.events.order_expired_event import OrderExpiredEvent
 from src.shared.events.topics import EVENT_TOPICS
 from src.infrastructure.database.database import get_db
@@ -12,11 +13,13 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 class ExpireOrderUseCase:
     def __init__(self,  order_repository: IOrderRepository,
                  kafka_producer: IKafkaProducer,
+                 outbox_repository: IOutboxRepository,
                  redis: IRedisService,
                  logging_service: ILoggingService,
                  metrics_service: IMetricsService):
         self._order_repository = order_repository
         self._kafka_producer = kafka_producer
+        self._outbox = outbox_repository
         self._cache = redis
         self._logger = logging_service.get_logger("ExpireOrderUseCase")
         self._metrics = metrics_service
@@ -40,19 +43,18 @@ class ExpireOrderUseCase:
 
             order.mark_expired()
             await self._order_repository.save(order, session)
+            await self._outbox.add(
+                EVENT_TOPICS.ORDER_COURSE_EXPIRED.value,
+                OrderExpiredEvent(
+                    orderId=order.id,
+                    userId=order.userId if hasattr(order, 'userId') else order.user_id,
+                    items=[{"courseId": i.course_id, "price": i.price} for i in order.items],
+                    amount=order.amount.amount,
+                    currency=order.amount.currency,
+                ).to_dict(),
+                session,
+            )
             await session.commit()
 
-        await self._kafka_producer.publish_event(
-            EVENT_TOPICS.ORDER_COURSE_EXPIRED.value,
-            event=OrderExpiredEvent(
-                orderId=order.id,
-                userId=order.userId if hasattr(order, 'userId') else order.user_id,
-                items=[{"courseId": i.course_id, "price": i.price} for i in order.items],
-                amount=order.amount.amount,
-                currency=order.amount.currency,
-            ).to_dict(),
-            schema=None,
-        )
-
-        self._logger.info(f"Order {order_id} successfully marked as EXPIRED and event published")
+        self._logger.info(f"Order {order_id} successfully marked as EXPIRED and event staged for publishing")
         return
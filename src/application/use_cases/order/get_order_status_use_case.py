@@ -0,0 +1,42 @@
+from src.infrastructure.database.database import get_db
+from src.application.dtos.get_order_dto import GetOrderDto
+from src.domain.entities.order import OrderStatus
+from src.domain.exceptions.exceptions import OrderNotFoundException
+from src.application.interfaces.logging_interface import ILoggingService
+from src.application.interfaces.metrics_interface import IMetricsService
+from src.domain.repositories.order_repository import IOrderRepository
+from tenacity import retry, stop_after_attempt, wait_exponential
+
+from src.shared.utils.deadline import stop_on_deadline
+
+
+class GetOrderStatusUseCase:
+    """
+    Status-only counterpart of GetOrderUseCase for clients that poll an order's
+    status; it never loads or maps the full order.
+    """
+
+    def __init__(
+        self,
+        order_repository: IOrderRepository,
+        logging_service: ILoggingService,
+        metrics_service: IMetricsService,
+    ):
+        self._order_repository = order_repository
+        self._logger = logging_service.get_logger("GetOrderStatusUseCase")
+        self._metrics = metrics_service
+
+    @retry(
+        stop=(stop_after_attempt(3) | stop_on_deadline),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+    )
+    async def execute(self, dto: GetOrderDto) -> OrderStatus:
+        self._logger.debug(
+            f"Executing GetOrderStatusUseCase order id {dto.order_id}")
+
+        async with get_db() as session:
+            status = await self._order_repository.find_status(dto.order_id, session)
+        if status is None:
+            raise OrderNotFoundException(f"Order not found with Id {dto.order_id}")
+
+        return status
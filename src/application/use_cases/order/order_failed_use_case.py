@@ -5,11 +5,12 @@ from src.application.interfaces.logging_interface import ILoggingService
 from src.application.interfaces.metrics_interface import IMetricsService
 from src.application.interfaces.redis_interface import IRedisService
 from src.domain.repositories.order_repository import IOrderRepository
+from src.domain.repositories.outbox_repository import IOutboxRepository
 from src.domain.events.order_payment_failure_event import OrderPaymentFailureEventDto
+from src.domain.entities.order import OrderStatus
 from src.domain.entities.payment_details import PaymentDetails, PaymentStatus
 from src.shared.events.topics import EVENT_TOPICS
 from src.infrastructure.database.database import get_db
-from src.domain.exceptions.exceptions import OrderNotFoundException
 from tenacity import retry, stop_after_attempt, wait_exponential
 from uuid import uuid4
 
@@ -18,12 +19,14 @@ class OrderFailedUseCase:
     def __init__(self,
                  order_repository: IOrderRepository,
                  kafka_producer: IKafkaProducer[OrderFailedEventType],
+                 outbox_repository: IOutboxRepository,
                  redis: IRedisService,
                  logging_service: ILoggingService,
                  metrics_service: IMetricsService):
 
         self._order_repository = order_repository
         self._kafka_producer = kafka_producer
+        self._outbox = outbox_repository
         self._cache = redis
         self._logger = logging_service.get_logger("OrderFailedUseCase")
         self._metrics = metrics_service
@@ -35,13 +38,11 @@ class OrderFailedUseCase:
         self._logger.info(f"Processing failed payment for order {payload.order_id}")
 
         async with get_db() as session:
-            order = await self._order_repository.find_by_id(payload.order_id, session)
-            if not order:
-                raise OrderNotFoundException(
-                    f"Order not found: {payload.order_id}")
-
-            if not order.payment_details:
-                payment_details = PaymentDetails(
+            order = await self._order_repository.transition_status(
+                payload.order_id,
+                OrderStatus.FAILED,
+                session,
+                payment_details=PaymentDetails(
                     id=str(uuid4()),
                     payment_id=payload.payment_id,
                     provider=payload.provider,
@@ -49,24 +50,21 @@ class OrderFailedUseCase:
                     updated_at=datetime.fromtimestamp(
                         int(dto.timestamp) / 1000, tz=timezone.utc),
                     payment_status="failed",
-                )
-                order.set_payment_details(payment_details)
-
-            order.mark_failed()
-            await self._order_repository.save(order, session)
+                ),
+            )
 
-        await self._kafka_producer.publish_event(
-            EVENT_TOPICS.ORDER_COURSE_FAILED.value,
-            event=OrderFailedEvent(
-                orderId=order.id,
-                userId=order.user_id,
-                items=[{"courseId": i.course_id, "price": i.price}
-                       for i in order.items],
-                amount=order.amount.amount,
-                currency=order.amount.currency,
-            ).to_dict(),
-            schema=None,
-        )
+            await self._outbox.add(
+                EVENT_TOPICS.ORDER_COURSE_FAILED.value,
+                OrderFailedEvent(
+                    orderId=order.id,
+                    userId=order.user_id,
+                    items=[{"courseId": i.course_id, "price": i.price}
+                           for i in order.items],
+                    amount=order.amount.amount,
+                    currency=order.amount.currency,
+                ).to_dict(),
+                session,
+            )
 
         self._logger.warning(f"Order {payload.order_id} marked as FAILED")
         return
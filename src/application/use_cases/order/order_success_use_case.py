@@ -4,24 +4,31 @@ from src.application.interfaces.logging_interface import ILoggingService
 from src.application.interfaces.metrics_interface import IMetricsService
 from src.application.interfaces.redis_interface import IRedisService
 from src.domain.repositories.order_repository import IOrderRepository
+from src.domain.repositories.outbox_repository import IOutboxRepository
 from src.domain.events.order_payment_success_event import OrderPaymentSuccessEventDto
+from src.domain.entities.order import OrderStatus
 from src.domain.entities.payment_details import PaymentDetails, PaymentStatus
 from src.shared.events.topics import EVENT_TOPICS
 from src.infrastructure.database.database import get_db
-from src.domain.exceptions.exceptions import OrderNotFoundException
 from tenacity import retry, stop_after_attempt, wait_exponential
 from datetime import datetime, timezone
 from uuid import uuid4
 
 
 class OrderSuccessUseCase:
+    # Outlives the course service's enrollment lag plus PlaceOrderUseCase's
+    # ENROLLMENT_CACHE_EXPIRATION_SEC, so no stale enrollment copy outlasts it
+    PURCHASE_MARKER_EXPIRATION_SEC = 3600
+
     def __init__(self, order_repository: IOrderRepository,
                  kafka_producer: IKafkaProducer[OrderSucceededEventType],
+                 outbox_repository: IOutboxRepository,
                  redis: IRedisService,
                  logging_service: ILoggingService,
                  metrics_service: IMetricsService):
         self._order_repository = order_repository
         self._kafka_producer = kafka_producer
+        self._outbox = outbox_repository
         self._cache = redis
         self._logger = logging_service.get_logger("OrderSuccessUseCase")
         self._metrics = metrics_service
@@ -31,13 +38,11 @@ class OrderSuccessUseCase:
         payload = dto.payload
 
         async with get_db() as session:
-            order = await self._order_repository.find_by_id(payload.order_id, session)
-            if not order:
-                raise OrderNotFoundException(
-                    f"Order not found: {payload.order_id}")
-
-            if not order.payment_details:
-                payment_details = PaymentDetails(
+            order = await self._order_repository.transition_status(
+                payload.order_id,
+                OrderStatus.SUCCEEDED,
+                session,
+                payment_details=PaymentDetails(
                     id=str(uuid4()),
                     payment_id=payload.payment_id,
                     provider=payload.provider,
@@ -45,29 +50,38 @@ class OrderSuccessUseCase:
                     updated_at=datetime.fromtimestamp(
                         int(dto.timestamp) / 1000, tz=timezone.utc),
                     payment_status="success",
-                )
-                order.set_payment_details(payment_details)
-            else:
-                order.payment_details.mark_success()
-
-            order.mark_completed()
+                ),
+                overwrite_payment_status=True,
+            )
 
-            await self._order_repository.save(order, session)
+            # Staged in the same transaction; OutboxRelay publishes it to other services
+            await self._outbox.add(
+                EVENT_TOPICS.ORDER_COURSE_SUCCEEDED.value,
+                OrderSucceededEvent(
+                    orderId=order.id,
+                    userId=order.user_id,
+                    items=[{"courseId": i.course_id, "price": i.price}
+                           for i in order.items],
+                    amount=order.amount.amount,
+                    currency=order.amount.currency,
+                ).to_dict(),
+                session,
+            )
 
-        self._logger.info(f"Publishing order success Event ")
-        # Publish to other services
-        await self._kafka_producer.publish_event(
-            EVENT_TOPICS.ORDER_COURSE_SUCCEEDED.value,
-            event=OrderSucceededEvent(
-                orderId=order.id,
-                userId=order.user_id,
-                items=[{"courseId": i.course_id, "price": i.price}
-                       for i in order.items],
-                amount=order.amount.amount,
-                currency=order.amount.currency,
-            ).to_dict(),
-            schema=None,
-        )
+        # The user's enrollment set is about to change; drop the cached copy
+        # PlaceOrderUseCase uses for its already-enrolled check. The course service
+        # enrolls the user only once it consumes the event, so a lookup before then
+        # re-caches the old set; the purchase markers cover that window.
+        try:
+            await self._cache.set_many(
+                {f"user_purchased_course:{order.user_id}:{item.course_id}": "1"
+                 for item in order.items},
+                expire=self.PURCHASE_MARKER_EXPIRATION_SEC,
+                delete=[f"user_enrollments:{order.user_id}"],
+            )
+        except Exception as e:
+            self._logger.warning(
+                f"Failed to evict enrollment cache for user {order.user_id}: {e}")
 
         self._logger.info(f"Order {payload.order_id} marked as COMPLETED")
         return
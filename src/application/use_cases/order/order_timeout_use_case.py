@@ -4,11 +4,12 @@ from src.application.interfaces.logging_interface import ILoggingService
 from src.application.interfaces.metrics_interface import IMetricsService
 from src.application.interfaces.redis_interface import IRedisService
 from src.domain.repositories.order_repository import IOrderRepository
+from src.domain.repositories.outbox_repository import IOutboxRepository
 from src.domain.events.order_payment_timeout_event import OrderPaymentTimeoutEventDto
+from src.domain.entities.order import OrderStatus
 from src.domain.entities.payment_details import PaymentDetails, PaymentStatus
 from src.shared.events.topics import EVENT_TOPICS
 from src.infrastructure.database.database import get_db
-from src.domain.exceptions.exceptions import OrderNotFoundException
 from tenacity import retry, stop_after_attempt, wait_exponential
 from datetime import datetime, timezone
 from uuid import uuid4 as uuidV4
@@ -17,11 +18,13 @@ from uuid import uuid4 as uuidV4
 class HandleOrderTimeoutUseCase:
     def __init__(self,  order_repository: IOrderRepository,
                  kafka_producer: IKafkaProducer[OrderFailedEventType],
+                 outbox_repository: IOutboxRepository,
                  redis: IRedisService,
                  logging_service: ILoggingService,
                  metrics_service: IMetricsService):
         self._order_repository = order_repository
         self._kafka_producer = kafka_producer
+        self._outbox = outbox_repository
         self._cache = redis
         self._logger = logging_service.get_logger(
             "HandleOrderTimeoutUseCase")
@@ -34,13 +37,11 @@ class HandleOrderTimeoutUseCase:
         self._logger.info(f"Processing HandleOrderTimeoutUseCase for order {payload.order_id}")
 
         async with get_db() as session:
-            order = await self._order_repository.find_by_id(payload.order_id, session)
-            if not order:
-                raise OrderNotFoundException(
-                    f"Order not found: {payload.order_id}")
-
-            if not order.payment_details:
-                payment_details = PaymentDetails(
+            order = await self._order_repository.transition_status(
+                payload.order_id,
+                OrderStatus.EXPIRED,
+                session,
+                payment_details=PaymentDetails(
                     id=str(uuidV4()),
                     payment_id=payload.payment_id,
                     provider=payload.provider,
@@ -48,26 +49,22 @@ class HandleOrderTimeoutUseCase:
                     updated_at=datetime.fromtimestamp(
                         int(dto.timestamp) / 1000, tz=timezone.utc),
                     payment_status="expired",
-                )
-                order.set_payment_details(payment_details)
-            else:
-                order.payment_details.mark_expired()
-
-            order.mark_expired()
-            await self._order_repository.save(order, session)
+                ),
+                overwrite_payment_status=True,
+            )
 
-        await self._kafka_producer.publish_event(
-            EVENT_TOPICS.ORDER_COURSE_FAILED.value,
-            event=OrderFailedEvent(
-                orderId=order.id,
-                userId=order.user_id,
-                items=[{"courseId": i.course_id, "price": i.price}
-                       for i in order.items],
-                amount=order.amount.amount,
-                currency=order.amount.currency,
-            ).to_dict(),
-            schema=None,
-        )
+            await self._outbox.add(
+                EVENT_TOPICS.ORDER_COURSE_FAILED.value,
+                OrderFailedEvent(
+                    orderId=order.id,
+                    userId=order.user_id,
+                    items=[{"courseId": i.course_id, "price": i.price}
+                           for i in order.items],
+                    amount=order.amount.amount,
+                    currency=order.amount.currency,
+                ).to_dict(),
+                session,
+            )
 
         self._logger.warning(f"Order {payload.order_id} marked as EXPIRED")
         return
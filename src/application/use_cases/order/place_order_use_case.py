@@ -1,110 +1,213 @@
 import asyncio
 import json
-from typing import Any
-from src.domain.events.order_created_event import OrderCreatedEvent, OrderCreatedEventType
-from src.shared.events.topics import EVENT_TOPICS
-from src.infrastructure.database.database import get_db
-from src.domain.entities.order_items import OrderItem
-from src.domain.exceptions.exceptions import CourseAlreadyEnrolledException, UserNotFoundException, CourseNotPublishedException
-from src.application.interfaces.logging_interface import ILoggingService
-from src.application.interfaces.metrics_interface import IMetricsService
-from src.domain.repositories.order_repository import IOrderRepository
-from src.application.dtos.order_create_dto import OrderCreateDto
-from src.application.dtos.order_dto import OrderDto
-from src.application.interfaces.grpc_client_interface import (
-    CourseInfo,
-    ICourseServiceClient,
-    IUserServiceClient,
-)
+from typing import Any, Optional
+from uuid import uuid4
 from src.application.dtos.order_create_dto import OrderCreateDto
 from src.application.dtos.order_dto import OrderDto
+from src.application.interfaces.grpc_client_interface import ICourseServiceClient, IUserServiceClient
 from src.application.interfaces.kafka_producer_interface import IKafkaProducer
 from src.application.interfaces.logging_interface import ILoggingService
 from src.application.interfaces.metrics_interface import IMetricsService
 from src.application.interfaces.redis_interface import IRedisService
-from src.domain.repositories.order_repository import IOrderRepository
 from src.domain.entities.order import Order, OrderStatus
 from src.domain.entities.order_items import OrderItem
-from src.domain.exceptions.exceptions import UserNotFoundException
+from src.domain.events.order_created_event import OrderCreatedEvent, OrderCreatedEventType
+from src.domain.exceptions.exceptions import (
+    CourseAlreadyEnrolledException,
+    CourseNotPublishedException,
+    IdempotencyKeyInProgressException,
+    UserNotFoundException,
+)
 from src.domain.repositories.order_repository import IOrderRepository
+from src.domain.repositories.outbox_repository import IOutboxRepository
 from src.domain.value_objects.money import Money
-from src.application.dtos.order_create_dto import OrderCreateDto
-from src.application.dtos.order_dto import OrderDto
-from src.shared.events.topics import EVENT_TOPICS
 from src.infrastructure.database.database import get_db
-from src.domain.exceptions.exceptions import UserNotFoundException
-from uuid import uuid4
+from src.shared.events.topics import EVENT_TOPICS
+from src.shared.utils.data_loader import DataLoader
+from src.shared.utils.stage_graph import StageGraph
+from src.shared.utils.ttl_cache import TTLCache
 
 
 class PlaceOrderUseCase:
-    CACHE_EXPIRATION_SEC = 3600 # 1hr
+    CACHE_EXPIRATION_SEC = 86400 # 24hr, kept fresh by course.* events (SyncCoursePriceUseCase)
+    ENROLLMENT_CACHE_EXPIRATION_SEC = 300 # 5min, evicted on order success
+    PRICE_SNAPSHOT_REFRESH_AHEAD_SEC = 15
+    PRICE_FETCH_LEASE_POLL_SEC = 0.025
+    IDEMPOTENCY_LEASE_SEC = 30
+    IDEMPOTENCY_RETRY_MIN_SEC = 0.1
+    IDEMPOTENCY_RETRY_MAX_SEC = 2.0
     SALES_TAX_RATE = 0.0  # TODO: Set to actual rate, e.g. 0.07 for 7% sales tax
 
     def __init__(
         self,
         order_repository: IOrderRepository,
         kafka_producer: IKafkaProducer[OrderCreatedEventType],
+        outbox_repository: IOutboxRepository,
         course_service_client: ICourseServiceClient,
         user_service_client: IUserServiceClient,
         redis: IRedisService,
         logging_service: ILoggingService,
         metrics_service: IMetricsService,
+        price_snapshot: TTLCache[str, dict[str, Any]],
+        price_fetch_lease_ms: int | None = None,
     ):
         self._order_repository = order_repository
         self._kafka_producer = kafka_producer
+        self._outbox = outbox_repository
         self.course_service_client = course_service_client
         self.user_service_client = user_service_client
         self._cache = redis
         self._logger = logging_service.get_logger("PlaceOrderUseCase")
         self._metrics = metrics_service
+        self._price_snapshot = price_snapshot
+        # Per-process singleflight for course price cache misses: concurrent misses on
+        # the same course id share one in-flight fetch (zero window, no extra latency).
+        self._price_fetch_flight: DataLoader[str, dict[str, Any]] = DataLoader(
+            self._fetch_course_prices, batch_window_sec=0)
+        self._price_fetch_lease_ms = price_fetch_lease_ms
+        self._in_flight_orders: dict[str, asyncio.Task[OrderDto]] = {}
 
     # @retry( stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
     async def execute(self, order_dto: OrderCreateDto, idempotency_key: str | None) -> OrderDto:
         self._logger.info(
             f"Executing PlaceOrderUseCase for user {order_dto.user_id}")
 
-        if idempotency_key:
-            async with get_db() as session:
-                order = await self._order_repository.find_by_idempotency_key(
-                    idempotency_key=idempotency_key, session=session
+        if not idempotency_key:
+            return await self._place_order(order_dto, None)
+
+        # Duplicates within this process share the first request's task; the task is
+        # shielded so a cancelled caller does not abort the order for the others.
+        task = self._in_flight_orders.get(idempotency_key)
+        if task is None:
+            task = asyncio.create_task(
+                self._place_order_once(order_dto, idempotency_key))
+            self._in_flight_orders[idempotency_key] = task
+            task.add_done_callback(
+                lambda _: self._in_flight_orders.pop(idempotency_key, None))
+        else:
+            self._logger.info(
+                f"Order with idempotency_key {idempotency_key} already in progress, awaiting its result")
+        return await asyncio.shield(task)
+
+    async def _place_order_once(self, order_dto: OrderCreateDto, idempotency_key: str) -> OrderDto:
+        """
+        Reserve the idempotency key across processes with a non-blocking Redis lease
+        before doing any work. A duplicate that finds the key reserved blocks until the
+        owner announces on order_idempotency_released:{key} that it let go, then tries
+        again: it finds the owner's order, or takes over the reservation if the owner
+        created none. An announcement it misses (owner crashed, lease expired) only
+        delays the retry, which backs off from IDEMPOTENCY_RETRY_MIN_SEC to
+        IDEMPOTENCY_RETRY_MAX_SEC for at most one lease period.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.IDEMPOTENCY_LEASE_SEC
+        channel = f"order_idempotency_released:{idempotency_key}"
+        retry_sec = self.IDEMPOTENCY_RETRY_MIN_SEC
+        released, subscribed = None, False
+        try:
+            while True:
+                lease = self._cache.client.lock(
+                    f"order_idempotency_lease:{idempotency_key}",
+                    timeout=self.IDEMPOTENCY_LEASE_SEC,
+                    blocking=False,
                 )
-                if order:
-                    self._logger.info(
-                        f"Order exists with idempotency_key {idempotency_key}, skipping creation"
-                    )
-                    return OrderDto.from_domain(order)
+                try:
+                    reserved = await lease.acquire()
+                except Exception as e:
+                    # Without Redis the unique index on idempotency_key still guards the insert
+                    self._logger.warning(
+                        f"Failed to reserve idempotency_key {idempotency_key}: {e}")
+                    lease, reserved = None, True
+
+                if reserved:
+                    try:
+                        # Checked after reserving, so an owner that finished before the
+                        # reservation is never repeated.
+                        order = await self._find_order_by_idempotency_key(idempotency_key)
+                        if order:
+                            self._logger.info(
+                                f"Order exists with idempotency_key {idempotency_key}, skipping creation"
+                            )
+                            return OrderDto.from_domain(order)
+                        return await self._place_order(order_dto, idempotency_key)
+                    finally:
+                        if lease is not None:
+                            await self._release_idempotency_lease(lease, channel)
+
+                if loop.time() >= deadline:
+                    raise IdempotencyKeyInProgressException(
+                        f"Order with idempotency key {idempotency_key} is still being processed")
+                if not subscribed:
+                    released, subscribed = await self._subscribe(channel), True
+                    if released is not None:
+                        # The owner may have let go before we subscribed
+                        continue
+                await self._wait_for_release(released, min(retry_sec, deadline - loop.time()))
+                retry_sec = min(retry_sec * 2, self.IDEMPOTENCY_RETRY_MAX_SEC)
+        finally:
+            if released is not None:
+                try:
+                    await released.aclose()
+                except Exception:
+                    pass
+
+    async def _release_idempotency_lease(self, lease: Any, channel: str) -> None:
+        try:
+            await lease.release()
+        except Exception:
+            # Lease already expired; nothing to release
+            pass
+        try:
+            await self._cache.client.publish(channel, "released")
+        except Exception as e:
+            # Waiters fall back to their retry backoff
+            self._logger.warning(f"Failed to announce release on {channel}: {e}")
+
+    async def _subscribe(self, channel: str) -> Any:
+        try:
+            pubsub = self._cache.client.pubsub(ignore_subscribe_messages=True)
+            await pubsub.subscribe(channel)
+            return pubsub
+        except Exception as e:
+            self._logger.warning(f"Failed to subscribe to {channel}: {e}")
+            return None
+
+    @staticmethod
+    async def _wait_for_release(released: Any, timeout: float) -> None:
+        if released is None:
+            await asyncio.sleep(timeout)
+            return
+        try:
+            await released.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        except Exception:
+            await asyncio.sleep(timeout)
 
-        user = await self.user_service_client.get_user(order_dto.user_id)
-        if not user:
-            raise UserNotFoundException(
-                f"User not found with Id {order_dto.user_id}")
+    async def _find_order_by_idempotency_key(self, idempotency_key: str) -> Order | None:
+        async with get_db() as session:
+            return await self._order_repository.find_by_idempotency_key(
+                idempotency_key=idempotency_key, session=session
+            )
 
+    async def _place_order(self, order_dto: OrderCreateDto, idempotency_key: str | None) -> OrderDto:
         course_ids = order_dto.course_ids
-
-        # await self.ensure_user_not_already_enrolled(order_dto.user_id, course_ids)
-
-        # prices = await self.validate_and_fetch_course_prices(course_ids)
-
-        ensure_task = self.ensure_user_not_already_enrolled(
-            order_dto.user_id, course_ids)
-        fetch_prices_task = self.validate_and_fetch_course_prices(course_ids)
-        results = await asyncio.gather(ensure_task, fetch_prices_task, return_exceptions=True)
-        ensure_result, prices = results
-        if isinstance(ensure_result, Exception):
-            raise ensure_result
-        if isinstance(prices, Exception):
-            raise prices
+        user_id = order_dto.user_id
+
+        # User, enrollment and price checks are independent and run concurrently; the
+        # first one to fail cancels the others. Ownership needs the fetched prices.
+        validation = StageGraph(on_stage_complete=self._record_validation_stage)
+        validation.add("user", lambda: self.ensure_user_exists(user_id))
+        validation.add(
+            "enrollment", lambda: self.ensure_user_not_already_enrolled(user_id, course_ids))
+        validation.add("prices", lambda: self.validate_and_fetch_course_prices(course_ids))
+        validation.add(
+            "ownership",
+            lambda prices: self.ensure_user_not_course_owner(user_id, prices),
+            depends_on=["prices"],
+        )
+        prices = (await validation.run())["prices"]
 
         self._logger.info(f"Fetched Prices: {prices}")
 
-        for cid, price_info in prices.items():
-            if price_info.get("instructor_id") == order_dto.user_id:
-                self._logger.error(f"User {order_dto.user_id} attempted to buy their own course {cid}")
-                raise ValueError({
-                    "ui_message": "You cannot purchase your own course.",
-                    "details": f"Course {cid} is authored by you."
-                })
-
         def _to_scu(value: float) -> int:
             """Convert to smallest currency unit (e.g. cents)"""
             return int(round(value * 100))
@@ -192,38 +295,100 @@ class PlaceOrderUseCase:
         order.mark_pending_payment()
 
         async with get_db() as session:
-            await self._order_repository.save(order, session)
+            await self._order_repository.insert(order, session)
+            # Staged in the same transaction; OutboxRelay publishes it off the request path
+            await self._outbox.add(
+                EVENT_TOPICS.ORDER_COURSE_CREATED.value,
+                OrderCreatedEvent(
+                    orderId = order.id,
+                    userId = order.user_id,
+                    items = [{"courseId": item.course_id, "price": item.price} for item in order.items],
+                    subtotal=subtotal,
+                    discount=total_discount,
+                    coupon_discount=coupon_discount,
+                    tax=sales_tax,
+                    total=total,
+                    currency=order.amount.currency,
+                ).to_dict(),
+                session,
+            )
 
         self._logger.debug("Order creation request has been successful")
 
-        await self._kafka_producer.publish_event(
-            EVENT_TOPICS.ORDER_COURSE_CREATED.value,
-            event=OrderCreatedEvent(
-                orderId = order.id,
-                userId = order.user_id,
-                items = [{"courseId": item.course_id, "price": item.price} for item in order.items],
-                subtotal=subtotal,
-                discount=total_discount,
-                coupon_discount=coupon_discount,
-                tax=sales_tax,
-                total=total,
-                currency=order.amount.currency,
-            ).to_dict(),
-            schema=None,
-        )
-
         return OrderDto.from_domain(order)
 
+    async def ensure_user_exists(self, user_id: str) -> None:
+        user = await self.user_service_client.get_user(user_id)
+        if not user:
+            raise UserNotFoundException(
+                f"User not found with Id {user_id}")
+
+    async def ensure_user_not_course_owner(self, user_id: str, prices: dict[str, dict[str, Any]]) -> None:
+        for cid, price_info in prices.items():
+            if price_info.get("instructor_id") == user_id:
+                self._logger.error(f"User {user_id} attempted to buy their own course {cid}")
+                raise ValueError({
+                    "ui_message": "You cannot purchase your own course.",
+                    "details": f"Course {cid} is authored by you."
+                })
+
+    def _record_validation_stage(self, stage: str, latency: float, status: str) -> None:
+        self._metrics.stage_latency(
+            pipeline="place_order_validation", stage=stage, status=status, latency=latency)
+
     async def validate_and_fetch_course_prices(self, course_ids: list[str]) -> dict[str, dict[str, Any]]:
         """
-        Retrieve and validate course price info using cache (Redis) as primary source,
-        falling back to gRPC calls for uncached courses, and keeping the cache updated.
+        Retrieve and validate course price info using the in-process price snapshot as
+        primary source, then cache (Redis), falling back to gRPC calls for uncached
+        courses, and keeping both cache tiers updated.
         Returns: { course_id: {"price": float, "discounted_price": float, "instructor_id": str} }
         Ensures all courses are published, raising a descriptive error if any are not.
         """
         if not course_ids:
             return {}
 
+        prices: dict[str, dict[str, Any]] = {}
+        snapshot_misses: list[str] = []
+        for course_id in course_ids:
+            snapshot = self._price_snapshot.get(course_id)
+            if snapshot is not None:
+                prices[course_id] = snapshot
+                self._metrics.cache_hits(type="course_price_local")
+            else:
+                snapshot_misses.append(course_id)
+                self._metrics.cache_misses(type="course_price_local")
+
+        if snapshot_misses:
+            prices.update(await self._load_course_prices(snapshot_misses))
+
+        return prices
+
+    async def refresh_price_snapshot(self, within_sec: float | None = None) -> int:
+        """
+        Refresh hook for the in-process price snapshot. Bulk-reloads entries that expire
+        within `within_sec` (defaults to PRICE_SNAPSHOT_REFRESH_AHEAD_SEC) from Redis/gRPC
+        so hot courses never fall out of the snapshot. Only entries read since their last
+        load count as hot; the rest are left to expire, so courses nobody orders are not
+        reloaded forever. Courses that are no longer published are evicted instead of
+        raising.
+        Returns: number of entries that were due for refresh.
+        """
+        expiring = self._price_snapshot.expiring_keys(
+            within_sec if within_sec is not None else self.PRICE_SNAPSHOT_REFRESH_AHEAD_SEC,
+            accessed_only=True)
+        if not expiring:
+            return 0
+        await self._load_course_prices(expiring, raise_on_unpublished=False)
+        self._logger.debug(f"Refreshed {len(expiring)} course price snapshot entries")
+        return len(expiring)
+
+    async def _load_course_prices(
+        self, course_ids: list[str], raise_on_unpublished: bool = True
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Second tier of the pricing path: Redis first, gRPC for the rest. Every price
+        loaded here is also written into the in-process snapshot.
+        """
         cache_keys = [f"course_price:{course_id}" for course_id in course_ids]
         prices: dict[str, dict[str, Any]] = {}
         uncached_course_ids: list[str] = []
@@ -236,14 +401,13 @@ class PlaceOrderUseCase:
         for course_id, cached_value in zip(course_ids, cached_prices):
             if cached_value is not None:
                 try:
-                    if isinstance(cached_value, bytes):
-                        cached_value = cached_value.decode('utf-8')
-                    price_obj = json.loads(cached_value)
-                    prices[course_id] = {
-                        "discounted_price": float(price_obj.get("discounted_price", price_obj.get("price", 0))),
-                        "price": float(price_obj.get("price", 0)),
-                        "instructor_id": price_obj.get("instructor_id", "")
-                    }
+                    price = self._parse_cached_price(cached_value)
+                    if price is None:
+                        # Eviction tombstone: ask the course service
+                        uncached_course_ids.append(course_id)
+                        self._metrics.cache_misses(type="course_price")
+                        continue
+                    prices[course_id] = price
                     self._metrics.cache_hits(type="course_price")
                 except (ValueError, TypeError, KeyError) as e:
                     self._logger.warning(
@@ -255,63 +419,19 @@ class PlaceOrderUseCase:
                 self._metrics.cache_misses(type="course_price")
 
         if uncached_course_ids:
-            batch_supported = hasattr(self.course_service_client, "get_courses_by_ids")
-            fetched_dict = {}
+            fetched = await self._price_fetch_flight.load_many(uncached_course_ids)
             not_published_courses = {}
-
-            if batch_supported:
-                try:
-                    grpc_results = await self.course_service_client.get_courses_by_ids(uncached_course_ids)
-                    for c in grpc_results:
-                        status = c.get("status", "unknown")
-                        course_id = c["course_id"]
-                        if status != "published":
-                            not_published_courses[course_id] = status
-                            self._logger.warning(
-                                f"Course {course_id} is not published (status: {status})"
-                            )
-                            continue
-                        fetched_dict[course_id] = {
-                            "discounted_price": float(
-                                c.get("discount_price", c.get("price", 0))
-                            ),
-                            "price": float(c.get("price", 0)),
-                            "instructor_id": c.get("instructor_id", ""),
-                        }
-                except Exception as e:
-                    self._logger.error(
-                        f"Batch fetch failed for courses {uncached_course_ids}, falling back to per-course requests: {e}"
-                    )
-                    fetched_dict = {}
-            else:
-                fetched_dict = {}
+            for course_id, result in zip(uncached_course_ids, fetched):
+                status = result["status"] if result else "unknown"
+                if status != "published":
+                    not_published_courses[course_id] = status
+                    continue
+                prices[course_id] = result["price"]
+
+            if not_published_courses and not raise_on_unpublished:
+                self._price_snapshot.delete_many(not_published_courses.keys())
                 not_published_courses = {}
 
-            missing_courses = set(uncached_course_ids) - set(fetched_dict.keys()) - set(not_published_courses.keys())
-            if missing_courses:
-                tasks = [
-                    self.course_service_client.get_course(cid) for cid in missing_courses
-                ]
-                task_results = await asyncio.gather(*tasks, return_exceptions=True)
-                for course_id, result in zip(missing_courses, task_results):
-                    if isinstance(result, (Exception, BaseException)):
-                        self._logger.error(
-                            f"Failed to fetch course {course_id}: {str(result)}"
-                        )
-                        raise result
-                    status = result.get("status", "unknown") if hasattr(result, "get") else getattr(result, "status", "unknown")
-                    if status != "published":
-                        not_published_courses[course_id] = status
-                        self._logger.warning(
-                            f"Course {course_id} is not published (status: {status})"
-                        )
-                        continue
-                    fetched_dict[course_id] = {
-                        "discounted_price": float(getattr(result, "discount_price", 0) if hasattr(result, "discount_price") else result.get("discount_price", 0)),
-                        "price": float(getattr(result, "price", 0) if hasattr(result, "price") else result.get("price", 0)),
-                        "instructor_id": getattr(result, "instructor_id", "") if hasattr(result, "instructor_id") else result.get("instructor_id", "")
-                    }
-
             if not_published_courses:
                 courses_list = ', '.join(
                     f"{cid} (status: {status})" for cid, status in not_published_courses.items()
@@ -321,42 +441,182 @@ class PlaceOrderUseCase:
                 )
                 self._logger.error(error_message)
                 raise CourseNotPublishedException(
-                    f"Some selected courses are not available for ordering because they are not published."
+                    "Some selected courses are not available for ordering because they are not published."
                 )
 
-            async with self._cache.client.pipeline() as pipe:
-                for course_id, val in fetched_dict.items():
-                    prices[course_id] = val
-                    pipe.set(
-                        f"course_price:{course_id}",
-                        json.dumps(val),
-                        ex=self.CACHE_EXPIRATION_SEC
-                    )
-                await pipe.execute()
-
+        self._price_snapshot.set_many(prices)
         return prices
 
+    async def _fetch_course_prices(self, course_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Batch function behind the per-course singleflight (`_price_fetch_flight`): only one
+        fetch per course id is in flight per process, and the course_price:* key is
+        re-written once however many concurrent orders missed on it. When a fetch lease
+        is configured, a Redis lease per course id also keeps other pods from refetching
+        the same course at the same moment; they wait for the winner's cache write.
+        Returns: { course_id: {"status": str, "price": {...} | None} }
+        """
+        results: dict[str, dict[str, Any]] = {}
+        leases: dict[str, Any] = {}
+        to_fetch = list(course_ids)
+
+        if self._price_fetch_lease_ms:
+            leases, contended = await self._acquire_price_fetch_leases(course_ids)
+            if contended:
+                peer_prices = await self._wait_for_peer_prices(contended)
+                for course_id, price in peer_prices.items():
+                    results[course_id] = {"status": "published", "price": price}
+                to_fetch = [cid for cid in course_ids if cid not in peer_prices]
+
+        try:
+            if to_fetch:
+                results.update(await self._fetch_course_prices_from_upstream(to_fetch))
+        finally:
+            for lease in leases.values():
+                try:
+                    await lease.release()
+                except Exception:
+                    # Lease already expired or was taken over; nothing to release
+                    pass
+        return results
+
+    async def _fetch_course_prices_from_upstream(self, course_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        One GetCoursesByIds call for every id. Ids missing from the response are reported
+        with status "not_found", which the caller rejects like any unpublished course.
+        """
+        fetched_dict = {}
+        not_published_courses = {}
+
+        grpc_results = await self.course_service_client.get_courses_by_ids(course_ids)
+        for c in grpc_results:
+            status = c.get("status", "unknown")
+            course_id = c["course_id"]
+            if status != "published":
+                not_published_courses[course_id] = status
+                self._logger.warning(
+                    f"Course {course_id} is not published (status: {status})"
+                )
+                continue
+            fetched_dict[course_id] = {
+                "discounted_price": float(
+                    c.get("discount_price", c.get("price", 0))
+                ),
+                "price": float(c.get("price", 0)),
+                "instructor_id": c.get("instructor_id", ""),
+            }
+
+        for course_id in set(course_ids) - fetched_dict.keys() - not_published_courses.keys():
+            not_published_courses[course_id] = "not_found"
+            self._logger.warning(f"Course {course_id} not found")
+
+        results: dict[str, dict[str, Any]] = {
+            course_id: {"status": status, "price": None}
+            for course_id, status in not_published_courses.items()
+        }
+        for course_id, val in fetched_dict.items():
+            results[course_id] = {"status": "published", "price": val}
+
+        # NX: a course.* event handled while this fetch was in flight has already
+        # written a newer price, or an eviction tombstone, which must win
+        async with self._cache.client.pipeline() as pipe:
+            for course_id, val in fetched_dict.items():
+                pipe.set(
+                    f"course_price:{course_id}",
+                    json.dumps(val),
+                    ex=self.CACHE_EXPIRATION_SEC,
+                    nx=True,
+                )
+            await pipe.execute()
+
+        return results
+
+    async def _acquire_price_fetch_leases(self, course_ids: list[str]) -> tuple[dict[str, Any], list[str]]:
+        """
+        Try to take the cross-process fetch lease for each course id without blocking.
+        Returns the leases that were acquired and the ids another process is already
+        fetching. Ids whose lease could not be checked (Redis error) are fetched anyway.
+        """
+        lease_sec = self._price_fetch_lease_ms / 1000
+        locks = {
+            course_id: self._cache.client.lock(
+                f"course_price_lease:{course_id}", timeout=lease_sec, blocking=False)
+            for course_id in course_ids
+        }
+        acquired = await asyncio.gather(
+            *(lock.acquire() for lock in locks.values()), return_exceptions=True)
+
+        leases: dict[str, Any] = {}
+        contended: list[str] = []
+        for (course_id, lock), ok in zip(locks.items(), acquired):
+            if ok is True:
+                leases[course_id] = lock
+            elif ok is False:
+                contended.append(course_id)
+            else:
+                self._logger.warning(
+                    f"Failed to take price fetch lease for course {course_id}: {ok}")
+        return leases, contended
+
+    async def _wait_for_peer_prices(self, course_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Poll course_price:* for courses whose lease is held by another process, for at
+        most one lease period. Returns the prices that showed up in time.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._price_fetch_lease_ms / 1000
+        found: dict[str, dict[str, Any]] = {}
+        pending = list(course_ids)
+        while pending and loop.time() < deadline:
+            await asyncio.sleep(self.PRICE_FETCH_LEASE_POLL_SEC)
+            async with self._cache.client.pipeline() as pipe:
+                for course_id in pending:
+                    pipe.get(f"course_price:{course_id}")
+                values = await pipe.execute()
+            for course_id, value in zip(pending, values):
+                if value is None:
+                    continue
+                try:
+                    price = self._parse_cached_price(value)
+                except (ValueError, TypeError, KeyError):
+                    continue
+                if price is not None:
+                    found[course_id] = price
+            pending = [cid for cid in pending if cid not in found]
+        return found
+
+    @staticmethod
+    def _parse_cached_price(cached_value: Any) -> Optional[dict[str, Any]]:
+        """Returns None for a SyncCoursePriceUseCase eviction tombstone."""
+        if isinstance(cached_value, bytes):
+            cached_value = cached_value.decode('utf-8')
+        price_obj = json.loads(cached_value)
+        if "status" in price_obj:
+            return None
+        return {
+            "discounted_price": float(price_obj.get("discounted_price", price_obj.get("price", 0))),
+            "price": float(price_obj.get("price", 0)),
+            "instructor_id": price_obj.get("instructor_id", "")
+        }
+
     async def ensure_user_not_already_enrolled(self, user_id: str, course_ids: list[str]) -> None:
         """
         Checks if a user is already enrolled in any of the given courses.
+        The user's enrollment set is fetched once (cached per user in Redis) and
+        intersected with the cart, so the cost does not grow with the cart size.
+        Courses bought recently enough that the course service may not have enrolled
+        the user yet are read from OrderSuccessUseCase's purchase markers.
         Raises CourseAlreadyEnrolledException with a user-friendly message if any enrolled.
         """
         if not course_ids:
             return
 
-        tasks = [
-            self.course_service_client.is_user_enrolled_in_course(user_id, cid) for cid in course_ids
-        ]
-        task_results = await asyncio.gather(*tasks, return_exceptions=True)
-        enrolled_courses = []
-        for course_id, result in zip(course_ids, task_results):
-            if isinstance(result, (Exception, BaseException)):
-                self._logger.error(
-                    f"Failed to fetch course enrollment {course_id}: {str(result)}"
-                )
-                raise result
-            if result.get("is_enrolled", True):
-                enrolled_courses.append(course_id)
+        enrolled_course_ids, purchased_course_ids = await asyncio.gather(
+            self._get_user_enrolled_course_ids(user_id),
+            self._get_recently_purchased_course_ids(user_id, course_ids),
+        )
+        enrolled_course_ids = enrolled_course_ids | purchased_course_ids
+        enrolled_courses = [cid for cid in course_ids if cid in enrolled_course_ids]
 
         if enrolled_courses:
             self._logger.error(
@@ -365,3 +625,45 @@ class PlaceOrderUseCase:
             raise CourseAlreadyEnrolledException(
                 "You are already enrolled in one or more of the selected courses. Please remove the enrolled courses from your order before proceeding."
             )
+
+    async def _get_recently_purchased_course_ids(self, user_id: str, course_ids: list[str]) -> set[str]:
+        try:
+            markers = await self._cache.get_many(
+                [f"user_purchased_course:{user_id}:{course_id}" for course_id in course_ids])
+        except Exception as e:
+            self._logger.warning(f"Failed to read purchase markers for user {user_id}: {e}")
+            return set()
+        return {course_id for course_id, marker in zip(course_ids, markers) if marker is not None}
+
+    async def _get_user_enrolled_course_ids(self, user_id: str) -> set[str]:
+        cache_key = f"user_enrollments:{user_id}"
+        try:
+            cached = await self._cache.get(cache_key)
+            if cached is not None:
+                self._metrics.cache_hits(type="user_enrollments")
+                return set(json.loads(cached))
+        except (ValueError, TypeError) as e:
+            self._logger.warning(
+                f"Cache parse error for {cache_key}: {e}; refetching enrollments")
+        except Exception as e:
+            self._logger.warning(f"Failed to read {cache_key} from cache: {e}")
+
+        self._metrics.cache_misses(type="user_enrollments")
+        try:
+            enrolled_course_ids = await self.course_service_client.get_user_enrolled_course_ids(user_id)
+        except Exception as e:
+            self._logger.error(
+                f"Failed to fetch enrollments for user {user_id}: {str(e)}"
+            )
+            raise
+
+        try:
+            await self._cache.set(
+                cache_key,
+                json.dumps(sorted(enrolled_course_ids)),
+                expire=self.ENROLLMENT_CACHE_EXPIRATION_SEC,
+            )
+        except Exception as e:
+            self._logger.warning(f"Failed to cache {cache_key}: {e}")
+
+        return enrolled_course_ids
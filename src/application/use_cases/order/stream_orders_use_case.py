@@ -0,0 +1,73 @@
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from src.application.dtos.order_dto import OrderDto
+from src.application.dtos.stream_orders_dto import StreamOrdersDto
+from src.application.interfaces.logging_interface import ILoggingService
+from src.application.interfaces.metrics_interface import IMetricsService
+from src.domain.entities.order import Order
+from src.domain.exceptions.exceptions import InvalidCursorException
+from src.domain.repositories.order_repository import IOrderRepository
+from src.infrastructure.database.database import get_db
+from src.shared.utils.keyset_cursor import decode_cursor, encode_cursor
+
+
+class StreamOrdersUseCase:
+    """
+    Streams a user's orders straight off a database cursor, each paired with an
+    opaque cursor that resumes the stream after it. Memory use does not depend on
+    how many orders the user has or how deep the caller resumes.
+    """
+
+    def __init__(
+        self,
+        order_repository: IOrderRepository,
+        logging_service: ILoggingService,
+        metrics_service: IMetricsService,
+        batch_size: int = 100,
+    ):
+        self._order_repository = order_repository
+        self._logger = logging_service.get_logger("StreamOrdersUseCase")
+        self._metrics = metrics_service
+        self._batch_size = batch_size
+
+    async def execute(self, dto: StreamOrdersDto) -> AsyncIterator[tuple[OrderDto, str]]:
+        self._logger.info(
+            f"Executing StreamOrdersUseCase for user {dto.user_id}")
+        after = self._resume_position(dto) if dto.cursor else None
+
+        streamed = 0
+        async with get_db() as session:
+            async for order in self._order_repository.stream_by_user_id(
+                dto.user_id,
+                session,
+                status=dto.status,
+                sort_order=dto.sort_order,
+                after=after,
+                limit=dto.limit,
+                batch_size=self._batch_size,
+            ):
+                streamed += 1
+                yield OrderDto.from_domain(order), self._cursor_after(order, dto)
+
+        self._logger.debug(
+            f"Streamed {streamed} orders for user {dto.user_id}")
+
+    @staticmethod
+    def _cursor_after(order: Order, dto: StreamOrdersDto) -> str:
+        return encode_cursor({
+            "created_at": order.created_at.isoformat(),
+            "id": order.id,
+            "sort_order": dto.sort_order,
+            "status": dto.status,
+        })
+
+    @staticmethod
+    def _resume_position(dto: StreamOrdersDto) -> Optional[tuple[datetime, str]]:
+        try:
+            position = decode_cursor(dto.cursor)
+            if position.get("sort_order") != dto.sort_order or position.get("status") != dto.status:
+                raise ValueError("cursor belongs to a query with a different sort order or status")
+            return datetime.fromisoformat(position["created_at"]), str(position["id"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise InvalidCursorException(f"Invalid cursor: {e}")
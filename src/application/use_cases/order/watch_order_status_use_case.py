@@ -0,0 +1,67 @@
+import asyncio
+from typing import AsyncIterator
+
+from src.infrastructure.database.database import get_db
+from src.application.dtos.get_order_dto import GetOrderDto
+from src.application.interfaces.logging_interface import ILoggingService
+from src.application.interfaces.metrics_interface import IMetricsService
+from src.application.interfaces.order_status_notifier_interface import IOrderStatusNotifier
+from src.domain.entities.order import OrderStatus
+from src.domain.exceptions.exceptions import OrderNotFoundException
+from src.domain.repositories.order_repository import IOrderRepository
+
+
+class WatchOrderStatusUseCase:
+    """
+    Streams an order's status: the current status first, then each transition as it
+    is committed, until the order settles or `max_watch_sec` passes.
+    """
+
+    # A watch follows a payment to its outcome; a later refund is not waited for
+    FINAL_STATUSES = {
+        OrderStatus.SUCCEEDED,
+        OrderStatus.FAILED,
+        OrderStatus.CANCELLED,
+        OrderStatus.REFUNDED,
+        OrderStatus.EXPIRED,
+    }
+
+    def __init__(
+        self,
+        order_repository: IOrderRepository,
+        status_notifier: IOrderStatusNotifier,
+        logging_service: ILoggingService,
+        metrics_service: IMetricsService,
+        max_watch_sec: float = 900,
+    ):
+        self._order_repository = order_repository
+        self._status_notifier = status_notifier
+        self._logger = logging_service.get_logger("WatchOrderStatusUseCase")
+        self._metrics = metrics_service
+        self._max_watch_sec = max_watch_sec
+
+    async def execute(self, dto: GetOrderDto) -> AsyncIterator[OrderStatus]:
+        self._logger.info(f"Watching status of order {dto.order_id}")
+        loop = asyncio.get_running_loop()
+        watch_until = loop.time() + self._max_watch_sec
+
+        async with self._status_notifier.watch(dto.order_id) as changes:
+            status = await self._read_status(dto.order_id)
+            yield status
+            while status not in self.FINAL_STATUSES:
+                try:
+                    change = await asyncio.wait_for(changes.get(), watch_until - loop.time())
+                except asyncio.TimeoutError:
+                    self._logger.info(f"Watch of order {dto.order_id} reached its time limit")
+                    return
+                latest = await self._read_status(dto.order_id) if change is None else OrderStatus(change)
+                if latest != status:
+                    status = latest
+                    yield status
+
+    async def _read_status(self, order_id: str) -> OrderStatus:
+        async with get_db() as session:
+            status = await self._order_repository.find_status(order_id, session)
+        if status is None:
+            raise OrderNotFoundException(f"Order not found with Id {order_id}")
+        return status
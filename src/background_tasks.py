@@ -0,0 +1,49 @@
+import asyncio
+
+from src.application.interfaces.logging_interface import ILoggingService
+from src.application.interfaces.redis_interface import IRedisService
+from src.application.use_cases.order.place_order_use_case import PlaceOrderUseCase
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.database import get_db
+from src.infrastructure.database.repositories.sql_order_repository import SqlOrderRepository
+from src.infrastructure.redis.redis_bloom_filter import RedisBloomFilter
+
+
+async def refresh_course_price_snapshot(place_order_use_case: PlaceOrderUseCase, logging_service: ILoggingService):
+    """Periodically reloads hot course price snapshot entries before they expire."""
+    logger = logging_service.get_logger("CoursePriceSnapshotRefresher")
+    while True:
+        await asyncio.sleep(settings.COURSE_PRICE_SNAPSHOT_REFRESH_INTERVAL_SEC)
+        try:
+            await place_order_use_case.refresh_price_snapshot()
+        except Exception as e:
+            logger.warning(f"Course price snapshot refresh failed: {e}")
+
+
+async def maintain_idempotency_filter(
+    order_repository: SqlOrderRepository,
+    idempotency_filter: RedisBloomFilter,
+    redis: IRedisService,
+    logging_service: ILoggingService,
+):
+    """
+    Rebuilds the shared idempotency filter whenever it is not ready (first start, or
+    the bitmap was evicted) and keeps its sizing metrics current. The rebuild lock
+    keeps pods starting together from all scanning the orders table.
+    """
+    logger = logging_service.get_logger("IdempotencyFilterMaintainer")
+    while True:
+        try:
+            if not await idempotency_filter.is_ready():
+                rebuild_lock = redis.client.lock(
+                    f"{idempotency_filter.key}:rebuild", timeout=600, blocking=False)
+                if await rebuild_lock.acquire():
+                    try:
+                        async with get_db() as session:
+                            await order_repository.rebuild_idempotency_filter(session)
+                    finally:
+                        await rebuild_lock.release()
+            await idempotency_filter.publish_stats()
+        except Exception as e:
+            logger.warning(f"Idempotency filter maintenance failed: {e}")
+        await asyncio.sleep(settings.IDEMPOTENCY_FILTER_STATS_INTERVAL_SEC)
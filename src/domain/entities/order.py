@@ -52,6 +52,11 @@ _ORDER_LIFECYCLE = {
 }
 
 
+def statuses_allowing(new_status: OrderStatus) -> set[OrderStatus]:
+    """Statuses from which _ORDER_LIFECYCLE allows a move to `new_status`."""
+    return {status for status, allowed in _ORDER_LIFECYCLE.items() if new_status in allowed}
+
+
 @dataclass
 class Order:
     id: str
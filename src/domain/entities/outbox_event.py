@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+
+@dataclass
+class OutboxEvent:
+    id: int
+    topic: str
+    payload: dict[str, Any]
+    created_at: datetime
@@ -22,6 +22,11 @@ _PAYMENT_LIFECYCLE = {
 }
 
 
+def payment_statuses_allowing(new_status: PaymentStatus) -> set[str]:
+    """Payment statuses from which _PAYMENT_LIFECYCLE allows a move to `new_status`."""
+    return {status for status, allowed in _PAYMENT_LIFECYCLE.items() if new_status in allowed}
+
+
 class PaymentLifecycleException(Exception):
     pass
 
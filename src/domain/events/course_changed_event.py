@@ -0,0 +1,61 @@
+from typing import Any, Dict, Optional, Type, TypeVar
+from pydantic import BaseModel, Field, ValidationError
+
+from .base_event_dto import BaseEventDto
+
+
+class CourseChangedPayload(BaseModel):
+    course_id: str = Field(..., description="Course ID is required")
+    status: Optional[str] = Field(default=None, description="Course status after the change")
+    price: Optional[float] = Field(default=None, description="List price of the course")
+    discount_price: Optional[float] = Field(default=None, description="Discounted price of the course")
+    instructor_id: Optional[str] = Field(default=None, description="Instructor that owns the course")
+
+
+T = TypeVar("T", bound="CourseChangedEventDto")
+
+
+class CourseChangedEventDto(BaseEventDto[CourseChangedPayload]):
+    """
+    Shared DTO for the course.* lifecycle events (updated, published, unpublished,
+    deleted, archived). Only the fields needed to keep course prices cached are parsed.
+    """
+
+    @classmethod
+    def from_payload(cls: Type[T], event: Dict[str, Any]) -> T:
+        payload_data = event.get("payload", {})
+        if not isinstance(payload_data, dict):
+            raise ValueError("Event payload must be a dictionary.")
+
+        try:
+            course_id = payload_data.get("courseId") or payload_data["id"]
+            discount_price = payload_data.get("discountPrice", payload_data.get("discountedPrice"))
+            payload_obj = CourseChangedPayload(
+                course_id=course_id,
+                status=payload_data.get("status"),
+                price=payload_data.get("price"),
+                discount_price=discount_price,
+                instructor_id=payload_data.get("instructorId"),
+            )
+        except KeyError as e:
+            raise ValueError(f"Missing required payload field: {e}")
+        except ValidationError as e:
+            raise ValueError(f"Invalid payload data: {e}")
+
+        try:
+            timestamp = int(event["timestamp"])
+            event_id = str(event["eventId"])
+            event_type = str(event["eventType"])
+            source = str(event["source"]) if event.get("source") is not None else None
+        except KeyError as e:
+            raise ValueError(f"Missing required event field: {e}")
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid event field type: {e}")
+
+        return cls(
+            timestamp=timestamp,
+            event_id=event_id,
+            event_type=event_type,
+            payload=payload_obj,
+            source=source,
+        )
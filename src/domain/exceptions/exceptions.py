@@ -22,5 +22,17 @@ class SessionNotFoundException(DomainException):
 class ConcurrencyException(DomainException):
     pass
 
+class IdempotencyKeyInProgressException(DomainException):
+    pass
+
+class DeadlineExceededException(DomainException):
+    pass
+
+class InvalidCursorException(DomainException):
+    pass
+
 class SagaExecutionException(DomainException):
+    pass
+
+class UpstreamSaturatedException(DomainException):
     pass
\ No newline at end of file
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Literal, Optional, List, TypedDict
+from datetime import datetime
+from typing import AsyncIterator, Literal, Optional, List, TypedDict
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.domain.entities.order import Order
+from src.domain.entities.order import Order, OrderStatus
 from src.domain.entities.order_items import OrderItem
 from src.domain.entities.payment_details import PaymentDetails
 
@@ -27,6 +28,17 @@ class IOrderRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def insert(self, order: Order, session: AsyncSession) -> Order:
+        """
+        Persists a newly created order (with its items and payment details) that is
+        known not to exist yet, skipping the upsert logic of `save`.
+
+        Raises:
+            IntegrityError: If the order id or idempotency key is already taken.
+        """
+        pass
+
     @abstractmethod
     async def find_by_id(self, order_id: str, session: AsyncSession) -> Optional[Order]:
         """
@@ -41,6 +53,31 @@ class IOrderRepository(ABC):
         """
         pass
     @abstractmethod
+    async def find_status(self, order_id: str, session: AsyncSession) -> Optional[OrderStatus]:
+        """
+        Asynchronously retrieves only the status of an order, without loading the
+        order, its items or its payment details.
+
+        Args:
+            order_id (str): The unique identifier of the order.
+
+        Returns:
+            Optional[OrderStatus]: The order status if the order exists, otherwise None.
+        """
+        pass
+    @abstractmethod
+    async def find_by_ids(self, order_ids: List[str], session: AsyncSession) -> dict[str, Order]:
+        """
+        Asynchronously retrieves several orders by their unique identifiers.
+
+        Args:
+            order_ids (List[str]): The order identifiers; duplicates are ignored.
+
+        Returns:
+            dict[str, Order]: The orders found, keyed by id. Ids with no order are absent.
+        """
+        pass
+    @abstractmethod
     async def find_by_idempotency_key(self, idempotency_key: str, session: AsyncSession) -> Optional[Order]:
         """
         Asynchronously retrieves an order by idempotency key.
@@ -80,6 +117,34 @@ class IOrderRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def stream_by_user_id(
+        self,
+        user_id: str,
+        session: AsyncSession,
+        status: str | None = None,
+        sort_order: str | None = "desc",
+        after: tuple[datetime, str] | None = None,
+        limit: int | None = None,
+        batch_size: int = 100,
+    ) -> AsyncIterator[Order]:
+        """
+        Stream a user's orders without materialising them all, for exports and long
+        order histories. Orders come in (created_at, id) order.
+        Args:
+            user_id: The user to fetch orders for.
+            session: An active SQLAlchemy AsyncSession, kept open while streaming.
+            status: Optional status filter, as for `find_by_user_id`.
+            sort_order: Either "asc" or "desc".
+            after: (created_at, id) of the last order already returned; streaming
+                resumes after it.
+            limit: Maximum number of orders to stream; None for all.
+            batch_size: Rows fetched from the database cursor at a time.
+        Returns:
+            AsyncIterator[Order]: The matching orders.
+        """
+        pass
+
     @abstractmethod
     async def update_status(self, order_id: str, status: str, session: AsyncSession) -> None:
         """
@@ -91,6 +156,38 @@ class IOrderRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def transition_status(
+        self,
+        order_id: str,
+        new_status: OrderStatus,
+        session: AsyncSession,
+        payment_details: PaymentDetails | None = None,
+        overwrite_payment_status: bool = False,
+    ) -> Order:
+        """
+        Moves an order to `new_status` in a single conditional update, applied only
+        while the order lifecycle allows the move from its current status.
+
+        Args:
+            order_id (str): The unique identifier of the order.
+            new_status (OrderStatus): The status to move to.
+            payment_details (PaymentDetails | None): Upserted with the transition;
+                inserted if the order has none.
+            overwrite_payment_status (bool): Whether existing payment details take
+                the new payment_status (when the payment lifecycle allows it).
+
+        Returns:
+            Order: The order as stored after the transition.
+
+        Raises:
+            OrderNotFoundException: If the order does not exist.
+            OrderLifecycleException: If the current status does not allow the move.
+            PaymentLifecycleException: If overwrite_payment_status is set and the
+                stored payment status does not allow the new one.
+        """
+        pass
+
     @abstractmethod
     async def add_items(self, order_id: str, items: List[OrderItem], session: AsyncSession) -> None:
         """
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from typing import Any, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.domain.entities.outbox_event import OutboxEvent
+
+
+class IOutboxRepository(ABC):
+    @abstractmethod
+    async def add(self, topic: str, event: dict[str, Any], session: AsyncSession) -> None:
+        """
+        Stages an event for publishing in the caller's transaction, so it is only
+        published if the state change it describes is committed.
+
+        Args:
+            topic (str): Kafka topic the event is published to.
+            event (dict): JSON-serializable event body.
+        """
+        pass
+
+    @abstractmethod
+    async def claim_pending(self, limit: int, session: AsyncSession) -> List[OutboxEvent]:
+        """
+        Returns up to `limit` unsent events in insertion order. Only one relay can hold
+        the claim at a time (until the session's transaction ends); other callers get
+        an empty list.
+        """
+        pass
+
+    @abstractmethod
+    async def mark_sent(self, event_ids: List[int], session: AsyncSession) -> None:
+        """
+        Marks the given events as published in one statement.
+        """
+        pass
+
+    @abstractmethod
+    async def purge_sent(self, older_than: timedelta, limit: int, session: AsyncSession) -> int:
+        """
+        Deletes up to `limit` events that were published more than `older_than` ago.
+        Returns how many were deleted.
+        """
+        pass
@@ -0,0 +1,29 @@
+from enum import Enum
+
+
+class RuntimeRole(str, Enum):
+    """
+    Parts of the service a process can run, selected with SERVICE_ROLES.
+
+    api        - gRPC server (unless src.serve runs it in workers) and the price snapshot refresher
+    consumer   - Kafka consumer for payment, order timeout and course events
+    scheduler  - outbox relay and idempotency filter maintenance
+
+    Every role serves the HTTP health, readiness and metrics endpoints.
+    """
+    API = "api"
+    CONSUMER = "consumer"
+    SCHEDULER = "scheduler"
+
+
+def parse_runtime_roles(value: str) -> set[RuntimeRole]:
+    """Parses a comma-separated role list such as "api,scheduler"."""
+    names = {name.strip().lower() for name in value.split(",") if name.strip()}
+    if not names:
+        raise ValueError("SERVICE_ROLES must name at least one role")
+    unknown = names - {role.value for role in RuntimeRole}
+    if unknown:
+        raise ValueError(
+            f"Unknown service role(s): {', '.join(sorted(unknown))}. "
+            f"Expected any of: {', '.join(role.value for role in RuntimeRole)}")
+    return {RuntimeRole(name) for name in names}
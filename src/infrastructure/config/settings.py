@@ -39,13 +39,98 @@ class Settings(BaseSettings):
     OTEL_EXPORTER_OTLP_INSECURE: bool =True
     
     PROMETHEUS_PORT: int = 8000
+    # Prometheus multiprocess mode, used when gRPC runs in worker processes (src.serve)
+    PROMETHEUS_MULTIPROC_DIR: str = "/tmp/order-service-metrics"
+
+    # WatchOrderStatus streams end after this long even if the order has not settled
+    ORDER_STATUS_WATCH_MAX_SEC: float = 900
+
+    # Cache serialized OrderData for GetOrderById (order_pb:{id})
+    ORDER_RESPONSE_CACHE_ENABLED: bool = False
+    ORDER_RESPONSE_CACHE_TTL_SEC: int = 3600
+
+    # Rows fetched per database round trip while streaming orders (StreamOrders)
+    ORDER_STREAM_BATCH_SIZE: int = 100
+
+    # Upper bound on order ids per BatchGetOrders call
+    BATCH_GET_ORDERS_MAX_IDS: int = 100
+
+    # Comma-separated runtime roles for this process: api, consumer, scheduler
+    SERVICE_ROLES: str = "api,consumer,scheduler"
+
+    # gRPC worker processes started by src.serve; 0 serves gRPC in-process from src.main
+    GRPC_WORKERS: int = 0
+    GRPC_SHUTDOWN_GRACE_SEC: float = 5.0
     
     JWT_SECRET: str = "your-secret-key"
+    # Verified JWTs cached in process by digest until exp (capped), 0 entries = off
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = 10_000
+    AUTH_TOKEN_CACHE_MAX_TTL_SEC: int = 300
     
     MAX_CONNECTIONS: int = 100  # PostgreSQL connection pool max size
     KAFKA_CONSUMER_MAX_POLL_RECORDS: int = 100  # Batch size for Kafka consumer
     KAFKA_CONSUMER_GROUP: str = "order-service-group"
 
+    # In-process course price snapshot in front of the Redis course_price:* keys
+    COURSE_PRICE_SNAPSHOT_MAX_ENTRIES: int = 5000
+    COURSE_PRICE_SNAPSHOT_TTL_SEC: int = 60
+    COURSE_PRICE_SNAPSHOT_REFRESH_INTERVAL_SEC: int = 10
+    # Optional cross-process lease so only one pod refetches a missing course price
+    COURSE_PRICE_FETCH_LEASE_ENABLED: bool = False
+    COURSE_PRICE_FETCH_LEASE_MS: int = 500
+
+    # Redis Bloom filter in front of the idempotency key lookup
+    IDEMPOTENCY_FILTER_ENABLED: bool = True
+    IDEMPOTENCY_FILTER_CAPACITY: int = 2_000_000
+    IDEMPOTENCY_FILTER_ERROR_RATE: float = 0.01
+    IDEMPOTENCY_FILTER_STATS_INTERVAL_SEC: int = 60
+
+    # Transactional outbox relay to Kafka
+    OUTBOX_RELAY_BATCH_SIZE: int = 200
+    OUTBOX_RELAY_POLL_INTERVAL_MS: int = 100
+    # Published events are kept this long (for replay/debugging), then purged
+    OUTBOX_RETENTION_HOURS: int = 24
+    OUTBOX_PURGE_INTERVAL_SEC: int = 300
+
+    # Request deadlines: per-call cap for downstream gRPC calls, and the budget used
+    # when an incoming call carries no deadline of its own (0 = unbounded)
+    GRPC_CLIENT_TIMEOUT_SEC: float = 5.0
+    GRPC_SERVER_DEFAULT_DEADLINE_MS: int = 0
+
+    # gRPC admission control (adaptive per-method concurrency limits)
+    GRPC_MAX_CONCURRENT_RPCS: int = 500
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_LATENCY_TARGET_MS: int = 500
+    ADMISSION_METHOD_MAX_LIMIT: int = 100
+    ADMISSION_GLOBAL_MAX_LIMIT: int = 200
+    ADMISSION_LOW_PRIORITY_SHARE: float = 0.6
+
+    # Cross-request micro-batching of get_user / get_course into *ByIds RPCs
+    GRPC_BATCH_WINDOW_MS: int = 5
+    GRPC_BATCH_MAX_SIZE: int = 100
+
+    # Long-lived multiplexed channels per upstream gRPC service, with HTTP/2 keepalive
+    GRPC_CLIENT_CHANNELS_PER_UPSTREAM: int = 2
+    GRPC_CLIENT_KEEPALIVE_TIME_MS: int = 30_000
+    GRPC_CLIENT_KEEPALIVE_TIMEOUT_MS: int = 10_000
+
+    # Per-upstream, per-method bulkheads: adaptive concurrency limit plus a short
+    # FIFO queue (queue timeout 0 = fail fast when the limit is reached)
+    UPSTREAM_BULKHEAD_ENABLED: bool = True
+    UPSTREAM_BULKHEAD_INITIAL_LIMIT: int = 20
+    UPSTREAM_BULKHEAD_MAX_LIMIT: int = 100
+    UPSTREAM_BULKHEAD_LATENCY_TARGET_MS: int = 250
+    UPSTREAM_BULKHEAD_MAX_QUEUE: int = 50
+    UPSTREAM_BULKHEAD_QUEUE_TIMEOUT_MS: int = 100
+
+    # Hedged idempotent reads: a second attempt once a call passes the method's
+    # GRPC_HEDGING_QUANTILE latency, capped at GRPC_HEDGING_MAX_RATIO of calls
+    GRPC_HEDGING_ENABLED: bool = False
+    GRPC_HEDGING_QUANTILE: float = 0.95
+    GRPC_HEDGING_MIN_SAMPLES: int = 50
+    GRPC_HEDGING_MIN_DELAY_MS: int = 5
+    GRPC_HEDGING_MAX_RATIO: float = 0.05
+
     model_config = SettingsConfigDict(
         env_file=".env" if os.getenv("ENVIRONMENT") == "development" else None,
         env_file_encoding="utf-8", extra="ignore")
@@ -27,11 +27,19 @@ Base = declarative_base()
 
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
+from sqlalchemy import text
+from src.shared.utils.deadline import timeout_for
 
 @asynccontextmanager
 async def get_db():
+    # Raises before a connection is taken if the request deadline is already spent
+    statement_timeout = timeout_for()
     async with AsyncSessionFactory() as session:
         try:
+            if statement_timeout is not None:
+                # Scoped to this transaction; the pooled connection keeps its default
+                await session.execute(
+                    text(f"SET LOCAL statement_timeout = {max(1, int(statement_timeout * 1000))}"))
             yield session
             await session.commit()
         except Exception:
@@ -142,6 +142,8 @@ class OrderModel(Base):
     __table_args__ = (
         Index("idx_orders_user_id", "user_id"),
         Index("idx_orders_status", "status"),
+        # Keyset order for streaming a user's orders (stream_by_user_id)
+        Index("idx_orders_user_id_created_at_id", "user_id", "created_at", "id"),
     )
     
     # def map_to_domain(self) -> Order:
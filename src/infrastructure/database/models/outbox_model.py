@@ -0,0 +1,29 @@
+from sqlalchemy import BigInteger, Column, DateTime, Index, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+
+from src.infrastructure.database.database import Base
+
+
+class OutboxEventModel(Base):
+    __tablename__ = "outbox_events"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    topic = Column(String, nullable=False)
+    payload = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    # The relay only ever scans unsent rows in id order, and the purge only sent
+    # rows by sent_at
+    __table_args__ = (
+        Index(
+            "idx_outbox_events_unsent",
+            "id",
+            postgresql_where=sent_at.is_(None),
+        ),
+        Index(
+            "idx_outbox_events_sent_at",
+            "sent_at",
+            postgresql_where=sent_at.isnot(None),
+        ),
+    )
@@ -1,17 +1,26 @@
+import asyncio
 import json
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional, List
+from typing import Any, AsyncIterator, Optional, List, Sequence
+from uuid import uuid4
 
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import select, update, func
-from sqlalchemy.orm import InstrumentedAttribute, selectinload
+from sqlalchemy import any_, event, insert, literal, select, tuple_, update, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import InstrumentedAttribute, Session, selectinload
 
 from src.domain.entities.order_items import OrderItem
-from src.domain.entities.payment_details import PaymentDetails
-from src.domain.entities.order import Order, OrderStatus
+from src.domain.entities.payment_details import (
+    PaymentDetails,
+    PaymentLifecycleException,
+    payment_statuses_allowing,
+)
+from src.domain.entities.order import Order, OrderLifecycleException, OrderStatus, statuses_allowing
+from src.domain.exceptions.exceptions import OrderNotFoundException
 from src.domain.value_objects.money import Money
 from src.application.interfaces.logging_interface import ILoggingService
 from src.application.interfaces.redis_interface import IRedisService
+from src.application.interfaces.order_status_notifier_interface import IOrderStatusNotifier
 from src.domain.repositories.order_repository import IOrderRepository, RevenueRange, RevenueStats
 from src.infrastructure.database.models.order_model import (
     OrderModel,
@@ -20,12 +29,49 @@ from src.infrastructure.database.models.order_model import (
 )
 from src.infrastructure.database.database import AsyncSession
 from src.infrastructure.database.mappers.entity_mapper import EntityMapper
+from src.infrastructure.redis.redis_bloom_filter import RedisBloomFilter
+from src.shared.utils.deadline import detached_from_deadline
+
+_PENDING_CACHE_WRITES_KEY = "sql_order_repository.pending_cache_writes"
+
+
+def _map_status_to_db(status: Optional[str]) -> Optional[List[str]]:
+    status_map = {
+        "pending": ["created", "pending_payment", "processing"],
+        "failed": ["failed"],
+        "succeeded": ["succeeded"],
+        "completed": ["succeeded"],
+        "cancelled": ["cancelled", "expired"],
+        "refunded": ["refunded"],
+        "expired": ["expired", "expired"],
+    }
+    if status is None:
+        return None
+    return status_map.get(status.strip().lower())
+
+
+class _PendingCacheWrites:
+    __slots__ = ("entries", "clear_indexes", "delete")
+
+    def __init__(self) -> None:
+        self.entries: dict[str, Any] = {}
+        self.clear_indexes: set[str] = set()
+        self.delete: set[str] = set()
 
 
 class SqlOrderRepository(IOrderRepository):
-    def __init__(self, redis: IRedisService, logging_service: ILoggingService):
+    def __init__(
+        self,
+        redis: IRedisService,
+        logging_service: ILoggingService,
+        idempotency_filter: RedisBloomFilter | None = None,
+        status_notifier: IOrderStatusNotifier | None = None,
+    ):
         self.redis = redis
         self.logger = logging_service.get_logger("SqlOrderRepository")
+        self.idempotency_filter = idempotency_filter
+        self.status_notifier = status_notifier
+        self._cache_tasks: set[asyncio.Task] = set()
 
     async def save(self, order: Order, session: AsyncSession) -> Order:
         """
@@ -39,6 +85,7 @@ class SqlOrderRepository(IOrderRepository):
                     selectinload(OrderModel.payment_details)
                 ]
             )
+            previous_status = existing.status if existing else None
             if not existing:
                 # Create new model
                 order_model = OrderModel(
@@ -63,6 +110,10 @@ class SqlOrderRepository(IOrderRepository):
                 if order.payment_details:
                     order_model.payment_details = EntityMapper.to_orm_payment_details(
                         order.payment_details, order.id)
+                if order.idempotency_key and self.idempotency_filter is not None:
+                    # Added before commit: a rollback only costs a false positive,
+                    # whereas adding after commit could briefly hide a committed key.
+                    await self.idempotency_filter.add(order.idempotency_key)
                 session.add(order_model)
                 await session.flush()
                 await session.refresh(order_model)
@@ -111,9 +162,15 @@ class SqlOrderRepository(IOrderRepository):
             # Cache housekeeping
             domain_order = EntityMapper.to_domain_order(persisted)
             await self._invalidate_order_caches(domain_order)
+            # order_pb is only ever filled on read; a reader between the delete above
+            # and the commit may have cached the old order again
+            self._cache_after_commit(session, {}, delete=[f"order_pb:{domain_order.id}"])
             cache_json = EntityMapper.serialize_order_to_json(domain_order)
             cache_key = f"orders:{domain_order.id}"
             await self.redis.set(cache_key, cache_json, expire=3600)
+            await self._cache_status(domain_order.id, domain_order.status)
+            if self.status_notifier is not None and domain_order.status.value != previous_status:
+                self.status_notifier.publish_after_commit(session, domain_order.id, domain_order.status)
             if domain_order.idempotency_key:
                 idem_cache_key = f"orders:idempotency_key:{domain_order.idempotency_key}"
                 await self.redis.set(idem_cache_key, cache_json, expire=3600)
@@ -133,20 +190,170 @@ class SqlOrderRepository(IOrderRepository):
                 pass
             raise
 
+    async def insert(self, order: Order, session: AsyncSession) -> Order:
+        """
+        Persists a freshly created order in one statement: data-modifying CTEs insert
+        the order row, all of its items (multi-row) and its payment details, and
+        RETURNING hands back the stored timestamps. There is no existence probe,
+        no ORM flush and no refresh; a duplicate id or idempotency key surfaces as
+        IntegrityError just as it does from `save`.
+
+        A new order has no cached entries of its own to invalidate, so the cache
+        housekeeping is one pipelined round trip: the order and status entries
+        are written and the user's paged list caches are dropped through their index.
+        It runs only once the caller's transaction commits, so a rolled-back order is
+        never served from cache (nor its idempotency key answered with it).
+        """
+        try:
+            status_value = order.status.value if hasattr(order.status, "value") else order.status
+            new_order = (
+                insert(OrderModel)
+                .values(
+                    id=order.id,
+                    user_id=order.user_id,
+                    idempotency_key=order.idempotency_key,
+                    amount=order.amount.amount,
+                    currency=order.amount.currency,
+                    discount=order.discount,
+                    sub_total=order.sub_total,
+                    sales_tax=order.sales_tax,
+                    status=status_value,
+                    created_at=order.created_at,
+                    updated_at=order.updated_at,
+                )
+                .returning(OrderModel.created_at, OrderModel.updated_at)
+                .cte("new_order")
+            )
+            # Postgres only runs a data-modifying CTE that the statement mentions
+            columns = [new_order.c.created_at, new_order.c.updated_at]
+            if order.items:
+                new_items = (
+                    insert(OrderItemModel)
+                    .values([
+                        {"id": item.id, "order_id": order.id,
+                         "course_id": item.course_id, "price": item.price}
+                        for item in order.items
+                    ])
+                    .returning(OrderItemModel.id)
+                    .cte("new_items")
+                )
+                columns.append(
+                    select(func.count()).select_from(new_items).scalar_subquery().label("items"))
+            if order.payment_details:
+                pd = order.payment_details
+                new_payment = (
+                    insert(PaymentDetailsModel)
+                    .values(
+                        id=pd.id or str(uuid4()),
+                        order_id=order.id,
+                        payment_id=pd.payment_id,
+                        provider=pd.provider,
+                        provider_order_id=pd.provider_order_id,
+                        payment_status=pd.payment_status,
+                        updated_at=pd.updated_at or datetime.utcnow(),
+                    )
+                    .returning(PaymentDetailsModel.id)
+                    .cte("new_payment")
+                )
+                columns.append(
+                    select(func.count()).select_from(new_payment).scalar_subquery().label("payment"))
+
+            if order.idempotency_key and self.idempotency_filter is not None:
+                # Before the insert for the same reason as in `save`
+                await self.idempotency_filter.add(order.idempotency_key)
+            row = (await session.execute(select(*columns))).one()
+            order.created_at, order.updated_at = row.created_at, row.updated_at
+
+            cache_json = EntityMapper.serialize_order_to_json(order)
+            cache_entries = {
+                f"orders:{order.id}": cache_json,
+                f"order_status:{order.id}": status_value,
+            }
+            if order.idempotency_key:
+                cache_entries[f"orders:idempotency_key:{order.idempotency_key}"] = cache_json
+            self._cache_after_commit(
+                session, cache_entries, clear_indexes=[self._user_orders_index(order.user_id)])
+            if self.status_notifier is not None:
+                self.status_notifier.publish_after_commit(session, order.id, order.status)
+            return order
+        except IntegrityError as ie:
+            self.logger.error(
+                "IntegrityError while inserting order: %s", getattr(ie, "orig", ie))
+            await session.rollback()
+            raise
+        except Exception as e:
+            self.logger.exception(f"Failed to insert order: {str(e)}")
+            try:
+                await session.rollback()
+            except Exception:
+                pass
+            raise
+
+    def _cache_after_commit(
+        self,
+        session: AsyncSession,
+        entries: dict[str, Any],
+        clear_indexes: Sequence[str] = (),
+        delete: Sequence[str] = (),
+    ) -> None:
+        """
+        Queues cache writes on `session` and sends them as one pipelined set_many from
+        its after_commit hook; a rollback drops them. Later entries for the same key
+        replace earlier ones within a transaction.
+        """
+        sync_session = session.sync_session
+        pending = sync_session.info.get(_PENDING_CACHE_WRITES_KEY)
+        if pending is None:
+            pending = sync_session.info[_PENDING_CACHE_WRITES_KEY] = _PendingCacheWrites()
+        pending.entries.update(entries)
+        pending.clear_indexes.update(clear_indexes)
+        pending.delete.update(delete)
+        if not event.contains(sync_session, "after_commit", self._on_commit):
+            event.listen(sync_session, "after_commit", self._on_commit)
+            event.listen(sync_session, "after_rollback", self._on_rollback)
+
+    def _on_commit(self, sync_session: Session) -> None:
+        pending = sync_session.info.pop(_PENDING_CACHE_WRITES_KEY, None)
+        if pending is None:
+            return
+        # Runs inside the session's greenlet on the event loop thread
+        task = asyncio.get_running_loop().create_task(self._flush_cache_writes(pending))
+        self._cache_tasks.add(task)
+        task.add_done_callback(self._cache_tasks.discard)
+
+    def _on_rollback(self, sync_session: Session) -> None:
+        sync_session.info.pop(_PENDING_CACHE_WRITES_KEY, None)
+
+    async def _flush_cache_writes(self, pending: _PendingCacheWrites) -> None:
+        try:
+            # The request may already have answered; its deadline no longer applies
+            with detached_from_deadline():
+                await self.redis.set_many(
+                    pending.entries,
+                    expire=3600,
+                    clear_indexes=sorted(pending.clear_indexes),
+                    delete=sorted(pending.delete),
+                )
+        except Exception as e:
+            # Callers delete the entries this replaces before committing, so a lost
+            # write costs a cache miss rather than serving stale data
+            self.logger.warning(
+                f"Failed to write {len(pending.entries)} cache entries after commit: {e}")
+
     async def _invalidate_order_caches(self, order: Order):
         """
         Invalidate all cache entries related to an order and the user's paged list caches.
         """
         await self.redis.delete(f"orders:{order.id}")
+        await self.redis.delete(f"order_pb:{order.id}")
         if order.idempotency_key:
             await self.redis.delete(f"orders:idempotency_key:{order.idempotency_key}")
-        # Invalidate paged user order caches (pattern-based if supported)
-        user_cache_pattern = f"user_orders:{order.user_id}:p*:s*:o*"
-        try:
-            await self.redis.delete_pattern(user_cache_pattern)
-        except AttributeError:
-            self.logger.warning(
-                "RedisService does not implement delete_pattern; paged user orders cache may be stale.")
+        # Invalidate paged user order caches (every page is recorded in the user's index)
+        await self.redis.delete_indexed(self._user_orders_index(order.user_id))
+
+    @staticmethod
+    def _user_orders_index(user_id: str) -> str:
+        return f"user_orders_index:{user_id}"
 
     async def find_by_id(self, order_id: str, session: AsyncSession) -> Optional[Order]:
         cache_key = f"orders:{order_id}"
@@ -174,9 +381,87 @@ class SqlOrderRepository(IOrderRepository):
             self.logger.error(f"Failed to find order {order_id}: {str(e)}")
             raise
 
+    async def _cache_status(self, order_id: str, status: OrderStatus | str) -> None:
+        status_value = status.value if hasattr(status, "value") else status
+        await self.redis.set(f"order_status:{order_id}", status_value, expire=3600)
+
+    async def find_status(self, order_id: str, session: AsyncSession) -> Optional[OrderStatus]:
+        """
+        Status-only read for pollers: the compact order_status:{id} entry, falling back
+        to selecting just the status column.
+        """
+        cache_key = f"order_status:{order_id}"
+        try:
+            cached = await self.redis.get(cache_key)
+            if cached is not None:
+                try:
+                    return OrderStatus(cached)
+                except ValueError:
+                    self.logger.warning(f"Invalid cached status for {cache_key}: {cached!r}")
+                    await self.redis.delete(cache_key)
+            result = await session.execute(
+                select(OrderModel.status).where(OrderModel.id == order_id)
+            )
+            status = result.scalar_one_or_none()
+            if status is None:
+                return None
+            await self._cache_status(order_id, status)
+            return OrderStatus(status)
+        except Exception as e:
+            self.logger.error(f"Failed to find status of order {order_id}: {str(e)}")
+            raise
+
+    async def find_by_ids(self, order_ids: List[str], session: AsyncSession) -> dict[str, Order]:
+        """
+        Batch counterpart of `find_by_id`: one MGET over the order cache, one
+        `id = ANY(...)` query for the misses, and one pipelined write to back-fill them.
+        """
+        order_ids = list(dict.fromkeys(order_ids))
+        if not order_ids:
+            return {}
+        orders: dict[str, Order] = {}
+        try:
+            cached_values = await self.redis.get_many([f"orders:{order_id}" for order_id in order_ids])
+            misses = []
+            for order_id, cached in zip(order_ids, cached_values):
+                if cached is None:
+                    misses.append(order_id)
+                    continue
+                try:
+                    orders[order_id] = EntityMapper.deserialize_json_to_order(json.loads(cached))
+                except Exception as e:
+                    # Reloaded below; the back-fill overwrites the corrupt entry
+                    self.logger.warning(
+                        f"Invalid/corrupt cache for orders:{order_id}: {e}")
+                    misses.append(order_id)
+            if not misses:
+                return orders
+
+            result = await session.execute(
+                select(OrderModel)
+                .options(selectinload(OrderModel.items), selectinload(OrderModel.payment_details))
+                .where(OrderModel.id == any_(misses))
+            )
+            to_cache = {}
+            for order_model in result.scalars().all():
+                order = EntityMapper.to_domain_order(order_model)
+                orders[order.id] = order
+                to_cache[f"orders:{order.id}"] = EntityMapper.serialize_order_to_json(order)
+            await self.redis.set_many(to_cache, expire=3600)
+            return orders
+        except Exception as e:
+            self.logger.error(f"Failed to find orders {order_ids}: {str(e)}")
+            raise
+
     async def find_by_idempotency_key(self, idempotency_key: str, session: AsyncSession) -> Optional[Order]:
         cache_key = f"orders:idempotency_key:{idempotency_key}"
         try:
+            maybe_seen = None
+            if self.idempotency_filter is not None:
+                maybe_seen = await self.idempotency_filter.might_contain(idempotency_key)
+                if maybe_seen is False:
+                    return None
+
             cached = await self.redis.get(cache_key)
             if cached:
                 try:
@@ -194,6 +479,8 @@ class SqlOrderRepository(IOrderRepository):
             )
             order_model = result.scalars().first()
             if not order_model:
+                if maybe_seen:
+                    self.idempotency_filter.record_false_positive()
                 return None
             order = EntityMapper.to_domain_order(order_model)
             # Cache for both idempotency key and order id
@@ -206,6 +493,31 @@ class SqlOrderRepository(IOrderRepository):
                 f"Failed to find order with idempotency_key {idempotency_key}: {str(e)}")
             raise
 
+    async def rebuild_idempotency_filter(self, session: AsyncSession, batch_size: int = 5000) -> int:
+        """
+        Loads every stored idempotency key into the idempotency filter and marks it
+        ready. Keys saved while the rebuild runs are added by `save` itself, so the
+        filter is complete once this returns. Returns the number of keys loaded.
+        """
+        if self.idempotency_filter is None:
+            return 0
+        loaded = 0
+        try:
+            result = await session.stream_scalars(
+                select(OrderModel.idempotency_key)
+                .where(OrderModel.idempotency_key.is_not(None))
+                .execution_options(yield_per=batch_size)
+            )
+            async for keys in result.partitions(batch_size):
+                await self.idempotency_filter.add_many(list(keys))
+                loaded += len(keys)
+            await self.idempotency_filter.mark_ready()
+            self.logger.info(f"Idempotency filter rebuilt with {loaded} keys")
+            return loaded
+        except Exception as e:
+            self.logger.error(f"Failed to rebuild idempotency filter: {str(e)}")
+            raise
+
     async def find_by_user_id(
         self,
         user_id: str,
@@ -216,20 +528,6 @@ class SqlOrderRepository(IOrderRepository):
         sort_order: Optional[str] = "desc",
     ) -> tuple[List[Order], int]:
 
-        def map_status_to_db(status: Optional[str]) -> Optional[List[str]]:
-            status_map = {
-                "pending": ["created", "pending_payment", "processing"],
-                "failed": ["failed"],
-                "succeeded": ["succeeded"],
-                "completed": ["succeeded"],
-                "cancelled": ["cancelled", "expired"],
-                "refunded": ["refunded"],
-                "expired": ["expired", "expired"],
-            }
-            if status is None:
-                return None
-            return status_map.get(status.strip().lower())
-
         # Validate pagination params
         page = page if isinstance(page, int) and page > 0 else 1
         page_size = page_size if isinstance(
@@ -273,7 +571,7 @@ class SqlOrderRepository(IOrderRepository):
 
             ordering_col = OrderModel.created_at.asc(
             ) if sort_order == "asc" else OrderModel.created_at.desc()
-            mapped_statuses = map_status_to_db(status)
+            mapped_statuses = _map_status_to_db(status)
             where_clauses = [OrderModel.user_id == user_id]
             if mapped_statuses:
                 where_clauses.append(OrderModel.status.in_(mapped_statuses))
@@ -303,7 +601,8 @@ class SqlOrderRepository(IOrderRepository):
                 "total": total_count
             }
             try:
-                await self.redis.set(cache_key, json.dumps(to_cache), expire=1200)
+                await self.redis.set_indexed(
+                    cache_key, json.dumps(to_cache), self._user_orders_index(user_id), expire=1200)
             except Exception as e:
                 self.logger.warning(
                     f"Failed to cache user orders for {user_id}: {e}")
@@ -315,6 +614,53 @@ class SqlOrderRepository(IOrderRepository):
             )
             raise
 
+    async def stream_by_user_id(
+        self,
+        user_id: str,
+        session: AsyncSession,
+        status: Optional[str] = None,
+        sort_order: Optional[str] = "desc",
+        after: Optional[tuple[datetime, str]] = None,
+        limit: Optional[int] = None,
+        batch_size: int = 100,
+    ) -> AsyncIterator[Order]:
+        """
+        Streams a user's orders through a server-side cursor, `batch_size` rows at a
+        time, in (created_at, id) order. Paging is by keyset: `after` is the position
+        of the last order already returned, so resuming costs the same at any depth.
+        Bypasses the cache; the rows are read once.
+        """
+        ascending = (sort_order or "desc").lower() == "asc"
+        where_clauses = [OrderModel.user_id == user_id]
+        mapped_statuses = _map_status_to_db(status)
+        if mapped_statuses:
+            where_clauses.append(OrderModel.status.in_(mapped_statuses))
+        if after is not None:
+            position = tuple_(OrderModel.created_at, OrderModel.id)
+            where_clauses.append(position > after if ascending else position < after)
+
+        if ascending:
+            ordering = (OrderModel.created_at.asc(), OrderModel.id.asc())
+        else:
+            ordering = (OrderModel.created_at.desc(), OrderModel.id.desc())
+        stmt = (
+            select(OrderModel)
+            .options(selectinload(OrderModel.items), selectinload(OrderModel.payment_details))
+            .where(*where_clauses)
+            .order_by(*ordering)
+            .execution_options(yield_per=batch_size)
+        )
+        if limit:
+            stmt = stmt.limit(limit)
+
+        try:
+            result = await session.stream_scalars(stmt)
+            async for order_model in result:
+                yield EntityMapper.to_domain_order(order_model)
+        except Exception as e:
+            self.logger.error(f"Failed to stream orders for user {user_id}: {str(e)}")
+            raise
+
     async def update_status(self, order_id: str, status: str, session: AsyncSession) -> None:
         try:
             await session.execute(
@@ -322,25 +668,196 @@ class SqlOrderRepository(IOrderRepository):
                 .where(OrderModel.id == order_id)
                 .values(status=status)
             )
+            if self.status_notifier is not None:
+                self.status_notifier.publish_after_commit(session, order_id, status)
             await session.commit()
             order_model = await session.get(OrderModel, order_id)
             user_id = getattr(order_model, "user_id", None)
             idempotency_key = getattr(order_model, "idempotency_key", None)
             await self.redis.delete(f"orders:{order_id}")
+            await self.redis.delete(f"order_pb:{order_id}")
+            await self._cache_status(order_id, status)
             if idempotency_key and not isinstance(idempotency_key, InstrumentedAttribute):
                 await self.redis.delete(f"orders:idempotency_key:{idempotency_key}")
             if user_id and not isinstance(user_id, InstrumentedAttribute):
-                try:
-                    await self.redis.delete_pattern(f"user_orders:{user_id}:p*:s*:o*")
-                except AttributeError:
-                    self.logger.warning(
-                        "RedisService does not implement delete_pattern; paged user orders cache may be stale.")
+                await self.redis.delete_indexed(self._user_orders_index(user_id))
         except Exception as e:
             await session.rollback()
             self.logger.error(
                 f"Failed to update status for order {order_id}: {str(e)}")
             raise
     
+    async def transition_status(
+        self,
+        order_id: str,
+        new_status: OrderStatus,
+        session: AsyncSession,
+        payment_details: PaymentDetails | None = None,
+        overwrite_payment_status: bool = False,
+    ) -> Order:
+        """
+        Moves an order to `new_status` with one compare-and-set statement: the UPDATE
+        only matches while the current status is one _ORDER_LIFECYCLE allows the move
+        from, so concurrent handlers cannot both apply conflicting transitions.
+
+        `payment_details` is upserted in the same statement, only if the transition
+        applied: inserted when the order has none, otherwise left alone, or with
+        `overwrite_payment_status` moved to its payment_status when the payment
+        lifecycle allows it. The same statement returns the updated order with its
+        items and payment details, so callers need no read before or after. The
+        order's cache entries are dropped right away and rewritten after commit.
+
+        Raises OrderNotFoundException for an unknown order, OrderLifecycleException
+        when the current status does not allow the move, and PaymentLifecycleException
+        when `overwrite_payment_status` is set but the stored payment_status does not
+        allow the new one; the caller's rollback then undoes the order transition too.
+        """
+        try:
+            now = datetime.now(timezone.utc)
+            allowed_from = [status.value for status in statuses_allowing(new_status)]
+            updated = (
+                update(OrderModel)
+                .where(OrderModel.id == order_id, OrderModel.status == any_(allowed_from))
+                .values(status=new_status.value, updated_at=now)
+                .returning(*OrderModel.__table__.c)
+                .cte("updated_order")
+            )
+
+            existing = PaymentDetailsModel.__table__
+            joined = (
+                updated
+                .outerjoin(OrderItemModel, OrderItemModel.order_id == updated.c.id)
+                .outerjoin(existing, existing.c.order_id == updated.c.id)
+            )
+            columns = [
+                *updated.c,
+                OrderItemModel.id.label("item_id"),
+                OrderItemModel.course_id.label("item_course_id"),
+                OrderItemModel.price.label("item_price"),
+                # The statement's snapshot: the payment row as it was before the upsert
+                *(column.label(f"payment_{column.name}") for column in existing.c),
+            ]
+            if payment_details is not None:
+                upserted = self._upsert_payment_details(
+                    updated, payment_details, overwrite_payment_status, now)
+                joined = joined.outerjoin(upserted, upserted.c.order_id == updated.c.id)
+                columns += [column.label(f"upserted_{column.name}") for column in upserted.c]
+
+            rows = (await session.execute(select(*columns).select_from(joined))).mappings().all()
+            if not rows:
+                current = (await session.execute(
+                    select(OrderModel.status).where(OrderModel.id == order_id))).scalar_one_or_none()
+                if current is None:
+                    raise OrderNotFoundException(f"Order not found: {order_id}")
+                raise OrderLifecycleException(
+                    f"Invalid order status transition from {current} to {new_status.value}")
+
+            first = rows[0]
+            if (overwrite_payment_status and payment_details is not None
+                    and first["payment_id"] is not None and first["upserted_id"] is None):
+                # ON CONFLICT DO UPDATE skipped the row: its WHERE rejected the move
+                raise PaymentLifecycleException(
+                    f"Invalid payment status transition from {first['payment_payment_status']} "
+                    f"to {payment_details.payment_status} for order {order_id}")
+
+            order = self._order_from_transition_rows(rows)
+            if self.status_notifier is not None:
+                self.status_notifier.publish_after_commit(session, order.id, order.status)
+
+            cache_json = EntityMapper.serialize_order_to_json(order)
+            cache_entries = {
+                f"orders:{order.id}": cache_json,
+                f"order_status:{order.id}": order.status.value,
+            }
+            if order.idempotency_key:
+                cache_entries[f"orders:idempotency_key:{order.idempotency_key}"] = cache_json
+            user_index = self._user_orders_index(order.user_id)
+            # Dropped now and rewritten once committed: a rollback then costs only a
+            # cache miss, and readers never see a status the database rolled back
+            await self.redis.set_many(
+                {}, clear_indexes=[user_index], delete=[*cache_entries, f"order_pb:{order.id}"])
+            # order_pb is only ever filled on read; a reader between the delete above
+            # and the commit may have cached the old order again
+            self._cache_after_commit(
+                session, cache_entries, clear_indexes=[user_index], delete=[f"order_pb:{order.id}"])
+            return order
+        except (OrderNotFoundException, OrderLifecycleException, PaymentLifecycleException):
+            raise
+        except Exception as e:
+            self.logger.error(
+                f"Failed to transition order {order_id} to {new_status.value}: {str(e)}")
+            raise
+
+    @staticmethod
+    def _upsert_payment_details(updated, payment_details: PaymentDetails, overwrite_status: bool, now: datetime):
+        """INSERT ... ON CONFLICT (order_id) for the order the `updated` CTE returned, as a CTE."""
+        table = PaymentDetailsModel.__table__
+        values = {
+            "id": payment_details.id or str(uuid4()),
+            "payment_id": payment_details.payment_id,
+            "provider": payment_details.provider,
+            "provider_order_id": payment_details.provider_order_id,
+            "payment_status": payment_details.payment_status,
+            "updated_at": payment_details.updated_at or now,
+        }
+        stmt = pg_insert(table).from_select(
+            ["order_id", *values.keys()],
+            select(
+                updated.c.id,
+                *(literal(value, table.c[name].type) for name, value in values.items()),
+            ),
+        )
+        if overwrite_status:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.order_id],
+                set_={
+                    "payment_status": stmt.excluded.payment_status,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+                where=table.c.payment_status == any_(
+                    list(payment_statuses_allowing(payment_details.payment_status))),
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[table.c.order_id])
+        return stmt.returning(*table.c).cte("upserted_payment")
+
+    @staticmethod
+    def _order_from_transition_rows(rows) -> Order:
+        first = rows[0]
+        items = {}
+        for row in rows:
+            if row["item_id"] is not None and row["item_id"] not in items:
+                items[row["item_id"]] = OrderItem(
+                    id=row["item_id"], course_id=row["item_course_id"], price=row["item_price"])
+
+        payment_details = None
+        for prefix in ("upserted_", "payment_"):
+            if first.get(f"{prefix}id") is not None:
+                payment_details = PaymentDetails(
+                    id=first[f"{prefix}id"],
+                    payment_id=first[f"{prefix}payment_id"],
+                    provider=first[f"{prefix}provider"],
+                    provider_order_id=first[f"{prefix}provider_order_id"],
+                    payment_status=first[f"{prefix}payment_status"],
+                    updated_at=first[f"{prefix}updated_at"],
+                )
+                break
+
+        return Order(
+            id=first["id"],
+            user_id=first["user_id"],
+            idempotency_key=first["idempotency_key"],
+            items=list(items.values()),
+            amount=Money(amount=float(first["amount"]), currency=first["currency"]),
+            sub_total=float(first["sub_total"]) if first["sub_total"] is not None else 0,
+            sales_tax=float(first["sales_tax"]) if first["sales_tax"] is not None else 0,
+            discount=float(first["discount"]) if first["discount"] is not None else None,
+            status=OrderStatus(first["status"]),
+            payment_details=payment_details,
+            created_at=first["created_at"],
+            updated_at=first["updated_at"],
+        )
+
     async def get_revenue_stats(self, year: int, session: AsyncSession) -> List[RevenueStats]:
         """
         Calculate revenue statistics for orders within a specified year range.
@@ -400,14 +917,11 @@ class SqlOrderRepository(IOrderRepository):
             user_id = getattr(order_model, "user_id", None)
             idempotency_key = getattr(order_model, "idempotency_key", None)
             await self.redis.delete(f"orders:{order_id}")
+            await self.redis.delete(f"order_pb:{order_id}")
             if idempotency_key and not isinstance(idempotency_key, InstrumentedAttribute):
                 await self.redis.delete(f"orders:idempotency_key:{idempotency_key}")
             if user_id and not isinstance(user_id, InstrumentedAttribute):
-                try:
-                    await self.redis.delete_pattern(f"user_orders:{user_id}:p*:s*:o*")
-                except AttributeError:
-                    self.logger.warning(
-                        "RedisService does not implement delete_pattern; paged user orders cache may be stale.")
+                await self.redis.delete_indexed(self._user_orders_index(user_id))
         except Exception as e:
             await session.rollback()
             self.logger.error(
@@ -441,14 +955,13 @@ class SqlOrderRepository(IOrderRepository):
             user_id = getattr(order_model, "user_id", None)
             idempotency_key = getattr(order_model, "idempotency_key", None)
             await self.redis.delete(f"orders:{order_id}")
+            await self.redis.delete(f"order_pb:{order_id}")
+            # Dropped again once committed, for a reader that cached the old order meanwhile
+            self._cache_after_commit(session, {}, delete=[f"order_pb:{order_id}"])
             if idempotency_key and not isinstance(idempotency_key, InstrumentedAttribute):
                 await self.redis.delete(f"orders:idempotency_key:{idempotency_key}")
             if user_id and not isinstance(user_id, InstrumentedAttribute):
-                try:
-                    await self.redis.delete_pattern(f"user_orders:{user_id}:p*:s*:o*")
-                except AttributeError:
-                    self.logger.warning(
-                        "RedisService does not implement delete_pattern; paged user orders cache may be stale.")
+                await self.redis.delete_indexed(self._user_orders_index(user_id))
         except Exception as e:
             await session.rollback()
             self.logger.error(
@@ -0,0 +1,77 @@
+from datetime import timedelta
+from typing import Any, List
+
+from sqlalchemy import delete, func, select, update
+
+from src.application.interfaces.logging_interface import ILoggingService
+from src.domain.entities.outbox_event import OutboxEvent
+from src.domain.repositories.outbox_repository import IOutboxRepository
+from src.infrastructure.database.database import AsyncSession
+from src.infrastructure.database.models.outbox_model import OutboxEventModel
+
+
+class SqlOutboxRepository(IOutboxRepository):
+    # Transaction-scoped advisory lock held by the relay that is draining the outbox;
+    # a single drainer is what keeps per-key publish order across pods.
+    RELAY_LOCK_ID = 0x6F7574626F78
+
+    def __init__(self, logging_service: ILoggingService):
+        self.logger = logging_service.get_logger("SqlOutboxRepository")
+
+    async def add(self, topic: str, event: dict[str, Any], session: AsyncSession) -> None:
+        session.add(OutboxEventModel(topic=topic, payload=event))
+
+    async def claim_pending(self, limit: int, session: AsyncSession) -> List[OutboxEvent]:
+        try:
+            claimed = await session.scalar(
+                select(func.pg_try_advisory_xact_lock(self.RELAY_LOCK_ID)))
+            if not claimed:
+                return []
+            result = await session.execute(
+                select(OutboxEventModel)
+                .where(OutboxEventModel.sent_at.is_(None))
+                .order_by(OutboxEventModel.id)
+                .limit(limit)
+            )
+            return [
+                OutboxEvent(
+                    id=row.id,
+                    topic=row.topic,
+                    payload=row.payload,
+                    created_at=row.created_at,
+                )
+                for row in result.scalars().all()
+            ]
+        except Exception as e:
+            self.logger.error(f"Failed to claim pending outbox events: {str(e)}")
+            raise
+
+    async def mark_sent(self, event_ids: List[int], session: AsyncSession) -> None:
+        if not event_ids:
+            return
+        try:
+            await session.execute(
+                update(OutboxEventModel)
+                .where(OutboxEventModel.id.in_(event_ids))
+                .values(sent_at=func.now())
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to mark {len(event_ids)} outbox events as sent: {str(e)}")
+            raise
+
+    async def purge_sent(self, older_than: timedelta, limit: int, session: AsyncSession) -> int:
+        try:
+            # Bounded batches keep each DELETE's locks and WAL short
+            batch = (
+                select(OutboxEventModel.id)
+                .where(OutboxEventModel.sent_at < func.now() - older_than)
+                .order_by(OutboxEventModel.sent_at)
+                .limit(limit)
+                .scalar_subquery()
+            )
+            result = await session.execute(
+                delete(OutboxEventModel).where(OutboxEventModel.id.in_(batch)))
+            return result.rowcount
+        except Exception as e:
+            self.logger.error(f"Failed to purge sent outbox events: {str(e)}")
+            raise
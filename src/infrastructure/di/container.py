@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from dependency_injector import containers, providers
 from src.infrastructure.observability.logger.logger_config import LoggerConfig
 from src.infrastructure.observability.logger.logger_manager import LoggerManager
@@ -9,7 +11,14 @@ from src.application.use_cases.order.order_success_use_case import OrderSuccessU
 from src.application.use_cases.order.order_payment_initiated_use_case import OrderPaymentInitiatedUseCase
 from src.application.use_cases.order.get_order_use_case import GetOrderUseCase
 from src.application.use_cases.order.get_orders_use_case import GetOrdersUseCase
+from src.application.use_cases.order.batch_get_orders_use_case import BatchGetOrdersUseCase
+from src.application.use_cases.order.stream_orders_use_case import StreamOrdersUseCase
+from src.application.use_cases.order.get_order_status_use_case import GetOrderStatusUseCase
+from src.application.use_cases.order.watch_order_status_use_case import WatchOrderStatusUseCase
+from src.infrastructure.redis.order_status_notifier import RedisOrderStatusNotifier
+from src.infrastructure.redis.order_response_cache import OrderResponseCache
 from src.application.use_cases.order.expire_order_use_case import ExpireOrderUseCase
+from src.application.use_cases.course.sync_course_price_use_case import SyncCoursePriceUseCase
 from src.infrastructure.grpc.clients.couser_service_client import CourseServiceClient
 from src.application.interfaces.kafka_producer_interface import IKafkaProducer
 from src.application.interfaces.redis_interface import IRedisService
@@ -24,9 +33,12 @@ from src.application.services.saga.steps.order_steps import CreateOrderStep, Req
 from src.application.services.saga.steps.session_booking_steps import CheckSessionAvailabilityStep, CreateSessionBookingStep, RequestSessionPaymentStep
 from src.infrastructure.database.repositories.sql_order_repository import SqlOrderRepository
 from src.infrastructure.database.repositories.sql_session_booking_repository import SqlSessionBookingRepository
+from src.infrastructure.database.repositories.sql_outbox_repository import SqlOutboxRepository
 from src.infrastructure.kafka.producer import KafkaProducer
 from src.infrastructure.kafka.consumer import KafkaConsumer
+from src.infrastructure.kafka.outbox_relay import OutboxRelay
 from src.infrastructure.redis.redis_client import RedisClient
+from src.infrastructure.redis.redis_bloom_filter import RedisBloomFilter
 from src.infrastructure.grpc.clients.user_service_client import UserServiceClient
 from src.infrastructure.grpc.clients.session_service_client import SessionServiceClient
 from src.infrastructure.grpc.auth_guard import AuthGuard
@@ -36,6 +48,7 @@ from src.infrastructure.observability.tracer.tracing_service import TracingServi
 from src.infrastructure.database.database import AsyncSessionFactory
 from src.infrastructure.config.settings import settings
 from src.domain.entities.order import Order
+from src.shared.utils.ttl_cache import TTLCache
 
 
 class Container(containers.DeclarativeContainer):
@@ -81,12 +94,52 @@ class Container(containers.DeclarativeContainer):
     redis_client = providers.Singleton(
         RedisClient, logger_service=logging_service)
 
+    # In-process caches
+    course_price_snapshot = providers.Singleton(
+        TTLCache,
+        max_entries=settings.COURSE_PRICE_SNAPSHOT_MAX_ENTRIES,
+        ttl_sec=settings.COURSE_PRICE_SNAPSHOT_TTL_SEC,
+    )
+    auth_token_cache = providers.Singleton(
+        TTLCache,
+        max_entries=max(1, settings.AUTH_TOKEN_CACHE_MAX_ENTRIES),
+        ttl_sec=settings.AUTH_TOKEN_CACHE_MAX_TTL_SEC,
+    )
+
+    idempotency_filter = providers.Singleton(
+        RedisBloomFilter,
+        redis=redis_client,
+        logging_service=logging_service,
+        metrics_service=metrics_service,
+        name="idempotency_keys",
+        capacity=settings.IDEMPOTENCY_FILTER_CAPACITY,
+        error_rate=settings.IDEMPOTENCY_FILTER_ERROR_RATE,
+    )
+
     # Repositories
+    order_response_cache = providers.Singleton(
+        OrderResponseCache,
+        redis=redis_client,
+        logging_service=logging_service,
+        ttl_sec=settings.ORDER_RESPONSE_CACHE_TTL_SEC,
+    )
+    order_status_notifier = providers.Singleton(
+        RedisOrderStatusNotifier,
+        redis=redis_client,
+        logging_service=logging_service,
+    )
     order_repository = providers.Factory(
         SqlOrderRepository,
         # session=db_session_factory,
         redis=redis_client,
         logging_service=logging_service,
+        idempotency_filter=(
+            idempotency_filter if settings.IDEMPOTENCY_FILTER_ENABLED else None),
+        status_notifier=order_status_notifier,
+    )
+    outbox_repository = providers.Factory(
+        SqlOutboxRepository,
+        logging_service=logging_service,
     )
     session_booking_repository = providers.Factory(
         SqlSessionBookingRepository,
@@ -101,20 +154,34 @@ class Container(containers.DeclarativeContainer):
         logging_service
     )
 
+    outbox_relay = providers.Singleton(
+        OutboxRelay,
+        outbox_repository=outbox_repository,
+        kafka_producer=kafka_producer,
+        logging_service=logging_service,
+        batch_size=settings.OUTBOX_RELAY_BATCH_SIZE,
+        poll_interval_sec=settings.OUTBOX_RELAY_POLL_INTERVAL_MS / 1000,
+        retention=timedelta(hours=settings.OUTBOX_RETENTION_HOURS),
+        purge_interval_sec=settings.OUTBOX_PURGE_INTERVAL_SEC,
+    )
+
     # gRPC Clients
     user_service_client = providers.Singleton(
         UserServiceClient,
         logging_service=logging_service,
+        metrics_service=metrics_service,
         token=None,
     )
     course_service_client = providers.Singleton(
         CourseServiceClient,
         logging_service=logging_service,
+        metrics_service=metrics_service,
         token=None,
     )
     session_service_client = providers.Singleton(
         SessionServiceClient,
         logging_service=logging_service,
+        metrics_service=metrics_service,
         token=None,
     )
 
@@ -123,6 +190,9 @@ class Container(containers.DeclarativeContainer):
         AuthGuard,
         user_service_client=user_service_client,
         logging_service=logging_service,
+        metrics_service=metrics_service,
+        token_cache=(
+            auth_token_cache if settings.AUTH_TOKEN_CACHE_MAX_ENTRIES > 0 else None),
     )
 
     # Use Cases
@@ -130,11 +200,16 @@ class Container(containers.DeclarativeContainer):
         PlaceOrderUseCase,
         order_repository=order_repository,
         kafka_producer=kafka_producer,
+        outbox_repository=outbox_repository,
         user_service_client=user_service_client,
         course_service_client=course_service_client,
         redis=redis_client,
         logging_service=logging_service,
         metrics_service=metrics_service,
+        price_snapshot=course_price_snapshot,
+        price_fetch_lease_ms=(
+            settings.COURSE_PRICE_FETCH_LEASE_MS
+            if settings.COURSE_PRICE_FETCH_LEASE_ENABLED else None),
     )
     get_order_use_case = providers.Factory(
         GetOrderUseCase,
@@ -160,6 +235,33 @@ class Container(containers.DeclarativeContainer):
         logging_service=logging_service,
         metrics_service=metrics_service,
     )
+    get_order_status_use_case = providers.Factory(
+        GetOrderStatusUseCase,
+        order_repository=order_repository,
+        logging_service=logging_service,
+        metrics_service=metrics_service,
+    )
+    watch_order_status_use_case = providers.Factory(
+        WatchOrderStatusUseCase,
+        order_repository=order_repository,
+        status_notifier=order_status_notifier,
+        logging_service=logging_service,
+        metrics_service=metrics_service,
+        max_watch_sec=settings.ORDER_STATUS_WATCH_MAX_SEC,
+    )
+    stream_orders_use_case = providers.Factory(
+        StreamOrdersUseCase,
+        order_repository=order_repository,
+        logging_service=logging_service,
+        metrics_service=metrics_service,
+        batch_size=settings.ORDER_STREAM_BATCH_SIZE,
+    )
+    batch_get_orders_use_case = providers.Factory(
+        BatchGetOrdersUseCase,
+        order_repository=order_repository,
+        logging_service=logging_service,
+        metrics_service=metrics_service,
+    )
     payment_initiated_handler = providers.Factory(
         OrderPaymentInitiatedUseCase,
         order_repository=order_repository,
@@ -172,6 +274,7 @@ class Container(containers.DeclarativeContainer):
         OrderSuccessUseCase,
         order_repository=order_repository,
         kafka_producer=kafka_producer,
+        outbox_repository=outbox_repository,
         redis=redis_client,
         logging_service=logging_service,
         metrics_service=metrics_service,
@@ -180,6 +283,7 @@ class Container(containers.DeclarativeContainer):
         OrderFailedUseCase,
         order_repository=order_repository,
         kafka_producer=kafka_producer,
+        outbox_repository=outbox_repository,
         redis=redis_client,
         logging_service=logging_service,
         metrics_service=metrics_service,
@@ -205,6 +309,7 @@ class Container(containers.DeclarativeContainer):
         HandleOrderTimeoutUseCase,
         order_repository=order_repository,
         kafka_producer=kafka_producer,
+        outbox_repository=outbox_repository,
         redis=redis_client,
         logging_service=logging_service,
         metrics_service=metrics_service,
@@ -213,7 +318,15 @@ class Container(containers.DeclarativeContainer):
         ExpireOrderUseCase,
         order_repository=order_repository,
         kafka_producer=kafka_producer,
+        outbox_repository=outbox_repository,
+        redis=redis_client,
+        logging_service=logging_service,
+        metrics_service=metrics_service,
+    )
+    course_price_sync_handler = providers.Factory(
+        SyncCoursePriceUseCase,
         redis=redis_client,
+        price_snapshot=course_price_snapshot,
         logging_service=logging_service,
         metrics_service=metrics_service,
     )
@@ -227,6 +340,7 @@ class Container(containers.DeclarativeContainer):
         order_success_handler=order_success_handler,
         order_failed_handler=order_failed_handler,
         order_timeout_handler=order_timeout_handler,
+        course_price_sync_handler=course_price_sync_handler,
         kafka_producer=kafka_producer,
         metrics_service=metrics_service,
         redis=redis_client,
@@ -1,19 +1,54 @@
+import hashlib
+import time
+
 from src.application.interfaces.logging_interface import ILoggingService
+from src.application.interfaces.metrics_interface import IMetricsService
 from src.application.interfaces.auth_guard_interface import IAuthGuard
 from src.application.interfaces.grpc_client_interface import IUserServiceClient
 from jose import jwt
 from jose.exceptions import JWTError
 from src.infrastructure.config.settings import settings
+from src.shared.utils.ttl_cache import TTLCache
 import logging
 
 
 class AuthGuard(IAuthGuard):
-    def __init__(self, user_service_client: IUserServiceClient, logging_service: ILoggingService):
+    """
+    Verifies HS256 JWTs. With a `token_cache`, a verified token's claims are kept
+    under its SHA-256 digest until its `exp` (capped at the cache TTL), so a client
+    reusing a token pays for signature verification once rather than on every call.
+    `exp` is re-checked on every hit, so a cached token is still rejected once it
+    expires. Failed verifications are never cached.
+    """
+
+    def __init__(
+        self,
+        user_service_client: IUserServiceClient,
+        logging_service: ILoggingService,
+        metrics_service: IMetricsService,
+        token_cache: TTLCache[bytes, tuple[dict, float | None]] | None = None,
+    ):
         self.user_service_client = user_service_client
         self.logger = logging_service.get_logger("AuthGuard")
+        self.metrics = metrics_service
         self.secret_key = settings.JWT_SECRET
+        self._token_cache = token_cache
 
     async def validate_token(self, token: str | bytes) -> dict:
+        digest = None
+        if self._token_cache is not None:
+            raw = token.encode() if isinstance(token, str) else token
+            digest = hashlib.sha256(raw).digest()
+            cached = self._token_cache.get(digest)
+            if cached is not None:
+                user_info, exp = cached
+                if exp is None or exp > time.time():
+                    self.metrics.cache_hits(type="jwt")
+                    return dict(user_info)
+                # Expired while cached; jwt.decode below rejects it
+                self._token_cache.delete(digest)
+            self.metrics.cache_misses(type="jwt")
+
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=["HS256"])
             user_id = payload.get("sub")
@@ -21,11 +56,14 @@ class AuthGuard(IAuthGuard):
                 self.logger.error("Invalid JWT token: missing 'sub' claim")
                 raise ValueError("Invalid JWT token")
 
-            return {
+            user_info = {
                 "user_id": user_id,
                 "role": payload.get("role"),
 
             }
+            if digest is not None:
+                self._cache_claims(digest, user_info, payload.get("exp"))
+            return dict(user_info)
 
             # user_info = await self.user_service_client.get_user(user_id)
             # if user_info["user_id"] != user_id:
@@ -39,6 +77,16 @@ class AuthGuard(IAuthGuard):
             self.logger.error(f"Authentication failed: {str(e)}")
             raise
 
+    def _cache_claims(self, digest: bytes, user_info: dict, exp) -> None:
+        ttl_sec = self._token_cache.ttl_sec
+        if exp is not None:
+            exp = float(exp)
+            # jwt.decode has already rejected expired tokens, but exp may be a
+            # fraction of a second away
+            ttl_sec = min(ttl_sec, exp - time.time())
+        if ttl_sec > 0:
+            self._token_cache.set(digest, (user_info, exp), ttl_sec=ttl_sec)
+
     async def authorize(self, user_info: dict, required_role: str = "STUDENT") -> None:
         role = user_info.get("role")
         if role != required_role:
@@ -0,0 +1,353 @@
+import asyncio
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Sequence, Type, TypeVar
+
+import grpc
+from grpc import aio
+
+from src.application.interfaces.logging_interface import ILoggingService
+from src.application.interfaces.metrics_interface import IMetricsService
+from src.domain.exceptions.exceptions import DeadlineExceededException, UpstreamSaturatedException
+from src.infrastructure.config.settings import settings
+from src.shared.utils.adaptive_limiter import AdaptiveConcurrencyLimiter
+from src.shared.utils.bulkhead import Bulkhead
+from src.shared.utils.rolling_quantile import RollingQuantile
+
+S = TypeVar("S")
+R = TypeVar("R")
+
+_UNHEALTHY_STATES = (
+    grpc.ChannelConnectivity.TRANSIENT_FAILURE,
+    grpc.ChannelConnectivity.SHUTDOWN,
+)
+
+# Outcomes that mean the upstream is struggling, as opposed to rejecting the request
+_OVERLOAD_CODES = (
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+)
+
+
+def is_upstream_failure(exc_type: type, exc: BaseException) -> bool:
+    """Circuit breaker failure predicate: a bulkhead rejection says nothing about the upstream."""
+    return not issubclass(exc_type, UpstreamSaturatedException)
+
+
+def grpc_target(address: str, default_port: int) -> str:
+    """Returns host:port, adding default_port when the configured address has none."""
+    return address if ":" in address else f"{address}:{default_port}"
+
+
+class _ManagedChannel:
+    def __init__(self, index: int, channel: aio.Channel) -> None:
+        self.index = index
+        self.channel = channel
+        self.state = grpc.ChannelConnectivity.IDLE
+        self.in_flight = 0
+        self.stubs: dict[type, Any] = {}
+        self.watcher: asyncio.Task | None = None
+
+
+class _HedgeState:
+    # Hedge budget: every call earns GRPC_HEDGING_MAX_RATIO of a hedge, up to a burst
+    MAX_BUDGET = 10.0
+
+    def __init__(self) -> None:
+        self.latency = RollingQuantile(
+            quantile=settings.GRPC_HEDGING_QUANTILE,
+            min_samples=settings.GRPC_HEDGING_MIN_SAMPLES,
+        )
+        self._budget = 0.0
+
+    def delay(self) -> float | None:
+        """Seconds to wait before hedging, or None while there is no latency estimate."""
+        latency = self.latency.value()
+        if latency is None:
+            return None
+        return max(latency, settings.GRPC_HEDGING_MIN_DELAY_MS / 1000)
+
+    def add_budget(self) -> None:
+        self._budget = min(self.MAX_BUDGET, self._budget + settings.GRPC_HEDGING_MAX_RATIO)
+
+    def take_budget(self) -> bool:
+        if self._budget < 1:
+            return False
+        self._budget -= 1
+        return True
+
+
+class ChannelManager:
+    """
+    Keeps `size` long-lived HTTP/2 channels to one upstream and spreads calls across
+    them round-robin. Each channel multiplexes any number of concurrent streams, so
+    callers never wait for a channel and no channel is ever created per call.
+
+    Channels are opened on first use (so they bind to the running event loop), each on
+    its own subchannel pool so every channel holds a separate TCP connection, with
+    HTTP/2 keepalive pings to detect dead peers between calls. A watcher task per
+    channel tracks its connectivity state; channels in TRANSIENT_FAILURE are skipped
+    while any other channel is usable, and gRPC itself handles reconnection.
+
+    Interceptors are installed on the channels once, and stubs are cached per channel,
+    so a call costs one round-robin step and a dict lookup.
+
+    Each upstream method also gets its own Bulkhead, so one slow method can tie up at
+    most its adaptive limit of callers instead of every coroutine in the process. The
+    limit shrinks when calls run past UPSTREAM_BULKHEAD_LATENCY_TARGET_MS or fail with
+    an overload status, and grows back while calls are fast and the limit is in use.
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        target: str,
+        logging_service: ILoggingService,
+        metrics_service: IMetricsService,
+        interceptors: Sequence[aio.ClientInterceptor] = (),
+        size: int = settings.GRPC_CLIENT_CHANNELS_PER_UPSTREAM,
+    ) -> None:
+        self.service_name = service_name
+        self.target = target
+        self.size = max(1, size)
+        self._interceptors = list(interceptors)
+        self._logger = logging_service.get_logger("ChannelManager")
+        self._metrics = metrics_service
+        self._channels: list[_ManagedChannel] = []
+        self._bulkheads: dict[str, Bulkhead] = {}
+        self._hedging: dict[str, _HedgeState] = {}
+        self._next = itertools.count()
+        self._options = [
+            ("grpc.keepalive_time_ms", settings.GRPC_CLIENT_KEEPALIVE_TIME_MS),
+            ("grpc.keepalive_timeout_ms", settings.GRPC_CLIENT_KEEPALIVE_TIMEOUT_MS),
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.max_pings_without_data", 0),
+            # Without a local pool, channels with identical arguments share one
+            # subchannel and therefore one TCP connection
+            ("grpc.use_local_subchannel_pool", 1),
+        ]
+
+    @asynccontextmanager
+    async def stub(self, stub_cls: Type[S], method: str) -> AsyncIterator[S]:
+        """
+        Admits the call through `method`'s bulkhead, then yields a cached `stub_cls`
+        bound to the next usable channel, counting the call as in flight on that
+        channel until the block exits.
+        Raises UpstreamSaturatedException when the bulkhead cannot admit the call.
+        """
+        bulkhead = await self._admit(method)
+        async with self._lease(self._pick(), stub_cls, bulkhead) as stub:
+            yield stub
+
+    async def call(
+        self,
+        stub_cls: Type[S],
+        method: str,
+        invoke: Callable[[S], Awaitable[R]],
+        hedge: bool = False,
+    ) -> R:
+        """
+        Runs `invoke(stub)` like `stub()` does. With `hedge=True` (only for idempotent
+        reads) and GRPC_HEDGING_ENABLED, a call still running after the method's
+        GRPC_HEDGING_QUANTILE latency gets a second attempt on another channel; the
+        first successful response wins and the other attempt is cancelled.
+
+        Hedges are capped at GRPC_HEDGING_MAX_RATIO of calls per method, and are only
+        sent when the bulkhead has a free slot, so hedging never queues or adds load
+        to an upstream that is already saturated.
+        """
+        if not (hedge and settings.GRPC_HEDGING_ENABLED):
+            async with self.stub(stub_cls, method) as stub:
+                return await invoke(stub)
+
+        hedging = self._hedging.get(method)
+        if hedging is None:
+            hedging = self._hedging[method] = _HedgeState()
+        hedging.add_budget()
+
+        bulkhead = await self._admit(method)
+        delay = hedging.delay()
+        primary_channel = self._pick()
+        primary = asyncio.create_task(
+            self._attempt(primary_channel, stub_cls, bulkhead, invoke, hedging, delay))
+        attempts = {primary}
+        try:
+            if delay is not None:
+                await asyncio.wait(attempts, timeout=delay)
+            if primary.done() or delay is None:
+                self._metrics.upstream_hedges(self.service_name, method, "not_needed")
+                return await primary
+
+            if not hedging.take_budget() or (bulkhead is not None and not bulkhead.try_acquire()):
+                self._metrics.upstream_hedges(self.service_name, method, "throttled")
+                return await primary
+
+            hedged = asyncio.create_task(self._attempt(
+                self._pick(exclude=primary_channel), stub_cls, bulkhead, invoke, hedging, delay))
+            attempts.add(hedged)
+            pending = set(attempts)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None:
+                        self._metrics.upstream_hedges(
+                            self.service_name, method, "won" if attempt is hedged else "lost")
+                        return attempt.result()
+            # Both attempts failed; report the original call's error
+            self._metrics.upstream_hedges(self.service_name, method, "lost")
+            return primary.result()
+        finally:
+            for attempt in attempts:
+                if not attempt.done():
+                    attempt.cancel()
+
+    async def _attempt(
+        self,
+        managed: _ManagedChannel,
+        stub_cls: Type[S],
+        bulkhead: Optional[Bulkhead],
+        invoke: Callable[[S], Awaitable[R]],
+        hedging: _HedgeState,
+        delay: Optional[float],
+    ) -> R:
+        """
+        Every attempt feeds the latency estimate, not just the ones that succeed, or the
+        estimate would only ever see fast survivors and hedge more and more. A cancelled
+        attempt would have taken at least the hedge delay, so it counts as that long.
+        """
+        start = time.perf_counter()
+        cancelled = False
+        try:
+            async with self._lease(managed, stub_cls, bulkhead) as stub:
+                return await invoke(stub)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            if cancelled and delay is not None:
+                elapsed = max(elapsed, delay)
+            hedging.latency.observe(elapsed)
+
+    async def _admit(self, method: str) -> Optional[Bulkhead]:
+        if not settings.UPSTREAM_BULKHEAD_ENABLED:
+            return None
+        bulkhead = self._bulkhead(method)
+        try:
+            await bulkhead.acquire()
+        except UpstreamSaturatedException:
+            self._metrics.upstream_rejections(self.service_name, method)
+            raise
+        return bulkhead
+
+    @asynccontextmanager
+    async def _lease(
+        self,
+        managed: _ManagedChannel,
+        stub_cls: Type[S],
+        bulkhead: Optional[Bulkhead],
+    ) -> AsyncIterator[S]:
+        """Yields the channel's cached stub; frees the bulkhead slot taken for it on exit."""
+        stub = managed.stubs.get(stub_cls)
+        if stub is None:
+            stub = managed.stubs[stub_cls] = stub_cls(managed.channel)
+        managed.in_flight += 1
+        self._metrics.upstream_in_flight(self.service_name, 1)
+        start = time.perf_counter()
+        overloaded = False
+        cancelled = False
+        try:
+            yield stub
+        except aio.AioRpcError as e:
+            overloaded = e.code() in _OVERLOAD_CODES
+            raise
+        except (DeadlineExceededException, asyncio.TimeoutError):
+            overloaded = True
+            raise
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            managed.in_flight -= 1
+            self._metrics.upstream_in_flight(self.service_name, -1)
+            if bulkhead is not None:
+                if cancelled:
+                    bulkhead.cancel()
+                else:
+                    bulkhead.release(time.perf_counter() - start, overloaded=overloaded)
+
+    def _bulkhead(self, method: str) -> Bulkhead:
+        bulkhead = self._bulkheads.get(method)
+        if bulkhead is None:
+            limiter = AdaptiveConcurrencyLimiter(
+                initial_limit=settings.UPSTREAM_BULKHEAD_INITIAL_LIMIT,
+                max_limit=settings.UPSTREAM_BULKHEAD_MAX_LIMIT,
+                latency_target_sec=settings.UPSTREAM_BULKHEAD_LATENCY_TARGET_MS / 1000,
+            )
+            bulkhead = self._bulkheads[method] = Bulkhead(
+                f"{self.service_name}.{method}",
+                limiter,
+                max_queue=settings.UPSTREAM_BULKHEAD_MAX_QUEUE,
+                queue_timeout_sec=settings.UPSTREAM_BULKHEAD_QUEUE_TIMEOUT_MS / 1000,
+                on_change=lambda b: self._metrics.upstream_bulkhead(
+                    self.service_name, method, b.limiter.limit, b.limiter.in_flight, b.queue_depth),
+            )
+        return bulkhead
+
+    def _pick(self, exclude: Optional[_ManagedChannel] = None) -> _ManagedChannel:
+        if not self._channels:
+            self._open()
+        start = next(self._next)
+        for offset in range(self.size):
+            managed = self._channels[(start + offset) % self.size]
+            if managed.state not in _UNHEALTHY_STATES and (managed is not exclude or self.size == 1):
+                return managed
+        # Every channel is failing; let the call surface UNAVAILABLE (or wait_for_ready)
+        return self._channels[start % self.size]
+
+    def _open(self) -> None:
+        for index in range(self.size):
+            channel = aio.insecure_channel(
+                self.target, options=self._options, interceptors=self._interceptors)
+            managed = _ManagedChannel(index, channel)
+            managed.watcher = asyncio.get_running_loop().create_task(self._watch(managed))
+            self._channels.append(managed)
+        self._publish_states()
+        self._logger.info(
+            f"Opened {self.size} channels to {self.service_name} at {self.target}")
+
+    async def _watch(self, managed: _ManagedChannel) -> None:
+        channel = managed.channel
+        state = channel.get_state(try_to_connect=True)
+        while True:
+            if state != managed.state:
+                if state in _UNHEALTHY_STATES:
+                    self._logger.warning(
+                        f"Channel {managed.index} to {self.service_name} is {state.name}")
+                elif managed.state in _UNHEALTHY_STATES:
+                    self._logger.info(
+                        f"Channel {managed.index} to {self.service_name} recovered ({state.name})")
+                managed.state = state
+                self._publish_states()
+            if state == grpc.ChannelConnectivity.SHUTDOWN:
+                return
+            await channel.wait_for_state_change(state)
+            state = channel.get_state(try_to_connect=False)
+
+    def _publish_states(self) -> None:
+        for state in grpc.ChannelConnectivity:
+            count = sum(1 for managed in self._channels if managed.state == state)
+            self._metrics.upstream_channels(self.service_name, state.name.lower(), count)
+
+    async def close(self) -> None:
+        channels, self._channels = self._channels, []
+        for managed in channels:
+            if managed.watcher is not None:
+                managed.watcher.cancel()
+            await managed.channel.close()
+        for state in grpc.ChannelConnectivity:
+            self._metrics.upstream_channels(self.service_name, state.name.lower(), 0)
+        if channels:
+            self._logger.info(f"Closed all channels to {self.service_name} at {self.target}")
@@ -1,87 +1,87 @@
 import grpc
 from grpc import aio
-from typing import Any, cast
 
 from typing import TypedDict, List
-from src.infrastructure.grpc.generated.course.types.enrollment_pb2 import CheckCourseEnrollmentRequest
-from src.infrastructure.grpc.generated.course.types.course_pb2 import GetCourseRequest, GetCoursesByIdsRequest
+from src.infrastructure.grpc.generated.course.types.enrollment_pb2 import CheckCourseEnrollmentRequest, GetEnrollmentsByUserRequest
+from src.infrastructure.grpc.generated.course.common_pb2 import Pagination
+from src.infrastructure.grpc.generated.course.types.course_pb2 import GetCoursesByIdsRequest
 from src.infrastructure.config.settings import settings
 from src.application.interfaces.logging_interface import ILoggingService
+from src.domain.exceptions.exceptions import CourseNotFoundException, UpstreamSaturatedException
+from src.application.interfaces.metrics_interface import IMetricsService
 from src.infrastructure.grpc.interceptors.client_inerceptors import ClientAuthInterceptor, ClientTracingInterceptor
 from src.infrastructure.grpc.generated.course_service_pb2_grpc import CourseServiceStub, EnrollmentServiceStub
 from src.application.interfaces.grpc_client_interface import CourseEnrollmentResult, CourseInfo, ICourseServiceClient
-from src.infrastructure.grpc.clients.channel_pool import ChannelPool
+from src.infrastructure.grpc.clients.channel_manager import ChannelManager, grpc_target, is_upstream_failure
+from src.shared.utils.data_loader import DataLoader
 import logging
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
+from src.shared.utils.deadline import stop_on_deadline, timeout_for
 from circuitbreaker import circuit
 
 
 class CourseServiceClient(ICourseServiceClient):
-    def __init__(self, logging_service: ILoggingService, token: str | None = None):
-        self.pool = ChannelPool(
-            settings.COURSE_SERVICE_NAME, settings.COURSE_SERVICE_GRPC, logging_service=logging_service, max_size=10)
+    ENROLLMENTS_PAGE_SIZE = 100
+
+    def __init__(
+        self,
+        logging_service: ILoggingService,
+        metrics_service: IMetricsService,
+        token: str | None = None,
+    ):
         self.logger = logging_service.get_logger("CourseServiceClient")
         self.interceptors = [
             ClientTracingInterceptor(),
             # ClientAuthInterceptor(token) if token else None,
         ]
         self.interceptors = [i for i in self.interceptors if i is not None]
+        self.channels = ChannelManager(
+            settings.COURSE_SERVICE_NAME,
+            grpc_target(settings.COURSE_SERVICE_GRPC, settings.COURSE_SERVICE_PORT),
+            logging_service=logging_service,
+            metrics_service=metrics_service,
+            interceptors=self.interceptors,
+        )
+        self._course_loader: DataLoader[str, CourseInfo] = DataLoader(
+            self._load_courses,
+            max_batch_size=settings.GRPC_BATCH_MAX_SIZE,
+            batch_window_sec=settings.GRPC_BATCH_WINDOW_MS / 1000,
+        )
 
-    @circuit(failure_threshold=5, recovery_timeout=30)
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
     async def get_course(self, course_id: str) -> CourseInfo:
-        channel = await self.pool.acquire()
-        try:
-            from typing import Any, cast
-            intercept_fn = getattr(aio, "intercept_channel", None)
-            if callable(intercept_fn):
-                intercepted = cast(Any, intercept_fn)(
-                    channel, *self.interceptors)
-            else:
-                intercepted = channel
-            stub = CourseServiceStub(intercepted)
-            request = GetCourseRequest(course_id=course_id)
-            response = await stub.GetCourse(request)
-            has_error = False
-            err = getattr(response, "error", None)
-            err_code = getattr(err, "code", "") if err is not None else ""
-            err_msg = getattr(
-                err, "message", "") if err is not None else ""
-            has_error = bool(err_code or err_msg)
+        """
+        Resolves a single course through the shared loader, so concurrent lookups from
+        different requests go out as one GetCoursesByIds call.
+        """
+        course = await self._course_loader.load(course_id)
+        if course is None:
+            self.logger.error(f"Failed to get course {course_id}: not found")
+            raise CourseNotFoundException(f"Course {course_id} not found")
+        return course
 
-            if has_error:
-                err = getattr(response, "error", None)
-                self.logger.error(
-                    f"Failed to get course {course_id}: {getattr(err, 'message', '')}")
-                raise ValueError(getattr(err, "message", "Unknown error"))
-            
-            return {"course_id": response.course.id, "instructor_id": response.course.instructor_id, "price": response.course.price, "discount_price": getattr(response.course, "discount_price"), "status": getattr(response.course, "status") }
-        except Exception as e:
-            self.logger.error(f"Failed to get course {course_id}: {str(e)}")
-            raise
-        finally:
-            await self.pool.release(channel)
-            
-            
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
+    async def _load_courses(self, course_ids: list[str]) -> dict[str, CourseInfo]:
+        courses = await self.get_courses_by_ids(course_ids)
+        return {course["course_id"]: course for course in courses}
+
+    @retry(
+        stop=(stop_after_attempt(3) | stop_on_deadline),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        retry=retry_if_not_exception_type(UpstreamSaturatedException),
+    )
     async def is_user_enrolled_in_course(self, user_id: str, course_id: str) -> CourseEnrollmentResult:
         """
         Checks if a user is enrolled in a specific course using gRPC.
-        Handles channel interception, logging, and error propagation.
+        Handles logging and error propagation.
         Returns: dict with 'is_enrolled': bool.
         """
-        channel = await self.pool.acquire()
         try:
-            
-
-            # Proper channel interception for aio/normal compatibility
-            intercept_fn = getattr(aio, "intercept_channel", None)
-            intercepted_channel = cast(Any, intercept_fn)(
-                channel, *self.interceptors) if callable(intercept_fn) else channel
-
-            stub = EnrollmentServiceStub(intercepted_channel)
             request = CheckCourseEnrollmentRequest(course_id=course_id, user_id=user_id)
-            response = await stub.CheckCourseEnrollment(request)
+            response = await self.channels.call(
+                EnrollmentServiceStub,
+                "CheckCourseEnrollment",
+                lambda stub: stub.CheckCourseEnrollment(request, timeout=timeout_for(settings.GRPC_CLIENT_TIMEOUT_SEC)),
+                hedge=True,
+            )
 
             # Unified error detection
             has_error = False
@@ -106,21 +106,22 @@ class CourseServiceClient(ICourseServiceClient):
                 f"Error checking enrollment for user {user_id} in course {course_id}: {str(e)}"
             )
             raise
-        finally:
-            await self.pool.release(channel)
 
-    @circuit(failure_threshold=5, recovery_timeout=30)
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
+    @circuit(failure_threshold=5, recovery_timeout=30, expected_exception=is_upstream_failure)
+    @retry(
+        stop=(stop_after_attempt(3) | stop_on_deadline),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        retry=retry_if_not_exception_type(UpstreamSaturatedException),
+    )
     async def get_courses_by_ids(self, course_ids: list[str]) -> List[CourseInfo]:
-        channel = await self.pool.acquire()
         try:
-            intercept_fn = getattr(aio, "intercept_channel", None)
-            intercepted_channel = cast(Any, intercept_fn)(
-                channel, *self.interceptors) if callable(intercept_fn) else channel
-
-            stub = CourseServiceStub(intercepted_channel)
             request = GetCoursesByIdsRequest(course_ids=course_ids)
-            response = await stub.GetCoursesByIds(request)
+            response = await self.channels.call(
+                CourseServiceStub,
+                "GetCoursesByIds",
+                lambda stub: stub.GetCoursesByIds(request, timeout=timeout_for(settings.GRPC_CLIENT_TIMEOUT_SEC)),
+                hedge=True,
+            )
             has_error = False
             err = None
             err_msg = ''
@@ -152,8 +153,58 @@ class CourseServiceClient(ICourseServiceClient):
             self.logger.error(
                 f"Failed to get {len(course_ids)} courses with: {str(e)}")
             raise
-        finally:
-            await self.pool.release(channel)
+
+    @circuit(failure_threshold=5, recovery_timeout=30, expected_exception=is_upstream_failure)
+    @retry(
+        stop=(stop_after_attempt(3) | stop_on_deadline),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        retry=retry_if_not_exception_type(UpstreamSaturatedException),
+    )
+    async def get_user_enrolled_course_ids(self, user_id: str) -> set[str]:
+        """
+        Fetches the user's full enrollment set through GetEnrollmentsByUser, walking
+        pages of ENROLLMENTS_PAGE_SIZE until the reported total is reached (or a page
+        comes back empty). Soft-deleted enrollments do not count.
+        Returns: set of enrolled course ids.
+        """
+        try:
+            course_ids: set[str] = set()
+            page = 1
+            fetched = 0
+            while True:
+                request = GetEnrollmentsByUserRequest(
+                    user_id=user_id,
+                    pagination=Pagination(page=page, page_size=self.ENROLLMENTS_PAGE_SIZE),
+                )
+                async with self.channels.stub(EnrollmentServiceStub, "GetEnrollmentsByUser") as stub:
+                    response = await stub.GetEnrollmentsByUser(request, timeout=timeout_for(settings.GRPC_CLIENT_TIMEOUT_SEC))
+
+                err = getattr(response, "error", None)
+                err_code = getattr(err, "code", "") if err is not None else ""
+                err_msg = getattr(err, "message", "") if err is not None else ""
+                if err_code or err_msg:
+                    self.logger.error(
+                        f"Failed to get enrollments for user {user_id}: {err_msg}")
+                    raise ValueError(err_msg or "Unknown error")
+
+                data = getattr(response, "enrollments", None)
+                enrollments = list(getattr(data, "enrollments", []) or [])
+                total = int(getattr(data, "total", 0) or 0)
+                for enrollment in enrollments:
+                    if enrollment.HasField("deleted_at") and enrollment.deleted_at:
+                        continue
+                    course_ids.add(enrollment.course_id)
+
+                fetched += len(enrollments)
+                if not enrollments or fetched >= total:
+                    break
+                page += 1
+
+            return course_ids
+        except Exception as e:
+            self.logger.error(
+                f"Error fetching enrollments for user {user_id}: {str(e)}")
+            raise
 
     async def close(self):
-        await self.pool.close()
+        await self.channels.close()
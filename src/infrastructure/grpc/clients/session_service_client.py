@@ -3,37 +3,51 @@ from grpc import aio
 
 from src.infrastructure.config.settings import settings
 from src.application.interfaces.logging_interface import ILoggingService
+from src.domain.exceptions.exceptions import UpstreamSaturatedException
+from src.application.interfaces.metrics_interface import IMetricsService
 from src.infrastructure.grpc.interceptors.client_inerceptors import ClientAuthInterceptor, ClientTracingInterceptor
 from ..generated.session_service_pb2 import GetSessionRequest, GetAvailableSlotsRequest
 from ..generated.session_service_pb2_grpc import SessionServiceStub
 from src.application.interfaces.grpc_client_interface import ISessionServiceClient
-from src.infrastructure.grpc.clients.channel_pool import ChannelPool
+from src.infrastructure.grpc.clients.channel_manager import ChannelManager, grpc_target, is_upstream_failure
 import logging
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
+from src.shared.utils.deadline import stop_on_deadline, timeout_for
 from circuitbreaker import circuit
 
 
 class SessionServiceClient(ISessionServiceClient):
-    def __init__(self, logging_service: ILoggingService, token: str | None = None):
-        self.pool = ChannelPool(
-            settings.SESSION_SERVICE_NAME, settings.SESSION_SERVICE_GRPC, max_size=10, logging_service=logging_service)
+    def __init__(
+        self,
+        logging_service: ILoggingService,
+        metrics_service: IMetricsService,
+        token: str | None = None,
+    ):
         self.logger = logging_service.get_logger("SessionServiceClient")
         self.interceptors = [
             ClientTracingInterceptor(),
             ClientAuthInterceptor(token) if token else None,
         ]
         self.interceptors = [i for i in self.interceptors if i is not None]
+        self.channels = ChannelManager(
+            settings.SESSION_SERVICE_NAME,
+            grpc_target(settings.SESSION_SERVICE_GRPC, settings.SESSION_SERVICE_PORT),
+            logging_service=logging_service,
+            metrics_service=metrics_service,
+            interceptors=self.interceptors,
+        )
 
-    @circuit(failure_threshold=5, recovery_timeout=30)
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
+    @circuit(failure_threshold=5, recovery_timeout=30, expected_exception=is_upstream_failure)
+    @retry(
+        stop=(stop_after_attempt(3) | stop_on_deadline),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        retry=retry_if_not_exception_type(UpstreamSaturatedException),
+    )
     async def get_session(self, session_id: str) -> dict:
-        channel = await self.pool.acquire()
         try:
-            intercepted_channel = grpc.intercept_channel(
-                channel, *self.interceptors)
-            stub = SessionServiceStub(intercepted_channel)
             request = GetSessionRequest(session_id=session_id)
-            response = await stub.GetSession(request)
+            async with self.channels.stub(SessionServiceStub, "GetSession") as stub:
+                response = await stub.GetSession(request, timeout=timeout_for(settings.GRPC_CLIENT_TIMEOUT_SEC))
             if response.error:
                 self.logger.error(
                     f"Failed to get session {session_id}: {response.error}")
@@ -42,19 +56,18 @@ class SessionServiceClient(ISessionServiceClient):
         except Exception as e:
             self.logger.error(f"Failed to get session {session_id}: {str(e)}")
             raise
-        finally:
-            await self.pool.release(channel)
 
-    @circuit(failure_threshold=5, recovery_timeout=30)
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
+    @circuit(failure_threshold=5, recovery_timeout=30, expected_exception=is_upstream_failure)
+    @retry(
+        stop=(stop_after_attempt(3) | stop_on_deadline),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        retry=retry_if_not_exception_type(UpstreamSaturatedException),
+    )
     async def get_available_slots(self, session_id: str) -> int:
-        channel = await self.pool.acquire()
         try:
-            intercepted_channel = grpc.intercept_channel(
-                channel, *self.interceptors)
-            stub = SessionServiceStub(intercepted_channel)
             request = GetAvailableSlotsRequest(session_id=session_id)
-            response = await stub.GetAvailableSlots(request)
+            async with self.channels.stub(SessionServiceStub, "GetAvailableSlots") as stub:
+                response = await stub.GetAvailableSlots(request, timeout=timeout_for(settings.GRPC_CLIENT_TIMEOUT_SEC))
             if response.error:
                 self.logger.error(
                     f"Failed to get available slots for session {session_id}: {response.error}")
@@ -64,8 +77,6 @@ class SessionServiceClient(ISessionServiceClient):
             self.logger.error(
                 f"Failed to get available slots for session {session_id}: {str(e)}")
             raise
-        finally:
-            await self.pool.release(channel)
 
     async def close(self):
-        await self.pool.close()
+        await self.channels.close()
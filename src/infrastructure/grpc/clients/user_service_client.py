@@ -3,68 +3,91 @@ from grpc import aio
 
 from src.infrastructure.config.settings import settings
 from src.application.interfaces.logging_interface import ILoggingService
+from src.domain.exceptions.exceptions import UpstreamSaturatedException
+from src.application.interfaces.metrics_interface import IMetricsService
 from src.application.interfaces.grpc_client_interface import IUserServiceClient
 from src.infrastructure.grpc.interceptors.client_inerceptors import ClientAuthInterceptor, ClientTracingInterceptor
-from ..generated.user_service_pb2 import GetUserRequest
+from typing import List
+from ..generated.user_service_pb2 import GetUsersByIdsRequest
 from ..generated.user_service_pb2_grpc import UserServiceStub
-from src.infrastructure.grpc.clients.channel_pool import ChannelPool
+from src.infrastructure.grpc.clients.channel_manager import ChannelManager, grpc_target, is_upstream_failure
+from src.shared.utils.data_loader import DataLoader
 import logging
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
+from src.shared.utils.deadline import stop_on_deadline, timeout_for
 from circuitbreaker import circuit
 
 
 class UserServiceClient(IUserServiceClient):
-    def __init__(self, logging_service: ILoggingService, token: str | None = None):
-        self.pool = ChannelPool(settings.USER_SERVICE_NAME, settings.USER_SERVICE_GRPC,
-                                logging_service=logging_service, max_size=10)
+    def __init__(
+        self,
+        logging_service: ILoggingService,
+        metrics_service: IMetricsService,
+        token: str | None = None,
+    ):
         self.logger = logging_service.get_logger("UserServiceClient")
         self.interceptors = [
             ClientTracingInterceptor(),
             # ClientAuthInterceptor(token) if token else None,
         ]
         self.interceptors = [i for i in self.interceptors if i is not None]
+        self.channels = ChannelManager(
+            settings.USER_SERVICE_NAME,
+            grpc_target(settings.USER_SERVICE_GRPC, settings.USER_SERVICE_PORT),
+            logging_service=logging_service,
+            metrics_service=metrics_service,
+            interceptors=self.interceptors,
+        )
+        self._user_loader: DataLoader[str, dict] = DataLoader(
+            self._load_users,
+            max_batch_size=settings.GRPC_BATCH_MAX_SIZE,
+            batch_window_sec=settings.GRPC_BATCH_WINDOW_MS / 1000,
+        )
 
-    @circuit(failure_threshold=5, recovery_timeout=30)
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
-    async def get_user(self, user_id: str) -> dict:
-        channel = await self.pool.acquire()
+    async def get_user(self, user_id: str) -> dict | None:
+        """
+        Resolves a single user through the shared loader, so concurrent lookups from
+        different requests go out as one GetUsersByIds call.
+        Returns None when the user service does not know the id.
+        """
+        return await self._user_loader.load(user_id)
+
+    async def _load_users(self, user_ids: list[str]) -> dict[str, dict]:
+        users = await self.get_users_by_ids(user_ids)
+        return {user["user_id"]: user for user in users}
+
+    @circuit(failure_threshold=5, recovery_timeout=30, expected_exception=is_upstream_failure)
+    @retry(
+        stop=(stop_after_attempt(3) | stop_on_deadline),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        retry=retry_if_not_exception_type(UpstreamSaturatedException),
+    )
+    async def get_users_by_ids(self, user_ids: list[str]) -> List[dict]:
         try:
-            from typing import Any, cast
-            intercept_fn = getattr(aio, "intercept_channel", None)
-            if callable(intercept_fn):
-                intercepted = cast(Any, intercept_fn)(
-                    channel, *self.interceptors)
-            else:
-                intercepted = channel
-            stub = UserServiceStub(intercepted)
-            request = GetUserRequest(userId=user_id)
-            response = await stub.GetUser(request)
-            has_error = False
-            if hasattr(response, "HasField"):
-                try:
-                    # type: ignore[attr-defined]
-                    has_error = response.HasField("error")
-                except Exception:
-                    has_error = False
-            else:
-                err = getattr(response, "error", None)
-                err_code = getattr(err, "code", "") if err is not None else ""
-                err_msg = getattr(
-                    err, "message", "") if err is not None else ""
-                has_error = bool(err_code or err_msg)
+            request = GetUsersByIdsRequest(userIds=user_ids)
+            response = await self.channels.call(
+                UserServiceStub,
+                "GetUsersByIds",
+                lambda stub: stub.GetUsersByIds(request, timeout=timeout_for(settings.GRPC_CLIENT_TIMEOUT_SEC)),
+                hedge=True,
+            )
 
-            if has_error:
-                err = getattr(response, "error", None)
+            err = getattr(response, "error", None)
+            err_code = getattr(err, "code", "") if err is not None else ""
+            err_msg = getattr(err, "message", "") if err is not None else ""
+            if err_code or err_msg:
                 self.logger.error(
-                    f"Failed to fetch user with Id {user_id}: {getattr(err, 'message', '')}")
-                raise ValueError(getattr(err, "message", "Unknown error"))
+                    f"Failed to fetch {len(user_ids)} users: {err_msg}")
+                raise ValueError(err_msg or "Unknown error")
 
-            return {"user_id": getattr(response, "id", None), "role": getattr(response, "role", None)}
+            user_list = getattr(getattr(response, "success", None), "users", [])
+            return [
+                {"user_id": getattr(user, "id", None), "role": getattr(user, "role", None)}
+                for user in user_list
+            ]
         except Exception as e:
-            self.logger.error(f"Failed to verify user {user_id}: {str(e)}")
+            self.logger.error(f"Failed to fetch {len(user_ids)} users: {str(e)}")
             raise
-        finally:
-            await self.pool.release(channel)
 
     async def close(self):
-        await self.pool.close()
+        await self.channels.close()
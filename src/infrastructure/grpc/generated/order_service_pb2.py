@@ -14,7 +14,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13order_service.proto\x12\rorder_service\"~\n\x17GetRevenueStatsResponse\x12\x32\n\x07success\x18\x01 \x01(\x0b\x32\x1f.order_service.RevenueStatsDataH\x00\x12%\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x14.order_service.ErrorH\x00\x42\x08\n\x06result\".\n\x0cRevenueStats\x12\r\n\x05month\x18\x01 \x01(\x05\x12\x0f\n\x07revenue\x18\x02 \x01(\x01\"F\n\x10RevenueStatsData\x12\x32\n\rrevenue_stats\x18\x01 \x03(\x0b\x32\x1b.order_service.RevenueStats\"&\n\x16GetRevenueStatsRequest\x12\x0c\n\x04year\x18\x01 \x01(\x05\"S\n\x05\x45rror\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12+\n\x07\x64\x65tails\x18\x03 \x03(\x0b\x32\x1a.order_service.ErrorDetail\"-\n\x0b\x45rrorDetail\x12\r\n\x05\x66ield\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"2\n\x0eOrderItemsData\x12\x11\n\tcourse_id\x18\x01 \x01(\t\x12\r\n\x05price\x18\x02 \x01(\x02\"\x9c\x01\n\x12PaymentDetailsData\x12\x12\n\npayment_id\x18\x01 \x01(\t\x12\x10\n\x08provider\x18\x02 \x01(\t\x12\x1e\n\x11provider_order_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x16\n\x0epayment_status\x18\x04 \x01(\t\x12\x12\n\nupdated_at\x18\x05 \x01(\tB\x14\n\x12_provider_order_id\"w\n\tMoneyData\x12\r\n\x05total\x18\x01 \x01(\x02\x12\x10\n\x08\x63urrency\x18\x02 \x01(\t\x12\x10\n\x08\x64iscount\x18\x03 \x01(\x02\x12\x16\n\tsales_tax\x18\x06 \x01(\x02H\x00\x88\x01\x01\x12\x11\n\tsub_total\x18\x04 \x01(\x02\x42\x0c\n\n_sales_tax\"\x8d\x02\n\tOrderData\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12,\n\x05items\x18\n \x03(\x0b\x32\x1d.order_service.OrderItemsData\x12?\n\x0fpayment_details\x18\x0b \x01(\x0b\x32!.order_service.PaymentDetailsDataH\x00\x88\x01\x01\x12(\n\x06\x61mount\x18\x04 \x01(\x0b\x32\x18.order_service.MoneyData\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x12\n\ncreated_at\x18\x07 \x01(\t\x12\x12\n\nupdated_at\x18\x08 \x01(\tB\x12\n\x10_payment_details\"\xa4\x01\n\x11PlaceOrderSuccess\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\x12\n\ncourse_ids\x18\x03 \x03(\t\x12\x14\n\x0ctotal_amount\x18\x04 \x01(\x02\x12\x10\n\x08\x63urrency\x18\x05 \x01(\t\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x12\n\ncreated_at\x18\x07 \x01(\t\x12\x12\n\nupdated_at\x18\x08 \x01(\t\"\x9f\x01\n\x12\x42ookSessionSuccess\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\x12\n\nsession_id\x18\x03 \x01(\t\x12\x0e\n\x06\x61mount\x18\x04 \x01(\x02\x12\x10\n\x08\x63urrency\x18\x05 \x01(\t\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x12\n\ncreated_at\x18\x07 \x01(\t\x12\x12\n\nupdated_at\x18\x08 \x01(\t\"b\n\x11PlaceOrderRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x18\n\x0b\x63oupon_code\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x12\n\ncourse_ids\x18\x02 \x03(\tB\x0e\n\x0c_coupon_code\"H\n\rOrdersSuccess\x12(\n\x06orders\x18\x01 \x03(\x0b\x32\x18.order_service.OrderData\x12\r\n\x05total\x18\x02 \x01(\x05\"7\n\x0cOrderSuccess\x12\'\n\x05order\x18\x01 \x01(\x0b\x32\x18.order_service.OrderData\"/\n\x0bOrderStatus\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x10\n\x08order_id\x18\x02 \x01(\t\"p\n\rOrderResponse\x12.\n\x07success\x18\x01 \x01(\x0b\x32\x1b.order_service.OrderSuccessH\x00\x12%\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x14.order_service.ErrorH\x00\x42\x08\n\x06result\"u\n\x13OrderStatusResponse\x12-\n\x07success\x18\x01 \x01(\x0b\x32\x1a.order_service.OrderStatusH\x00\x12%\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x14.order_service.ErrorH\x00\x42\x08\n\x06result\"r\n\x0eOrdersResponse\x12/\n\x07success\x18\x01 \x01(\x0b\x32\x1c.order_service.OrdersSuccessH\x00\x12%\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x14.order_service.ErrorH\x00\x42\x08\n\x06result\"9\n\x12\x42ookSessionRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x12\n\nsession_id\x18\x02 \x01(\t\"8\n\x13GetOrderByIdRequest\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\"8\n\x13RestoreOrderRequest\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\")\n\x15GetOrderStatusRequest\x12\x10\n\x08order_id\x18\x01 \x01(\t\"\x98\x01\n\x0cOrdersParams\x12\x11\n\x04page\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x17\n\nsort_order\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x16\n\tpage_size\x18\x02 \x01(\x05H\x02\x88\x01\x01\x12\x13\n\x06status\x18\x04 \x01(\tH\x03\x88\x01\x01\x42\x07\n\x05_pageB\r\n\x0b_sort_orderB\x0c\n\n_page_sizeB\t\n\x07_status\"P\n\x10GetOrdersRequest\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12+\n\x06params\x18\x01 \x01(\x0b\x32\x1b.order_service.OrdersParams\"|\n\x13\x42ookSessionResponse\x12\x34\n\x07success\x18\x01 \x01(\x0b\x32!.order_service.BookSessionSuccessH\x00\x12%\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x14.order_service.ErrorH\x00\x42\x08\n\x06result2\xe1\x04\n\x0cOrderService\x12L\n\nPlaceOrder\x12 .order_service.PlaceOrderRequest\x1a\x1c.order_service.OrderResponse\x12T\n\x0b\x42ookSession\x12!.order_service.BookSessionRequest\x1a\".order_service.BookSessionResponse\x12P\n\x0cGetOrderById\x12\".order_service.GetOrderByIdRequest\x1a\x1c.order_service.OrderResponse\x12P\n\x0cRestoreOrder\x12\".order_service.RestoreOrderRequest\x1a\x1c.order_service.OrderResponse\x12Z\n\x0eGetOrderStatus\x12$.order_service.GetOrderStatusRequest\x1a\".order_service.OrderStatusResponse\x12K\n\tGetOrders\x12\x1f.order_service.GetOrdersRequest\x1a\x1d.order_service.OrdersResponse\x12`\n\x0fGetRevenueStats\x12%.order_service.GetRevenueStatsRequest\x1a&.order_service.GetRevenueStatsResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13order_service.proto\x12\rorder_service\"~\n\x17GetRevenueStatsResponse\x12\x32\n\x07success\x18\x01 \x01(\x0b\x32\x1f.order_service.RevenueStatsDataH\x00\x12%\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x14.order_service.ErrorH\x00\x42\x08\n\x06result\".\n\x0cRevenueStats\x12\r\n\x05month\x18\x01 \x01(\x05\x12\x0f\n\x07revenue\x18\x02 \x01(\x01\"F\n\x10RevenueStatsData\x12\x32\n\rrevenue_stats\x18\x01 \x03(\x0b\x32\x1b.order_service.RevenueStats\"&\n\x16GetRevenueStatsRequest\x12\x0c\n\x04year\x18\x01 \x01(\x05\"S\n\x05\x45rror\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12+\n\x07\x64\x65tails\x18\x03 \x03(\x0b\x32\x1a.order_service.ErrorDetail\"-\n\x0b\x45rrorDetail\x12\r\n\x05\x66ield\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"2\n\x0eOrderItemsData\x12\x11\n\tcourse_id\x18\x01 \x01(\t\x12\r\n\x05price\x18\x02 \x01(\x02\"\x9c\x01\n\x12PaymentDetailsData\x12\x12\n\npayment_id\x18\x01 \x01(\t\x12\x10\n\x08provider\x18\x02 \x01(\t\x12\x1e\n\x11provider_order_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x16\n\x0epayment_status\x18\x04 \x01(\t\x12\x12\n\nupdated_at\x18\x05 \x01(\tB\x14\n\x12_provider_order_id\"w\n\tMoneyData\x12\r\n\x05total\x18\x01 \x01(\x02\x12\x10\n\x08\x63urrency\x18\x02 \x01(\t\x12\x10\n\x08\x64iscount\x18\x03 \x01(\x02\x12\x16\n\tsales_tax\x18\x06 \x01(\x02H\x00\x88\x01\x01\x12\x11\n\tsub_total\x18\x04 \x01(\x02\x42\x0c\n\n_sales_tax\"\x8d\x02\n\tOrderData\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12,\n\x05items\x18\n \x03(\x0b\x32\x1d.order_service.OrderItemsData\x12?\n\x0fpayment_details\x18\x0b \x01(\x0b\x32!.order_service.PaymentDetailsDataH\x00\x88\x01\x01\x12(\n\x06\x61mount\x18\x04 \x01(\x0b\x32\x18.order_service.MoneyData\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x12\n\ncreated_at\x18\x07 \x01(\t\x12\x12\n\nupdated_at\x18\x08 \x01(\tB\x12\n\x10_payment_details\"\xa4\x01\n\x11PlaceOrderSuccess\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\x12\n\ncourse_ids\x18\x03 \x03(\t\x12\x14\n\x0ctotal_amount\x18\x04 \x01(\x02\x12\x10\n\x08\x63urrency\x18\x05 \x01(\t\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x12\n\ncreated_at\x18\x07 \x01(\t\x12\x12\n\nupdated_at\x18\x08 \x01(\t\"\x9f\x01\n\x12\x42ookSessionSuccess\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\x12\n\nsession_id\x18\x03 \x01(\t\x12\x0e\n\x06\x61mount\x18\x04 \x01(\x02\x12\x10\n\x08\x63urrency\x18\x05 \x01(\t\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x12\n\ncreated_at\x18\x07 \x01(\t\x12\x12\n\nupdated_at\x18\x08 \x01(\t\"b\n\x11PlaceOrderRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x18\n\x0b\x63oupon_code\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x12\n\ncourse_ids\x18\x02 \x03(\tB\x0e\n\x0c_coupon_code\"H\n\rOrdersSuccess\x12(\n\x06orders\x18\x01 \x03(\x0b\x32\x18.order_service.OrderData\x12\r\n\x05total\x18\x02 \x01(\x05\"7\n\x0cOrderSuccess\x12\'\n\x05order\x18\x01 \x01(\x0b\x32\x18.order_service.OrderData\"S\n\x12\x42\x61tchOrdersSuccess\x12(\n\x06orders\x18\x01 \x03(\x0b\x32\x18.order_service.OrderData\x12\x13\n\x0bmissing_ids\x18\x02 \x03(\t\"/\n\x0bOrderStatus\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x10\n\x08order_id\x18\x02 \x01(\t\"p\n\rOrderResponse\x12.\n\x07success\x18\x01 \x01(\x0b\x32\x1b.order_service.OrderSuccessH\x00\x12%\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x14.order_service.ErrorH\x00\x42\x08\n\x06result\"u\n\x13OrderStatusResponse\x12-\n\x07success\x18\x01 \x01(\x0b\x32\x1a.order_service.OrderStatusH\x00\x12%\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x14.order_service.ErrorH\x00\x42\x08\n\x06result\"r\n\x0eOrdersResponse\x12/\n\x07success\x18\x01 \x01(\x0b\x32\x1c.order_service.OrdersSuccessH\x00\x12%\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x14.order_service.ErrorH\x00\x42\x08\n\x06result\"J\n\x0fOrderStreamItem\x12\'\n\x05order\x18\x01 \x01(\x0b\x32\x18.order_service.OrderData\x12\x0e\n\x06\x63ursor\x18\x02 \x01(\t\"z\n\x14StreamOrdersResponse\x12\x31\n\x07success\x18\x01 \x01(\x0b\x32\x1e.order_service.OrderStreamItemH\x00\x12%\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x14.order_service.ErrorH\x00\x42\x08\n\x06result\"\x7f\n\x16\x42\x61tchGetOrdersResponse\x12\x34\n\x07success\x18\x01 \x01(\x0b\x32!.order_service.BatchOrdersSuccessH\x00\x12%\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x14.order_service.ErrorH\x00\x42\x08\n\x06result\"9\n\x12\x42ookSessionRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x12\n\nsession_id\x18\x02 \x01(\t\"8\n\x13GetOrderByIdRequest\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\"8\n\x13RestoreOrderRequest\x12\x10\n\x08order_id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\")\n\x15GetOrderStatusRequest\x12\x10\n\x08order_id\x18\x01 \x01(\t\"\xac\x01\n\x13StreamOrdersRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x13\n\x06status\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x17\n\nsort_order\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x13\n\x06\x63ursor\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x12\n\x05limit\x18\x05 \x01(\x05H\x03\x88\x01\x01\x42\t\n\x07_statusB\r\n\x0b_sort_orderB\t\n\x07_cursorB\x08\n\x06_limit\"*\n\x15\x42\x61tchGetOrdersRequest\x12\x11\n\torder_ids\x18\x01 \x03(\t\"\x98\x01\n\x0cOrdersParams\x12\x11\n\x04page\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x17\n\nsort_order\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x16\n\tpage_size\x18\x02 \x01(\x05H\x02\x88\x01\x01\x12\x13\n\x06status\x18\x04 \x01(\tH\x03\x88\x01\x01\x42\x07\n\x05_pageB\r\n\x0b_sort_orderB\x0c\n\n_page_sizeB\t\n\x07_status\"P\n\x10GetOrdersRequest\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12+\n\x06params\x18\x01 \x01(\x0b\x32\x1b.order_service.OrdersParams\"|\n\x13\x42ookSessionResponse\x12\x34\n\x07success\x18\x01 \x01(\x0b\x32!.order_service.BookSessionSuccessH\x00\x12%\n\x05\x65rror\x18\x02 \x01(\x0b\x32\x14.order_service.ErrorH\x00\x42\x08\n\x06result2\xfb\x06\n\x0cOrderService\x12L\n\nPlaceOrder\x12 .order_service.PlaceOrderRequest\x1a\x1c.order_service.OrderResponse\x12T\n\x0b\x42ookSession\x12!.order_service.BookSessionRequest\x1a\".order_service.BookSessionResponse\x12P\n\x0cGetOrderById\x12\".order_service.GetOrderByIdRequest\x1a\x1c.order_service.OrderResponse\x12P\n\x0cRestoreOrder\x12\".order_service.RestoreOrderRequest\x1a\x1c.order_service.OrderResponse\x12Z\n\x0eGetOrderStatus\x12$.order_service.GetOrderStatusRequest\x1a\".order_service.OrderStatusResponse\x12^\n\x10WatchOrderStatus\x12$.order_service.GetOrderStatusRequest\x1a\".order_service.OrderStatusResponse0\x01\x12K\n\tGetOrders\x12\x1f.order_service.GetOrdersRequest\x1a\x1d.order_service.OrdersResponse\x12]\n\x0e\x42\x61tchGetOrders\x12$.order_service.BatchGetOrdersRequest\x1a%.order_service.BatchGetOrdersResponse\x12Y\n\x0cStreamOrders\x12\".order_service.StreamOrdersRequest\x1a#.order_service.StreamOrdersResponse0\x01\x12`\n\x0fGetRevenueStats\x12%.order_service.GetRevenueStatsRequest\x1a&.order_service.GetRevenueStatsResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -51,28 +51,40 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_ORDERSSUCCESS']._serialized_end=1563
   _globals['_ORDERSUCCESS']._serialized_start=1565
   _globals['_ORDERSUCCESS']._serialized_end=1620
-  _globals['_ORDERSTATUS']._serialized_start=1622
-  _globals['_ORDERSTATUS']._serialized_end=1669
-  _globals['_ORDERRESPONSE']._serialized_start=1671
-  _globals['_ORDERRESPONSE']._serialized_end=1783
-  _globals['_ORDERSTATUSRESPONSE']._serialized_start=1785
-  _globals['_ORDERSTATUSRESPONSE']._serialized_end=1902
-  _globals['_ORDERSRESPONSE']._serialized_start=1904
-  _globals['_ORDERSRESPONSE']._serialized_end=2018
-  _globals['_BOOKSESSIONREQUEST']._serialized_start=2020
-  _globals['_BOOKSESSIONREQUEST']._serialized_end=2077
-  _globals['_GETORDERBYIDREQUEST']._serialized_start=2079
-  _globals['_GETORDERBYIDREQUEST']._serialized_end=2135
-  _globals['_RESTOREORDERREQUEST']._serialized_start=2137
-  _globals['_RESTOREORDERREQUEST']._serialized_end=2193
-  _globals['_GETORDERSTATUSREQUEST']._serialized_start=2195
-  _globals['_GETORDERSTATUSREQUEST']._serialized_end=2236
-  _globals['_ORDERSPARAMS']._serialized_start=2239
-  _globals['_ORDERSPARAMS']._serialized_end=2391
-  _globals['_GETORDERSREQUEST']._serialized_start=2393
-  _globals['_GETORDERSREQUEST']._serialized_end=2473
-  _globals['_BOOKSESSIONRESPONSE']._serialized_start=2475
-  _globals['_BOOKSESSIONRESPONSE']._serialized_end=2599
-  _globals['_ORDERSERVICE']._serialized_start=2602
-  _globals['_ORDERSERVICE']._serialized_end=3211
+  _globals['_BATCHORDERSSUCCESS']._serialized_start=1622
+  _globals['_BATCHORDERSSUCCESS']._serialized_end=1705
+  _globals['_ORDERSTATUS']._serialized_start=1707
+  _globals['_ORDERSTATUS']._serialized_end=1754
+  _globals['_ORDERRESPONSE']._serialized_start=1756
+  _globals['_ORDERRESPONSE']._serialized_end=1868
+  _globals['_ORDERSTATUSRESPONSE']._serialized_start=1870
+  _globals['_ORDERSTATUSRESPONSE']._serialized_end=1987
+  _globals['_ORDERSRESPONSE']._serialized_start=1989
+  _globals['_ORDERSRESPONSE']._serialized_end=2103
+  _globals['_ORDERSTREAMITEM']._serialized_start=2105
+  _globals['_ORDERSTREAMITEM']._serialized_end=2179
+  _globals['_STREAMORDERSRESPONSE']._serialized_start=2181
+  _globals['_STREAMORDERSRESPONSE']._serialized_end=2303
+  _globals['_BATCHGETORDERSRESPONSE']._serialized_start=2305
+  _globals['_BATCHGETORDERSRESPONSE']._serialized_end=2432
+  _globals['_BOOKSESSIONREQUEST']._serialized_start=2434
+  _globals['_BOOKSESSIONREQUEST']._serialized_end=2491
+  _globals['_GETORDERBYIDREQUEST']._serialized_start=2493
+  _globals['_GETORDERBYIDREQUEST']._serialized_end=2549
+  _globals['_RESTOREORDERREQUEST']._serialized_start=2551
+  _globals['_RESTOREORDERREQUEST']._serialized_end=2607
+  _globals['_GETORDERSTATUSREQUEST']._serialized_start=2609
+  _globals['_GETORDERSTATUSREQUEST']._serialized_end=2650
+  _globals['_STREAMORDERSREQUEST']._serialized_start=2653
+  _globals['_STREAMORDERSREQUEST']._serialized_end=2825
+  _globals['_BATCHGETORDERSREQUEST']._serialized_start=2827
+  _globals['_BATCHGETORDERSREQUEST']._serialized_end=2869
+  _globals['_ORDERSPARAMS']._serialized_start=2872
+  _globals['_ORDERSPARAMS']._serialized_end=3024
+  _globals['_GETORDERSREQUEST']._serialized_start=3026
+  _globals['_GETORDERSREQUEST']._serialized_end=3106
+  _globals['_BOOKSESSIONRESPONSE']._serialized_start=3108
+  _globals['_BOOKSESSIONRESPONSE']._serialized_end=3232
+  _globals['_ORDERSERVICE']._serialized_start=3235
+  _globals['_ORDERSERVICE']._serialized_end=4126
 # @@protoc_insertion_point(module_scope)
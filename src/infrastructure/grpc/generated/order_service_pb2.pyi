@@ -171,6 +171,14 @@ class OrderSuccess(_message.Message):
     order: OrderData
     def __init__(self, order: _Optional[_Union[OrderData, _Mapping]] = ...) -> None: ...
 
+class BatchOrdersSuccess(_message.Message):
+    __slots__ = ("orders", "missing_ids")
+    ORDERS_FIELD_NUMBER: _ClassVar[int]
+    MISSING_IDS_FIELD_NUMBER: _ClassVar[int]
+    orders: _containers.RepeatedCompositeFieldContainer[OrderData]
+    missing_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, orders: _Optional[_Iterable[_Union[OrderData, _Mapping]]] = ..., missing_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
 class OrderStatus(_message.Message):
     __slots__ = ("status", "order_id")
     STATUS_FIELD_NUMBER: _ClassVar[int]
@@ -203,6 +211,30 @@ class OrdersResponse(_message.Message):
     error: Error
     def __init__(self, success: _Optional[_Union[OrdersSuccess, _Mapping]] = ..., error: _Optional[_Union[Error, _Mapping]] = ...) -> None: ...
 
+class OrderStreamItem(_message.Message):
+    __slots__ = ("order", "cursor")
+    ORDER_FIELD_NUMBER: _ClassVar[int]
+    CURSOR_FIELD_NUMBER: _ClassVar[int]
+    order: OrderData
+    cursor: str
+    def __init__(self, order: _Optional[_Union[OrderData, _Mapping]] = ..., cursor: _Optional[str] = ...) -> None: ...
+
+class StreamOrdersResponse(_message.Message):
+    __slots__ = ("success", "error")
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    success: OrderStreamItem
+    error: Error
+    def __init__(self, success: _Optional[_Union[OrderStreamItem, _Mapping]] = ..., error: _Optional[_Union[Error, _Mapping]] = ...) -> None: ...
+
+class BatchGetOrdersResponse(_message.Message):
+    __slots__ = ("success", "error")
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    success: BatchOrdersSuccess
+    error: Error
+    def __init__(self, success: _Optional[_Union[BatchOrdersSuccess, _Mapping]] = ..., error: _Optional[_Union[Error, _Mapping]] = ...) -> None: ...
+
 class BookSessionRequest(_message.Message):
     __slots__ = ("user_id", "session_id")
     USER_ID_FIELD_NUMBER: _ClassVar[int]
@@ -233,6 +265,26 @@ class GetOrderStatusRequest(_message.Message):
     order_id: str
     def __init__(self, order_id: _Optional[str] = ...) -> None: ...
 
+class StreamOrdersRequest(_message.Message):
+    __slots__ = ("user_id", "status", "sort_order", "cursor", "limit")
+    USER_ID_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    SORT_ORDER_FIELD_NUMBER: _ClassVar[int]
+    CURSOR_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    user_id: str
+    status: str
+    sort_order: str
+    cursor: str
+    limit: int
+    def __init__(self, user_id: _Optional[str] = ..., status: _Optional[str] = ..., sort_order: _Optional[str] = ..., cursor: _Optional[str] = ..., limit: _Optional[int] = ...) -> None: ...
+
+class BatchGetOrdersRequest(_message.Message):
+    __slots__ = ("order_ids",)
+    ORDER_IDS_FIELD_NUMBER: _ClassVar[int]
+    order_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, order_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
 class OrdersParams(_message.Message):
     __slots__ = ("page", "sort_order", "page_size", "status")
     PAGE_FIELD_NUMBER: _ClassVar[int]
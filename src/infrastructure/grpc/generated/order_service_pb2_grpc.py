@@ -64,11 +64,26 @@ class OrderServiceStub(object):
                 request_serializer=order__service__pb2.GetOrderStatusRequest.SerializeToString,
                 response_deserializer=order__service__pb2.OrderStatusResponse.FromString,
                 _registered_method=True)
+        self.WatchOrderStatus = channel.unary_stream(
+                '/order_service.OrderService/WatchOrderStatus',
+                request_serializer=order__service__pb2.GetOrderStatusRequest.SerializeToString,
+                response_deserializer=order__service__pb2.OrderStatusResponse.FromString,
+                _registered_method=True)
         self.GetOrders = channel.unary_unary(
                 '/order_service.OrderService/GetOrders',
                 request_serializer=order__service__pb2.GetOrdersRequest.SerializeToString,
                 response_deserializer=order__service__pb2.OrdersResponse.FromString,
                 _registered_method=True)
+        self.BatchGetOrders = channel.unary_unary(
+                '/order_service.OrderService/BatchGetOrders',
+                request_serializer=order__service__pb2.BatchGetOrdersRequest.SerializeToString,
+                response_deserializer=order__service__pb2.BatchGetOrdersResponse.FromString,
+                _registered_method=True)
+        self.StreamOrders = channel.unary_stream(
+                '/order_service.OrderService/StreamOrders',
+                request_serializer=order__service__pb2.StreamOrdersRequest.SerializeToString,
+                response_deserializer=order__service__pb2.StreamOrdersResponse.FromString,
+                _registered_method=True)
         self.GetRevenueStats = channel.unary_unary(
                 '/order_service.OrderService/GetRevenueStats',
                 request_serializer=order__service__pb2.GetRevenueStatsRequest.SerializeToString,
@@ -109,12 +124,32 @@ class OrderServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def WatchOrderStatus(self, request, context):
+        """Current status, then each transition until the order settles
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetOrders(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def BatchGetOrders(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamOrders(self, request, context):
+        """A user's orders one message at a time, resumable from any message's cursor
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetRevenueStats(self, request, context):
         """Stats
         """
@@ -150,11 +185,26 @@ def add_OrderServiceServicer_to_server(servicer, server):
                     request_deserializer=order__service__pb2.GetOrderStatusRequest.FromString,
                     response_serializer=order__service__pb2.OrderStatusResponse.SerializeToString,
             ),
+            'WatchOrderStatus': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchOrderStatus,
+                    request_deserializer=order__service__pb2.GetOrderStatusRequest.FromString,
+                    response_serializer=order__service__pb2.OrderStatusResponse.SerializeToString,
+            ),
             'GetOrders': grpc.unary_unary_rpc_method_handler(
                     servicer.GetOrders,
                     request_deserializer=order__service__pb2.GetOrdersRequest.FromString,
                     response_serializer=order__service__pb2.OrdersResponse.SerializeToString,
             ),
+            'BatchGetOrders': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchGetOrders,
+                    request_deserializer=order__service__pb2.BatchGetOrdersRequest.FromString,
+                    response_serializer=order__service__pb2.BatchGetOrdersResponse.SerializeToString,
+            ),
+            'StreamOrders': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamOrders,
+                    request_deserializer=order__service__pb2.StreamOrdersRequest.FromString,
+                    response_serializer=order__service__pb2.StreamOrdersResponse.SerializeToString,
+            ),
             'GetRevenueStats': grpc.unary_unary_rpc_method_handler(
                     servicer.GetRevenueStats,
                     request_deserializer=order__service__pb2.GetRevenueStatsRequest.FromString,
@@ -306,6 +356,33 @@ class OrderService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def WatchOrderStatus(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/order_service.OrderService/WatchOrderStatus',
+            order__service__pb2.GetOrderStatusRequest.SerializeToString,
+            order__service__pb2.OrderStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetOrders(request,
             target,
@@ -333,6 +410,60 @@ class OrderService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def BatchGetOrders(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/order_service.OrderService/BatchGetOrders',
+            order__service__pb2.BatchGetOrdersRequest.SerializeToString,
+            order__service__pb2.BatchGetOrdersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamOrders(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/order_service.OrderService/StreamOrders',
+            order__service__pb2.StreamOrdersRequest.SerializeToString,
+            order__service__pb2.StreamOrdersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetRevenueStats(request,
             target,
@@ -1,6 +1,8 @@
-from typing import Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, Awaitable, Callable
 from grpc import HandlerCallDetails, RpcMethodHandler, aio
 import grpc
+import asyncio
 from opentelemetry import propagate, trace
 from opentelemetry.trace import SpanKind
 import time
@@ -9,6 +11,74 @@ from src.application.interfaces.metrics_interface import IMetricsService
 from src.application.interfaces.tracing_interface import ITracingService
 from src.infrastructure.config import settings
 from src.infrastructure.grpc.auth_guard import AuthGuard
+from src.domain.exceptions.exceptions import DeadlineExceededException
+from src.shared.utils.adaptive_limiter import AdaptiveConcurrencyLimiter
+from src.shared.utils.deadline import deadline_scope, remaining
+
+
+def wrap_rpc_handler(
+    handler: RpcMethodHandler | None,
+    around: Callable[[aio.ServicerContext], AsyncContextManager],
+) -> RpcMethodHandler | None:
+    """
+    Returns `handler` with its unary behavior run inside `around(context)`. Unlike
+    code in intercept_service, `around` sees the ServicerContext and spans the actual
+    handler execution (for unary-stream, the whole stream).
+    """
+    if handler is None:
+        return handler
+
+    if handler.unary_unary is not None:
+        behavior = handler.unary_unary
+
+        async def unary_unary(request, context):
+            async with around(context):
+                return await behavior(request, context)
+
+        return grpc.unary_unary_rpc_method_handler(
+            unary_unary,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
+    if handler.unary_stream is not None:
+        stream_behavior = handler.unary_stream
+
+        async def unary_stream(request, context):
+            async with around(context):
+                async for response in stream_behavior(request, context):
+                    yield response
+
+        return grpc.unary_stream_rpc_method_handler(
+            unary_stream,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
+    return handler
+
+
+class ServerPreSerializedResponseInterceptor(aio.ServerInterceptor):
+    """
+    Lets unary handlers return a response that is already serialized (bytes, e.g.
+    from a response cache); any other response is serialized as usual.
+    """
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[HandlerCallDetails], Awaitable[RpcMethodHandler]],
+        handler_call_details: HandlerCallDetails,
+    ) -> RpcMethodHandler:
+        handler = await continuation(handler_call_details)
+        if handler is None or handler.unary_unary is None or handler.response_serializer is None:
+            return handler
+        serialize = handler.response_serializer
+        return grpc.unary_unary_rpc_method_handler(
+            handler.unary_unary,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=lambda response: (
+                response if isinstance(response, bytes) else serialize(response)),
+        )
 
 
 class ServerLoggingInterceptor(aio.ServerInterceptor):
@@ -25,7 +95,30 @@ class ServerLoggingInterceptor(aio.ServerInterceptor):
         return await continuation(handler_call_details)
 
 
+class _RpcObservation:
+    __slots__ = ("response_bytes",)
+
+    def __init__(self) -> None:
+        self.response_bytes = 0
+
+    def add_response(self, response) -> None:
+        self.response_bytes += len(response) if isinstance(response, bytes) else response.ByteSize()
+
+
+def _current_trace_id() -> str | None:
+    span_context = trace.get_current_span().get_span_context()
+    return format(span_context.trace_id, "032x") if span_context.is_valid else None
+
+
 class ServerMetricsInterceptor(aio.ServerInterceptor):
+    """
+    Per-method RPC metrics measured around the handler's actual execution (for
+    server-streaming calls, the whole stream): latency, response size, calls in
+    flight and the final gRPC status code. Latency observations carry the current
+    trace id as an exemplar (dropped by MetricsService in multiprocess mode), so
+    ServerTracingInterceptor must run outside this one.
+    """
+
     def __init__(self, metrics: IMetricsService, logger: ILoggingService) -> None:
         self.logger = logger.get_logger("ServerMetricsInterceptor")
         self.metrics = metrics
@@ -36,25 +129,207 @@ class ServerMetricsInterceptor(aio.ServerInterceptor):
         handler_call_details: HandlerCallDetails,
     ) -> RpcMethodHandler:
         method = handler_call_details.method
-        start_time = time.time()
-        status = "unknown"
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return handler
+
+        if handler.unary_unary is not None:
+            behavior = handler.unary_unary
+
+            async def unary_unary(request, context):
+                async with self._observe(method, context) as observation:
+                    response = await behavior(request, context)
+                    observation.add_response(response)
+                    return response
 
+            return grpc.unary_unary_rpc_method_handler(
+                unary_unary,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+
+        if handler.unary_stream is not None:
+            stream_behavior = handler.unary_stream
+
+            async def unary_stream(request, context):
+                async with self._observe(method, context) as observation:
+                    async for response in stream_behavior(request, context):
+                        observation.add_response(response)
+                        yield response
+
+            return grpc.unary_stream_rpc_method_handler(
+                unary_stream,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+
+        return handler
+
+    @asynccontextmanager
+    async def _observe(self, method: str, context: aio.ServicerContext) -> AsyncIterator[_RpcObservation]:
+        observation = _RpcObservation()
+        code: grpc.StatusCode | None = None
+        self.metrics.requests_in_flight(method=method, delta=1)
+        start_time = time.perf_counter()
         try:
-            response = await continuation(handler_call_details)
-            status = "success"
-        except Exception as e:
-            status = "failed"
+            yield observation
+        except asyncio.CancelledError:
+            code = grpc.StatusCode.CANCELLED
+            raise
+        except Exception:
+            # context.abort() raises after setting the code; anything else is UNKNOWN
+            code = context.code() or grpc.StatusCode.UNKNOWN
             raise
         finally:
-            latency = time.time() - start_time
+            latency = time.perf_counter() - start_time
+            code = code or context.code() or grpc.StatusCode.OK
+            self.metrics.requests_in_flight(method=method, delta=-1)
             self.metrics.request_counter(
-                method=method, endpoint=method, status=status)
+                method=method, endpoint=method, status=code.name)
             self.metrics.request_latency(
-                method=method, endpoint=method, latency=latency)
+                method=method, endpoint=method, latency=latency, trace_id=_current_trace_id())
+            self.metrics.response_size(
+                method=method, size_bytes=observation.response_bytes)
             self.logger.debug(
-                f"gRPC method ${method} completed wit status ${status} in ${latency//1000}s"
+                f"gRPC method {method} completed with status {code.name} in {latency:.3f}s")
+
+
+class ServerDeadlineInterceptor(aio.ServerInterceptor):
+    """
+    Runs each handler inside a deadline scope set from the caller's remaining time
+    (`context.time_remaining()`), so downstream gRPC, Redis and SQL calls made while
+    serving it are bounded by the same budget.
+    """
+
+    def __init__(self, default_timeout_sec: float | None = None) -> None:
+        self.default_timeout_sec = default_timeout_sec
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[HandlerCallDetails], Awaitable[RpcMethodHandler]],
+        handler_call_details: HandlerCallDetails,
+    ) -> RpcMethodHandler:
+        handler = await continuation(handler_call_details)
+        return wrap_rpc_handler(handler, self._scope)
+
+    @asynccontextmanager
+    async def _scope(self, context: aio.ServicerContext) -> AsyncIterator[None]:
+        with deadline_scope(self._budget(context)):
+            yield
+
+    def _budget(self, context: aio.ServicerContext) -> float | None:
+        time_remaining = context.time_remaining()
+        if time_remaining is None:
+            return self.default_timeout_sec
+        return time_remaining
+
+
+class ServerAdmissionControlInterceptor(aio.ServerInterceptor):
+    """
+    Adaptive admission control. Each method has its own AIMD concurrency limit learnt
+    from its latency, and all methods share a server-wide limit in front of the DB
+    pool. A method's priority is the share of the server-wide limit it may fill, so
+    low-priority reads are shed first and the remaining headroom stays available to
+    high-priority calls such as PlaceOrder. Rejections fail fast with
+    RESOURCE_EXHAUSTED.
+
+    Server-streaming calls (WatchOrderStatus, StreamOrders) are not admitted here:
+    they can stay open for minutes, so they would hold slots and skew the learnt
+    latency. They are
+    bounded by the server's maximum_concurrent_rpcs instead.
+
+    Handlers turn domain errors into response payloads, so overload is read from the
+    call's outcome rather than from exceptions: an overload status code on the
+    context, or a request deadline that ran out while the handler was running, backs
+    the limits off just like a completion slower than the latency target.
+    """
+
+    DEFAULT_PRIORITY = 0.8
+    OVERLOAD_CODES = frozenset({
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+        grpc.StatusCode.UNAVAILABLE,
+    })
+
+    def __init__(
+        self,
+        metrics: IMetricsService,
+        logger: ILoggingService,
+        method_priorities: dict[str, float] | None = None,
+        latency_target_sec: float = 0.5,
+        method_max_limit: int = 100,
+        global_max_limit: int = 200,
+    ) -> None:
+        self.metrics = metrics
+        self.logger = logger.get_logger("ServerAdmissionControlInterceptor")
+        self.method_priorities = method_priorities or {}
+        self.latency_target_sec = latency_target_sec
+        self.method_max_limit = method_max_limit
+        self._global = AdaptiveConcurrencyLimiter(
+            initial_limit=min(20, global_max_limit),
+            max_limit=global_max_limit,
+            latency_target_sec=latency_target_sec,
+        )
+        self._method_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[HandlerCallDetails], Awaitable[RpcMethodHandler]],
+        handler_call_details: HandlerCallDetails,
+    ) -> RpcMethodHandler:
+        method = handler_call_details.method
+        handler = await continuation(handler_call_details)
+        if handler is not None and handler.unary_stream is not None:
+            return handler
+        return wrap_rpc_handler(handler, lambda context: self._admit(method, context))
+
+    @asynccontextmanager
+    async def _admit(self, method: str, context: aio.ServicerContext) -> AsyncIterator[None]:
+        limiter = self._method_limiters.get(method)
+        if limiter is None:
+            limiter = self._method_limiters[method] = AdaptiveConcurrencyLimiter(
+                initial_limit=min(20, self.method_max_limit),
+                max_limit=self.method_max_limit,
+                latency_target_sec=self.latency_target_sec,
             )
-        return response
+        priority = self.method_priorities.get(
+            method.rsplit("/", 1)[-1], self.DEFAULT_PRIORITY)
+
+        if not limiter.try_acquire():
+            await self._reject(method, context, limiter)
+        if not self._global.try_acquire(share=priority):
+            limiter.cancel()
+            await self._reject(method, context, limiter)
+
+        start_time = time.perf_counter()
+        overloaded = False
+        try:
+            yield
+        except (DeadlineExceededException, asyncio.TimeoutError):
+            overloaded = True
+            raise
+        finally:
+            latency = time.perf_counter() - start_time
+            overloaded = overloaded or self._overloaded(context)
+            limiter.release(latency, overloaded)
+            self._global.release(latency, overloaded)
+            self.metrics.admission_limit(
+                method=method, limit=limiter.limit, in_flight=limiter.in_flight)
+
+    def _overloaded(self, context: aio.ServicerContext) -> bool:
+        if context.code() in self.OVERLOAD_CODES:
+            return True
+        left = remaining()
+        return left is not None and left <= 0
+
+    async def _reject(
+        self, method: str, context: aio.ServicerContext, limiter: AdaptiveConcurrencyLimiter
+    ) -> None:
+        self.metrics.admission_rejections(method=method)
+        self.logger.warning(
+            f"Shedding {method}: {limiter.in_flight}/{limiter.limit} in flight, "
+            f"server {self._global.in_flight}/{self._global.limit}")
+        await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "Server is overloaded, retry later")
 
 
 class ServerTracingInterceptor(aio.ServerInterceptor):
@@ -71,11 +346,17 @@ class ServerTracingInterceptor(aio.ServerInterceptor):
 
         # Extract span context from metadata
         span_context = propagate.extract(metadata)
+        handler = await continuation(handler_call_details)
+        # The span covers the handler itself, not just handler lookup
+        return wrap_rpc_handler(handler, lambda context: self._span(method, span_context))
+
+    @asynccontextmanager
+    async def _span(self, method: str, span_context) -> AsyncIterator[None]:
         with self.tracer.start_as_current_span(
             method, context=span_context, kind=SpanKind.SERVER
         ) as span:
             span.set_attribute("grpc.method", method)
-            return await continuation(handler_call_details)
+            yield
 
 
 class ServerAuthInterceptor(aio.ServerInterceptor):
@@ -4,6 +4,7 @@ from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from src.application.use_cases.order.order_timeout_use_case import HandleOrderTimeoutUseCase
+from src.application.use_cases.course.sync_course_price_use_case import SyncCoursePriceUseCase
 from src.domain.events.order_payment_timeout_event import OrderPaymentTimeoutEventDto
 from src.application.interfaces.metrics_interface import IMetricsService
 from src.application.interfaces.redis_interface import IRedisService
@@ -22,6 +23,7 @@ from src.application.use_cases.order.order_failed_use_case import OrderFailedUse
 from src.domain.events.order_payment_initiate_event import OrderPaymentInitiatedEventDto
 from src.domain.events.order_payment_failure_event import OrderPaymentFailureEventDto
 from src.domain.events.order_payment_success_event import OrderPaymentSuccessEventDto
+from src.domain.events.course_changed_event import CourseChangedEventDto
 from tenacity import RetryError
 from pydantic import ValidationError
 
@@ -32,6 +34,14 @@ class KafkaConsumer:
     DLQ_TOPIC = "order-service.events.dlq"
     MAX_WORKERS = 10
 
+    COURSE_PRICE_TOPICS = {
+        EVENT_TOPICS.COURSE_UPDATED.value,
+        EVENT_TOPICS.COURSE_PUBLISHED.value,
+        EVENT_TOPICS.COURSE_UNPUBLISHED.value,
+        EVENT_TOPICS.COURSE_DELETED.value,
+        EVENT_TOPICS.COURSE_ARCHIVED.value,
+    }
+
     def __init__(
         self,
         order_repository: IOrderRepository,
@@ -40,6 +50,7 @@ class KafkaConsumer:
         order_success_handler:  OrderSuccessUseCase,
         order_failed_handler: OrderFailedUseCase,
         order_timeout_handler: HandleOrderTimeoutUseCase,
+        course_price_sync_handler: SyncCoursePriceUseCase,
         kafka_producer: IKafkaProducer,
         redis: IRedisService,
         metrics_service: IMetricsService,
@@ -55,6 +66,7 @@ class KafkaConsumer:
 
         self.consumer = AIOKafkaConsumer(
             *payment_topics,
+            *sorted(self.COURSE_PRICE_TOPICS),
             bootstrap_servers=settings.KAFKA_BROKER,
             group_id=settings.KAFKA_CONSUMER_GROUP or "order-service-group",
             auto_offset_reset="latest",
@@ -69,6 +81,7 @@ class KafkaConsumer:
         self.order_success_handler = order_success_handler
         self.order_timeout_handler = order_timeout_handler
         self.order_failed_handler = order_failed_handler
+        self.course_price_sync_handler = course_price_sync_handler
 
         self.kafka_producer = kafka_producer
         self.redis = redis
@@ -178,6 +191,12 @@ class KafkaConsumer:
                 )
                 await self.order_timeout_handler.execute(dto)
 
+            elif topic in self.COURSE_PRICE_TOPICS:
+                dto = CourseChangedEventDto.from_payload(
+                    event=event,
+                )
+                await self.course_price_sync_handler.execute(topic, dto)
+
             else:
                 self.logger.warning(f"Unknown topic received: {topic}")
 
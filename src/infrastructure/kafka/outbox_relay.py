@@ -0,0 +1,102 @@
+import asyncio
+from datetime import timedelta
+
+from src.application.interfaces.kafka_producer_interface import IKafkaProducer
+from src.application.interfaces.logging_interface import ILoggingService
+from src.domain.repositories.outbox_repository import IOutboxRepository
+from src.infrastructure.database.database import get_db
+from src.infrastructure.kafka.producer import resolve_event_key
+
+
+class OutboxRelay:
+    """
+    Drains the outbox_events table to Kafka in batches. Publishing is at-least-once:
+    an event stays pending until the broker acknowledged it, so consumers must
+    tolerate the occasional duplicate. Every `purge_interval_sec` it also deletes
+    events published more than `retention` ago, so the table only grows with the
+    backlog.
+    """
+
+    PURGE_BATCH_SIZE = 1000
+
+    def __init__(
+        self,
+        outbox_repository: IOutboxRepository,
+        kafka_producer: IKafkaProducer,
+        logging_service: ILoggingService,
+        batch_size: int = 200,
+        poll_interval_sec: float = 0.1,
+        retention: timedelta = timedelta(hours=24),
+        purge_interval_sec: float = 300,
+    ):
+        self._outbox = outbox_repository
+        self._kafka_producer = kafka_producer
+        self._logger = logging_service.get_logger("OutboxRelay")
+        self.batch_size = batch_size
+        self.poll_interval_sec = poll_interval_sec
+        self.retention = retention
+        self.purge_interval_sec = purge_interval_sec
+
+    async def relay_once(self) -> int:
+        """Publishes one batch of pending events. Returns how many were marked as sent."""
+        async with get_db() as session:
+            events = await self._outbox.claim_pending(self.batch_size, session)
+            if not events:
+                return 0
+
+            errors = await self._kafka_producer.publish_events(
+                [(event.topic, event.payload) for event in events])
+
+            # Once an event fails, later events with the same partition key stay
+            # pending too, so the retry republishes them after it and in order.
+            sent_ids: list[int] = []
+            blocked_keys: set[tuple[str, bytes]] = set()
+            for event, error in zip(events, errors):
+                key = resolve_event_key(event.payload)
+                ordering_key = (event.topic, key) if key is not None else None
+                if error is not None or ordering_key in blocked_keys:
+                    if ordering_key is not None:
+                        blocked_keys.add(ordering_key)
+                    if error is not None:
+                        self._logger.warning(
+                            f"Outbox event {event.id} to {event.topic} not published, will retry: {error}")
+                    continue
+                sent_ids.append(event.id)
+
+            await self._outbox.mark_sent(sent_ids, session)
+
+        self._logger.debug(f"Relayed {len(sent_ids)} of {len(events)} outbox events")
+        return len(sent_ids)
+
+    async def purge_once(self) -> int:
+        """Deletes published events past the retention, a batch per transaction. Returns how many."""
+        purged = 0
+        while True:
+            async with get_db() as session:
+                deleted = await self._outbox.purge_sent(
+                    self.retention, self.PURGE_BATCH_SIZE, session)
+            purged += deleted
+            if deleted < self.PURGE_BATCH_SIZE:
+                break
+        if purged:
+            self._logger.info(f"Purged {purged} published outbox events")
+        return purged
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_purge = loop.time()
+        while True:
+            try:
+                relayed = await self.relay_once()
+            except Exception as e:
+                self._logger.error(f"Outbox relay iteration failed: {e}")
+                relayed = 0
+            if loop.time() >= next_purge:
+                next_purge = loop.time() + self.purge_interval_sec
+                try:
+                    await self.purge_once()
+                except Exception as e:
+                    self._logger.error(f"Outbox purge failed: {e}")
+            # Keep draining without pause while there is a backlog
+            if relayed < self.batch_size:
+                await asyncio.sleep(self.poll_interval_sec)
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 from aiokafka import AIOKafkaProducer
@@ -13,6 +14,14 @@ from src.application.interfaces.kafka_producer_interface import (
 from src.infrastructure.config.settings import settings
 
 
+def resolve_event_key(event: dict) -> bytes | None:
+    """Partition key for an event: the first id field present, so one order's events stay in order."""
+    for k in ["orderId", "order_id", "userId", "user_id", "payment_id", "provider_order_id"]:
+        if k in event:
+            return str(event[k]).encode("utf-8")
+    return None
+
+
 class KafkaProducer(IKafkaProducer):
     def __init__(self, logger_service: ILoggingService):
         self.producer = AIOKafkaProducer(
@@ -59,16 +68,9 @@ class KafkaProducer(IKafkaProducer):
                 # Serialize as JSON, encode to bytes
                 data = json.dumps(event).encode("utf-8")
 
-            # Try to get a meaningful key; fallback to None if not available
-            key = None
-            for k in ["orderId", "order_id", "userId", "user_id", "payment_id", "provider_order_id"]:
-                if k in event:
-                    key = str(event[k]).encode("utf-8")
-                    break
-
             await self.producer.send_and_wait(
                 topic,
-                key=key,
+                key=resolve_event_key(event),
                 value=data
             )
             self.logger.info(f"Published event {event.get('eventType', 'unknown')} to topic {topic}")
@@ -84,3 +86,33 @@ class KafkaProducer(IKafkaProducer):
             else:
                 self.logger.error(f"Failed to publish event to topic {topic}: {str(e)}")
             raise
+
+    async def publish_events(self, events: list[tuple[str, dict]]) -> list[BaseException | None]:
+        """
+        Publishes a batch of JSON events. Every send is queued in order before any
+        acknowledgement is awaited, so the idempotent producer keeps per-key order
+        while the whole batch shares one round of broker latency.
+        Returns one entry per event: None when acknowledged, otherwise the error.
+        """
+        loop = asyncio.get_running_loop()
+        deliveries: list[asyncio.Future] = []
+        for topic, event in events:
+            try:
+                deliveries.append(await self.producer.send(
+                    topic,
+                    key=resolve_event_key(event),
+                    value=json.dumps(event).encode("utf-8"),
+                ))
+            except Exception as e:
+                failed = loop.create_future()
+                failed.set_exception(e)
+                deliveries.append(failed)
+
+        results = await asyncio.gather(*deliveries, return_exceptions=True)
+        errors = [r if isinstance(r, BaseException) else None for r in results]
+        failed_count = sum(1 for e in errors if e is not None)
+        if failed_count:
+            self.logger.error(f"Failed to publish {failed_count} of {len(events)} events in batch")
+        else:
+            self.logger.info(f"Published batch of {len(events)} events")
+        return errors
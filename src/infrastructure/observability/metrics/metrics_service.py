@@ -1,7 +1,7 @@
+import os
 import threading
 
 from src.application.interfaces.metrics_interface import IMetricsService
-import threading
 
 from prometheus_client import (
     CollectorRegistry,
@@ -11,6 +11,7 @@ from prometheus_client import (
     ProcessCollector,
     PlatformCollector,
     GCCollector,
+    multiprocess,
 )
 
 
@@ -28,23 +29,34 @@ class MetricsService(IMetricsService):
         if hasattr(self, "_initialized"):
             return
 
-        self.registry = CollectorRegistry()
+        # The multiprocess files keep no exemplars, so workers skip attaching them
+        self._exemplars_enabled = not os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+        if not self._exemplars_enabled:
+            # gRPC worker processes (src.serve): values go to per-process files and
+            # self.registry exposes them aggregated across workers. Metrics are kept
+            # in a private registry so they are not also exported per process.
+            self.registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(self.registry)
+            metrics_registry = CollectorRegistry()
+        else:
+            self.registry = CollectorRegistry()
+            metrics_registry = self.registry
 
-        # Default runtime metrics
-        ProcessCollector(registry=self.registry)
-        PlatformCollector(registry=self.registry)
-        GCCollector(registry=self.registry)
+            # Default runtime metrics (per process, so not meaningful aggregated)
+            ProcessCollector(registry=self.registry)
+            PlatformCollector(registry=self.registry)
+            GCCollector(registry=self.registry)
 
         self._request_counter = Counter(
             "order_service_requests_total",
             "Total number of requests",
             ["method", "endpoint", "status"],
-            registry=self.registry,
+            registry=metrics_registry,
         )
 
         self._request_latency = Histogram(
             "order_service_request_latency_seconds",
-            "HTTP request latency",
+            "Request latency (handler execution time for gRPC)",
             ["method", "endpoint"],
             buckets=(
                 0.001,
@@ -59,34 +71,183 @@ class MetricsService(IMetricsService):
                 2,
                 5,
             ),
-            registry=self.registry,
+            registry=metrics_registry,
+        )
+
+        self._requests_in_flight = Gauge(
+            "order_service_requests_in_flight",
+            "Requests currently being handled, per method",
+            ["method"],
+            multiprocess_mode="livesum",
+            registry=metrics_registry,
+        )
+
+        self._response_size = Histogram(
+            "order_service_response_size_bytes",
+            "Serialized response size per call (summed over a stream)",
+            ["method"],
+            buckets=(100, 500, 1_000, 5_000, 10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000),
+            registry=metrics_registry,
         )
 
         self._active_orders = Gauge(
             "order_service_active_orders",
             "Number of active orders",
-            registry=self.registry,
+            multiprocess_mode="livesum",
+            registry=metrics_registry,
         )
 
         self._cache_hits = Counter(
             "order_service_cache_hits_total",
             "Total cache hits",
             ["type"],
-            registry=self.registry,
+            registry=metrics_registry,
         )
 
         self._cache_misses = Counter(
             "order_service_cache_misses_total",
             "Total cache misses",
             ["type"],
-            registry=self.registry,
+            registry=metrics_registry,
         )
 
         self._saga_failures = Counter(
             "order_service_saga_failures_total",
             "Total SAGA failures",
             ["step"],
-            registry=self.registry,
+            registry=metrics_registry,
+        )
+
+        self._admission_limit = Gauge(
+            "order_service_admission_concurrency_limit",
+            "Current adaptive concurrency limit per gRPC method",
+            ["method"],
+            multiprocess_mode="livesum",
+            registry=metrics_registry,
+        )
+
+        self._admission_in_flight = Gauge(
+            "order_service_admission_in_flight",
+            "Admitted requests in flight per gRPC method",
+            ["method"],
+            multiprocess_mode="livesum",
+            registry=metrics_registry,
+        )
+
+        self._admission_rejections = Counter(
+            "order_service_admission_rejections_total",
+            "Requests shed with RESOURCE_EXHAUSTED by admission control",
+            ["method"],
+            registry=metrics_registry,
+        )
+
+        self._stage_latency = Histogram(
+            "order_service_stage_latency_seconds",
+            "Latency of individual stages within a use case",
+            ["pipeline", "stage", "status"],
+            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5),
+            registry=metrics_registry,
+        )
+
+        self._upstream_in_flight = Gauge(
+            "order_service_upstream_in_flight",
+            "Outgoing gRPC calls in flight per upstream service",
+            ["upstream"],
+            multiprocess_mode="livesum",
+            registry=metrics_registry,
+        )
+
+        self._upstream_channels = Gauge(
+            "order_service_upstream_channels",
+            "Client channels per upstream service by connectivity state",
+            ["upstream", "state"],
+            multiprocess_mode="livesum",
+            registry=metrics_registry,
+        )
+
+        self._upstream_limit = Gauge(
+            "order_service_upstream_concurrency_limit",
+            "Current adaptive bulkhead limit per upstream gRPC method",
+            ["upstream", "method"],
+            multiprocess_mode="livesum",
+            registry=metrics_registry,
+        )
+
+        self._upstream_bulkhead_in_flight = Gauge(
+            "order_service_upstream_bulkhead_in_flight",
+            "Calls holding a bulkhead slot per upstream gRPC method",
+            ["upstream", "method"],
+            multiprocess_mode="livesum",
+            registry=metrics_registry,
+        )
+
+        self._upstream_queue_depth = Gauge(
+            "order_service_upstream_queue_depth",
+            "Calls waiting for a bulkhead slot per upstream gRPC method",
+            ["upstream", "method"],
+            multiprocess_mode="livesum",
+            registry=metrics_registry,
+        )
+
+        self._upstream_rejections = Counter(
+            "order_service_upstream_rejections_total",
+            "Upstream calls rejected by a saturated bulkhead",
+            ["upstream", "method"],
+            registry=metrics_registry,
+        )
+
+        self._upstream_hedges = Counter(
+            "order_service_upstream_hedges_total",
+            "Hedge-eligible upstream calls by outcome (not_needed, throttled, won, lost)",
+            ["upstream", "method", "result"],
+            registry=metrics_registry,
+        )
+
+        self._bloom_filter_checks = Counter(
+            "order_service_bloom_filter_checks_total",
+            "Bloom filter lookups by outcome (absent, maybe_present, false_positive, not_ready)",
+            ["filter", "result"],
+            registry=metrics_registry,
+        )
+
+        self._bloom_filter_bits = Gauge(
+            "order_service_bloom_filter_bits",
+            "Bloom filter size in bits",
+            ["filter"],
+            multiprocess_mode="mostrecent",
+            registry=metrics_registry,
+        )
+
+        self._bloom_filter_hash_functions = Gauge(
+            "order_service_bloom_filter_hash_functions",
+            "Number of hash functions per Bloom filter key",
+            ["filter"],
+            multiprocess_mode="mostrecent",
+            registry=metrics_registry,
+        )
+
+        self._bloom_filter_capacity = Gauge(
+            "order_service_bloom_filter_capacity",
+            "Number of keys the Bloom filter is sized for",
+            ["filter"],
+            multiprocess_mode="mostrecent",
+            registry=metrics_registry,
+        )
+
+        self._bloom_filter_fill_ratio = Gauge(
+            "order_service_bloom_filter_fill_ratio",
+            "Fraction of Bloom filter bits set",
+            ["filter"],
+            multiprocess_mode="mostrecent",
+            registry=metrics_registry,
+        )
+
+        self._bloom_filter_false_positive_rate = Gauge(
+            "order_service_bloom_filter_estimated_false_positive_rate",
+            "False-positive rate implied by the current fill ratio",
+            ["filter"],
+            multiprocess_mode="mostrecent",
+            registry=metrics_registry,
         )
 
         self._initialized = True
@@ -103,9 +264,16 @@ class MetricsService(IMetricsService):
         self._request_counter.labels(
             method=method, endpoint=endpoint, status=status).inc()
 
-    def request_latency(self, method: str, endpoint: str, latency: float) -> None:
+    def request_latency(self, method: str, endpoint: str, latency: float, trace_id: str | None = None) -> None:
         self._request_latency.labels(
-            method=method, endpoint=endpoint).observe(latency)
+            method=method, endpoint=endpoint).observe(
+                latency, exemplar={"trace_id": trace_id} if trace_id and self._exemplars_enabled else None)
+
+    def requests_in_flight(self, method: str, delta: int) -> None:
+        self._requests_in_flight.labels(method=method).inc(delta)
+
+    def response_size(self, method: str, size_bytes: int) -> None:
+        self._response_size.labels(method=method).observe(size_bytes)
 
     def active_orders(self, count: int) -> None:
         self._active_orders.set(count)
@@ -118,3 +286,50 @@ class MetricsService(IMetricsService):
 
     def saga_failures(self, step: str) -> None:
         self._saga_failures.labels(step=step).inc()
+
+    def admission_limit(self, method: str, limit: int, in_flight: int) -> None:
+        self._admission_limit.labels(method=method).set(limit)
+        self._admission_in_flight.labels(method=method).set(in_flight)
+
+    def admission_rejections(self, method: str) -> None:
+        self._admission_rejections.labels(method=method).inc()
+
+    def stage_latency(self, pipeline: str, stage: str, status: str, latency: float) -> None:
+        self._stage_latency.labels(
+            pipeline=pipeline, stage=stage, status=status).observe(latency)
+
+    def upstream_in_flight(self, upstream: str, delta: int) -> None:
+        self._upstream_in_flight.labels(upstream=upstream).inc(delta)
+
+    def upstream_channels(self, upstream: str, state: str, count: int) -> None:
+        self._upstream_channels.labels(upstream=upstream, state=state).set(count)
+
+    def upstream_bulkhead(self, upstream: str, method: str, limit: int, in_flight: int, queue_depth: int) -> None:
+        self._upstream_limit.labels(upstream=upstream, method=method).set(limit)
+        self._upstream_bulkhead_in_flight.labels(upstream=upstream, method=method).set(in_flight)
+        self._upstream_queue_depth.labels(upstream=upstream, method=method).set(queue_depth)
+
+    def upstream_rejections(self, upstream: str, method: str) -> None:
+        self._upstream_rejections.labels(upstream=upstream, method=method).inc()
+
+    def upstream_hedges(self, upstream: str, method: str, result: str) -> None:
+        self._upstream_hedges.labels(upstream=upstream, method=method, result=result).inc()
+
+    def bloom_filter_checks(self, filter: str, result: str) -> None:
+        self._bloom_filter_checks.labels(filter=filter, result=result).inc()
+
+    def bloom_filter_stats(
+        self,
+        filter: str,
+        bits: int,
+        hash_functions: int,
+        capacity: int,
+        fill_ratio: float,
+        estimated_false_positive_rate: float,
+    ) -> None:
+        self._bloom_filter_bits.labels(filter=filter).set(bits)
+        self._bloom_filter_hash_functions.labels(filter=filter).set(hash_functions)
+        self._bloom_filter_capacity.labels(filter=filter).set(capacity)
+        self._bloom_filter_fill_ratio.labels(filter=filter).set(fill_ratio)
+        self._bloom_filter_false_positive_rate.labels(filter=filter).set(
+            estimated_false_positive_rate)
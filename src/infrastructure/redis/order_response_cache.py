@@ -0,0 +1,61 @@
+from typing import Optional
+
+from src.application.interfaces.logging_interface import ILoggingService
+from src.application.interfaces.redis_interface import IRedisService
+from src.infrastructure.grpc.generated.order_service_pb2 import OrderData
+
+# Field 1, length-delimited: OrderResponse.success and OrderSuccess.order
+_FIELD_1_LEN_TAG = b"\x0a"
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def order_response_bytes(order_data: bytes) -> bytes:
+    """
+    Wire encoding of OrderResponse(success=OrderSuccess(order=<order_data>)), framed
+    directly around already-serialized OrderData bytes.
+    """
+    order_success = _FIELD_1_LEN_TAG + _varint(len(order_data)) + order_data
+    return _FIELD_1_LEN_TAG + _varint(len(order_success)) + order_success
+
+
+class OrderResponseCache:
+    """
+    Caches serialized OrderData per order under order_pb:{id}, so a GetOrderById hit
+    is answered straight from the cached bytes: no JSON decoding, domain mapping,
+    pydantic validation or protobuf construction. SqlOrderRepository drops the entry
+    wherever it drops orders:{id}, and where that happens before the transaction
+    commits, drops it again after commit: entries are only filled on read, so a
+    GetOrderById in between may have cached the old order.
+
+    The cache is an optimisation only; Redis errors count as misses.
+    """
+
+    def __init__(self, redis: IRedisService, logging_service: ILoggingService, ttl_sec: int = 3600):
+        self._redis = redis
+        self._logger = logging_service.get_logger("OrderResponseCache")
+        self._ttl_sec = ttl_sec
+
+    async def get_response(self, order_id: str) -> Optional[bytes]:
+        """Serialized OrderResponse for a cached order, or None on a miss."""
+        try:
+            order_data = await self._redis.get_bytes(f"order_pb:{order_id}")
+        except Exception as e:
+            self._logger.warning(f"Order response cache read failed for {order_id}: {e}")
+            return None
+        if order_data is None:
+            return None
+        return order_response_bytes(order_data)
+
+    async def put(self, order_id: str, order_data: OrderData) -> None:
+        try:
+            await self._redis.set(f"order_pb:{order_id}", order_data.SerializeToString(), expire=self._ttl_sec)
+        except Exception as e:
+            self._logger.warning(f"Order response cache write failed for {order_id}: {e}")
@@ -0,0 +1,134 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.application.interfaces.logging_interface import ILoggingService
+from src.application.interfaces.order_status_notifier_interface import IOrderStatusNotifier
+from src.application.interfaces.redis_interface import IRedisService
+from src.domain.entities.order import OrderStatus
+from src.infrastructure.config.settings import settings
+
+_PENDING_CHANGES_KEY = "order_status_notifier.pending"
+
+
+class RedisOrderStatusNotifier(IOrderStatusNotifier):
+    """
+    Fans order status transitions out to WatchOrderStatus streams over one Redis
+    pub/sub channel.
+
+    Transitions are collected on the SQLAlchemy session and published from its
+    after_commit hook, so watchers never see a status that was rolled back. Each
+    process holds a single subscription to the channel and routes messages to the
+    queues of its local watchers.
+    """
+
+    CHANNEL = "order_status_changes"
+    QUEUE_SIZE = 16
+    SUBSCRIBE_TIMEOUT_SEC = 5.0
+    RECONNECT_DELAY_SEC = 1.0
+
+    def __init__(self, redis: IRedisService, logging_service: ILoggingService):
+        self._redis = redis
+        self._logger = logging_service.get_logger("RedisOrderStatusNotifier")
+        self._channel = settings.REDIS_KEY_PREFIX + self.CHANNEL
+        self._watchers: dict[str, set[asyncio.Queue]] = {}
+        self._listener: Optional[asyncio.Task] = None
+        self._subscribed = asyncio.Event()
+        self._tasks: set[asyncio.Task] = set()
+
+    def publish_after_commit(self, session: AsyncSession, order_id: str, status: OrderStatus | str) -> None:
+        sync_session = session.sync_session
+        pending = sync_session.info.setdefault(_PENDING_CHANGES_KEY, {})
+        # Only the last status set in a transaction is committed
+        pending[order_id] = status.value if hasattr(status, "value") else status
+        if not event.contains(sync_session, "after_commit", self._on_commit):
+            event.listen(sync_session, "after_commit", self._on_commit)
+            event.listen(sync_session, "after_rollback", self._on_rollback)
+
+    def _on_commit(self, sync_session: Session) -> None:
+        pending = sync_session.info.pop(_PENDING_CHANGES_KEY, None)
+        if not pending:
+            return
+        # Runs inside the session's greenlet on the event loop thread
+        task = asyncio.get_running_loop().create_task(self._publish(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _on_rollback(self, sync_session: Session) -> None:
+        sync_session.info.pop(_PENDING_CHANGES_KEY, None)
+
+    async def _publish(self, changes: dict[str, str]) -> None:
+        try:
+            async with self._redis.client.pipeline(transaction=False) as pipe:
+                for order_id, status in changes.items():
+                    pipe.publish(self._channel, json.dumps({"order_id": order_id, "status": status}))
+                await pipe.execute()
+        except Exception as e:
+            # Watchers still get the final status on their next re-read
+            self._logger.warning(f"Failed to publish status changes for {list(changes)}: {e}")
+
+    @asynccontextmanager
+    async def watch(self, order_id: str) -> AsyncIterator["asyncio.Queue[Optional[str]]"]:
+        queue: asyncio.Queue[Optional[str]] = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self._watchers.setdefault(order_id, set()).add(queue)
+        try:
+            if self._listener is None or self._listener.done():
+                self._listener = asyncio.get_running_loop().create_task(self._listen())
+            # Subscribed before the caller reads the current status, so no transition
+            # committed after that read can be missed
+            await asyncio.wait_for(self._subscribed.wait(), self.SUBSCRIBE_TIMEOUT_SEC)
+            yield queue
+        finally:
+            watchers = self._watchers.get(order_id)
+            if watchers is not None:
+                watchers.discard(queue)
+                if not watchers:
+                    del self._watchers[order_id]
+
+    async def _listen(self) -> None:
+        resubscribing = False
+        while True:
+            pubsub = self._redis.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self._channel)
+                self._subscribed.set()
+                if resubscribing:
+                    # Messages published while disconnected are gone; make watchers re-read
+                    for queue in (q for queues in self._watchers.values() for q in queues):
+                        self._offer(queue, None)
+                async for message in pubsub.listen():
+                    self._dispatch(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._logger.warning(f"Order status subscription lost: {e}")
+            finally:
+                self._subscribed.clear()
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            resubscribing = True
+            await asyncio.sleep(self.RECONNECT_DELAY_SEC)
+
+    def _dispatch(self, data) -> None:
+        try:
+            change = json.loads(data)
+            order_id, status = change["order_id"], change["status"]
+        except (TypeError, ValueError, KeyError):
+            self._logger.warning(f"Ignoring malformed order status message: {data!r}")
+            return
+        for queue in self._watchers.get(order_id, ()):
+            self._offer(queue, status)
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, item: Optional[str]) -> None:
+        # A slow watcher only needs the latest status; drop the oldest entry
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(item)
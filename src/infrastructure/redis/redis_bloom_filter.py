@@ -0,0 +1,92 @@
+from typing import Optional
+
+from src.application.interfaces.logging_interface import ILoggingService
+from src.application.interfaces.metrics_interface import IMetricsService
+from src.application.interfaces.redis_interface import IRedisService
+from src.infrastructure.config.settings import settings
+from src.shared.utils.bloom_filter import BloomFilterSpec
+
+
+class RedisBloomFilter:
+    """
+    Bloom filter over a Redis bitmap, shared by every pod.
+
+    A filter only answers "definitely absent" once it is ready, i.e. after a full
+    rebuild set the reserved ready bit. If the bitmap key is evicted or flushed the
+    ready bit goes with it, so a partially repopulated filter is never trusted.
+    """
+
+    def __init__(
+        self,
+        redis: IRedisService,
+        logging_service: ILoggingService,
+        metrics_service: IMetricsService,
+        name: str,
+        capacity: int,
+        error_rate: float,
+    ):
+        self._cache = redis
+        self._logger = logging_service.get_logger("RedisBloomFilter")
+        self._metrics = metrics_service
+        self.name = name
+        self.key = f"{settings.REDIS_KEY_PREFIX}bloom:{name}"
+        self.spec = BloomFilterSpec(capacity, error_rate)
+
+    async def add(self, member: str) -> None:
+        async with self._cache.client.pipeline(transaction=False) as pipe:
+            for offset in self.spec.offsets(member):
+                pipe.setbit(self.key, offset, 1)
+            await pipe.execute()
+
+    async def add_many(self, members: list[str]) -> None:
+        async with self._cache.client.pipeline(transaction=False) as pipe:
+            for member in members:
+                for offset in self.spec.offsets(member):
+                    pipe.setbit(self.key, offset, 1)
+            await pipe.execute()
+
+    async def might_contain(self, member: str) -> Optional[bool]:
+        """
+        False when `member` was definitely never added, True when it may have been,
+        None when the filter cannot answer (not ready yet or Redis unavailable).
+        """
+        try:
+            async with self._cache.client.pipeline(transaction=False) as pipe:
+                pipe.getbit(self.key, BloomFilterSpec.READY_BIT)
+                for offset in self.spec.offsets(member):
+                    pipe.getbit(self.key, offset)
+                ready, *bits = await pipe.execute()
+        except Exception as e:
+            self._logger.warning(f"Bloom filter {self.name} lookup failed: {e}")
+            return None
+
+        if not ready:
+            self._metrics.bloom_filter_checks(filter=self.name, result="not_ready")
+            return None
+        if all(bits):
+            self._metrics.bloom_filter_checks(filter=self.name, result="maybe_present")
+            return True
+        self._metrics.bloom_filter_checks(filter=self.name, result="absent")
+        return False
+
+    def record_false_positive(self) -> None:
+        self._metrics.bloom_filter_checks(filter=self.name, result="false_positive")
+
+    async def is_ready(self) -> bool:
+        return bool(await self._cache.client.getbit(self.key, BloomFilterSpec.READY_BIT))
+
+    async def mark_ready(self) -> None:
+        await self._cache.client.setbit(self.key, BloomFilterSpec.READY_BIT, 1)
+
+    async def publish_stats(self) -> None:
+        """Reports sizing, fill ratio and the false-positive rate implied by it."""
+        set_bits = await self._cache.client.bitcount(self.key)
+        fill_ratio = min(1.0, max(0, set_bits - 1) / self.spec.bit_size)
+        self._metrics.bloom_filter_stats(
+            filter=self.name,
+            bits=self.spec.bit_size,
+            hash_functions=self.spec.hash_count,
+            capacity=self.spec.capacity,
+            fill_ratio=fill_ratio,
+            estimated_false_positive_rate=self.spec.estimated_false_positive_rate(fill_ratio),
+        )
@@ -1,10 +1,12 @@
 import json
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 # import redis
 from redis.asyncio import ConnectionPool, Redis
+from redis.client import NEVER_DECODE
 from src.application.interfaces.logging_interface import ILoggingService
 from src.application.interfaces.redis_interface import IRedisService
 from src.infrastructure.config.settings import settings
+from src.shared.utils.deadline import within_deadline
 from contextlib import asynccontextmanager
 
 
@@ -19,6 +21,18 @@ from contextlib import asynccontextmanager
 #     async def __aexit__(self, exc_type, exc_val, exc_tb):
 #         await self.lock.release()
 
+# Deletes every key recorded in the KEYS[1] set, then the set; DEL is chunked to
+# stay well below Lua's unpack limit
+_DELETE_INDEXED_SCRIPT = """
+local keys = redis.call('SMEMBERS', KEYS[1])
+for i = 1, #keys, 500 do
+    redis.call('DEL', unpack(keys, i, math.min(i + 499, #keys)))
+end
+redis.call('DEL', KEYS[1])
+return #keys
+"""
+
+
 class RedisClient(IRedisService):
     def __init__(self, logger_service: ILoggingService):
         self.logger = logger_service.get_logger("RedisClient")
@@ -44,7 +58,7 @@ class RedisClient(IRedisService):
 
     async def get(self, key: str) -> Optional[bytes]:
         try:
-            value = await self._client.get(self.key_prefix + key)
+            value = await within_deadline(self._client.get(self.key_prefix + key))
             self.logger.debug(f"Redis get: {key} -> {value}")
             return value
         except Exception as e:
@@ -53,7 +67,7 @@ class RedisClient(IRedisService):
 
     async def delete(self, key: str) -> None:
         try:
-            await self._client.delete(self.key_prefix + key)
+            await within_deadline(self._client.delete(self.key_prefix + key))
             self.logger.debug(f"Redis delete: {key}")
         except Exception as e:
             self.logger.error(f"Redis delete failed for key {key}: {str(e)}")
@@ -75,14 +89,89 @@ class RedisClient(IRedisService):
     async def set(self, key: str, value: Any, expire: int | None = settings.REDIS_TTL) -> None:
         try:
             if isinstance(value, (str, bytes)):
-                await self._client.set(self.key_prefix + key, value, ex=expire or settings.REDIS_TTL)
+                await within_deadline(self._client.set(self.key_prefix + key, value, ex=expire or settings.REDIS_TTL))
             else:
-                await self._client.set(self.key_prefix + key, json.dumps(value), ex=expire or settings.REDIS_TTL)
+                await within_deadline(self._client.set(self.key_prefix + key, json.dumps(value), ex=expire or settings.REDIS_TTL))
             self.logger.debug(f"Redis set: {key} -> {value}")
         except Exception as e:
             self.logger.error(f"Redis set failed for key {key}: {str(e)}")
             raise
 
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        try:
+            # The pool decodes responses; binary values (e.g. protobuf) opt out per command
+            value = await within_deadline(
+                self._client.execute_command("GET", self.key_prefix + key, **{NEVER_DECODE: True}))
+            self.logger.debug(f"Redis get_bytes: {key} -> {None if value is None else len(value)} bytes")
+            return value
+        except Exception as e:
+            self.logger.error(f"Redis get_bytes failed for key {key}: {str(e)}")
+            raise
+
+    async def get_many(self, keys: list[str]) -> list[Optional[str]]:
+        if not keys:
+            return []
+        try:
+            values = await within_deadline(
+                self._client.mget([self.key_prefix + key for key in keys]))
+            self.logger.debug(f"Redis mget: {len(keys)} keys")
+            return values
+        except Exception as e:
+            self.logger.error(f"Redis mget failed for {len(keys)} keys: {str(e)}")
+            raise
+
+    async def set_many(
+        self,
+        values: dict[str, Any],
+        expire: int | None = settings.REDIS_TTL,
+        clear_indexes: Sequence[str] = (),
+        delete: Sequence[str] = (),
+    ) -> None:
+        if not values and not clear_indexes and not delete:
+            return
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    if not isinstance(value, (str, bytes)):
+                        value = json.dumps(value)
+                    pipe.set(self.key_prefix + key, value, ex=expire or settings.REDIS_TTL)
+                for index in clear_indexes:
+                    # Plain EVAL: a registered script would cost a SCRIPT EXISTS round trip
+                    pipe.eval(_DELETE_INDEXED_SCRIPT, 1, self.key_prefix + index)
+                if delete:
+                    pipe.delete(*(self.key_prefix + key for key in delete))
+                await within_deadline(pipe.execute())
+            self.logger.debug(
+                f"Redis pipelined set: {len(values)} keys, cleared {len(clear_indexes)} indexes, "
+                f"deleted {len(delete)} keys")
+        except Exception as e:
+            self.logger.error(f"Redis pipelined set failed for {len(values)} keys: {str(e)}")
+            raise
+
+    async def set_indexed(self, key: str, value: Any, index: str, expire: int | None = settings.REDIS_TTL) -> None:
+        if not isinstance(value, (str, bytes)):
+            value = json.dumps(value)
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                pipe.set(self.key_prefix + key, value, ex=expire or settings.REDIS_TTL)
+                pipe.sadd(self.key_prefix + index, self.key_prefix + key)
+                # The index outlives nothing it points at by more than one expiry
+                pipe.expire(self.key_prefix + index, expire or settings.REDIS_TTL)
+                await within_deadline(pipe.execute())
+            self.logger.debug(f"Redis set_indexed: {key} in {index}")
+        except Exception as e:
+            self.logger.error(f"Redis set_indexed failed for key {key}: {str(e)}")
+            raise
+
+    async def delete_indexed(self, index: str) -> None:
+        try:
+            deleted = await within_deadline(
+                self._client.eval(_DELETE_INDEXED_SCRIPT, 1, self.key_prefix + index))
+            self.logger.debug(f"Redis delete_indexed: {index} ({deleted} keys)")
+        except Exception as e:
+            self.logger.error(f"Redis delete_indexed failed for index {index}: {str(e)}")
+            raise
+
     async def close(self):
         await self._client.close()
         await self.pool.disconnect()
@@ -15,12 +15,14 @@ from src.application.interfaces.tracing_interface import ITracingService
 from src.application.interfaces.metrics_interface import IMetricsService
 from src.application.interfaces.logging_interface import ILoggingService
 from src.infrastructure.redis.redis_client import RedisClient
+from src.background_tasks import maintain_idempotency_filter, refresh_course_price_snapshot
 from src.infrastructure.grpc.clients.user_service_client import UserServiceClient
-from src.application.use_cases.order.place_order_use_case import PlaceOrderUseCase
 from src.infrastructure.database.database import db, get_db, AsyncSession
 from src.presentation.grpc.order_server import start_grpc_server
 from src.infrastructure.di.container import Container
 from src.infrastructure.config.settings import settings
+from src.infrastructure.config.runtime_roles import RuntimeRole, parse_runtime_roles
+import argparse
 import logging
 from fastapi import FastAPI, Depends, HTTPException
 import uvicorn
@@ -31,39 +33,66 @@ from contextlib import asynccontextmanager
 # Initialize container
 container = Container()
 
+# Roles this process runs; an invalid SERVICE_ROLES fails at startup
+roles = parse_runtime_roles(settings.SERVICE_ROLES)
+# The consumer publishes to its DLQ and the scheduler drains the outbox
+needs_kafka_producer = bool(roles & {RuntimeRole.CONSUMER, RuntimeRole.SCHEDULER})
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     try:
-        # Start Kafka producer
-        kafka_producer = container.kafka_producer()
-        await kafka_producer.start()
-        
         logging_service = container.logging_service()
-        
-
-        # Start Kafka consumer
-        kafka_consumer = container.kafka_consumer()
-        asyncio.create_task(kafka_consumer.start())
-
-        # Start gRPC server
-        auth_guard = container.auth_guard()
         metrics_service = container.metrics_service()
         tracing_service = container.tracing_service()
-        asyncio.create_task(
-            start_grpc_server(
-                place_order_use_case=container.place_order_use_case(),
-                get_orders_use_case=container.get_orders_use_case(),
-                get_revenue_stats_use_case=container.get_revenue_stats_use_case(),
-                get_order_use_case=container.get_order_use_case(),
-                restore_order_use_case=container.restore_order_use_case(),
-                # book_session_use_case=container.book_session_use_case(),
-                auth_guard=auth_guard,
-                logger_service=logging_service,
-                metrics=metrics_service,
-                tracer=tracing_service,
+        logging_service.get_logger("Lifespan").info(
+            f"Starting roles: {', '.join(sorted(role.value for role in roles))}")
+
+        # Start Kafka producer
+        if needs_kafka_producer:
+            kafka_producer = container.kafka_producer()
+            await kafka_producer.start()
+
+        # Start Kafka consumer
+        if RuntimeRole.CONSUMER in roles:
+            kafka_consumer = container.kafka_consumer()
+            asyncio.create_task(kafka_consumer.start())
+
+        if RuntimeRole.SCHEDULER in roles:
+            # Publish events staged in the outbox
+            asyncio.create_task(container.outbox_relay().run())
+
+            if settings.IDEMPOTENCY_FILTER_ENABLED:
+                asyncio.create_task(maintain_idempotency_filter(
+                    container.order_repository(), container.idempotency_filter(),
+                    container.redis_client(), logging_service))
+
+        # Start gRPC server (in-process unless src.serve runs it in worker processes)
+        if RuntimeRole.API in roles and settings.GRPC_WORKERS == 0:
+            auth_guard = container.auth_guard()
+            place_order_use_case = container.place_order_use_case()
+            asyncio.create_task(
+                refresh_course_price_snapshot(place_order_use_case, logging_service))
+            asyncio.create_task(
+                start_grpc_server(
+                    place_order_use_case=place_order_use_case,
+                    get_orders_use_case=container.get_orders_use_case(),
+                    batch_get_orders_use_case=container.batch_get_orders_use_case(),
+                    stream_orders_use_case=container.stream_orders_use_case(),
+                    get_revenue_stats_use_case=container.get_revenue_stats_use_case(),
+                    get_order_use_case=container.get_order_use_case(),
+                    get_order_status_use_case=container.get_order_status_use_case(),
+                    watch_order_status_use_case=container.watch_order_status_use_case(),
+                    restore_order_use_case=container.restore_order_use_case(),
+                    # book_session_use_case=container.book_session_use_case(),
+                    auth_guard=auth_guard,
+                    logger_service=logging_service,
+                    metrics=metrics_service,
+                    tracer=tracing_service,
+                    order_response_cache=(
+                        container.order_response_cache() if settings.ORDER_RESPONSE_CACHE_ENABLED else None),
+                )
             )
-        )
 
         async with get_db() as session:
             pass
@@ -81,9 +110,16 @@ async def lifespan(app: FastAPI):
     finally:
         # Shutdown
         try:
-            kafka_producer = container.kafka_producer()
-            await kafka_producer.stop()
+            if needs_kafka_producer:
+                kafka_producer = container.kafka_producer()
+                await kafka_producer.stop()
             await container.redis_client().close()
+            for client in (
+                container.user_service_client(),
+                container.course_service_client(),
+                container.session_service_client(),
+            ):
+                await client.close()
         except Exception as e:
             logging.exception(f"Lifespan shutdown error: {e}")
             # Optionally exit with error code
@@ -118,8 +154,9 @@ async def readiness_check(db: AsyncSession = Depends(db), logging_service: ILogg
     status = {
         "redis": "up",
         "database": "up",
-        "kafka": "up",
     }
+    if RuntimeRole.CONSUMER in roles:
+        status["kafka"] = "up"
     try:
         try:
             await db.execute(text("SELECT 1"))
@@ -133,8 +170,9 @@ async def readiness_check(db: AsyncSession = Depends(db), logging_service: ILogg
             status["redis"] = "down"
             raise
         
-        kafka_is_healthy = await container.kafka_consumer().is_healthy()
-        status["kafka"] = "up" if kafka_is_healthy else "down"
+        if RuntimeRole.CONSUMER in roles:
+            kafka_is_healthy = await container.kafka_consumer().is_healthy()
+            status["kafka"] = "up" if kafka_is_healthy else "down"
         
         is_all_healthy = all(value == "up" for value in status.values())
         if not is_all_healthy:
@@ -147,5 +185,15 @@ async def readiness_check(db: AsyncSession = Depends(db), logging_service: ILogg
         raise HTTPException(status_code=503, detail={"status": "unhealthy", **status})
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Order service")
+    parser.add_argument(
+        "--roles",
+        help="Comma-separated roles to run (api, consumer, scheduler); overrides SERVICE_ROLES",
+    )
+    args = parser.parse_args()
+    if args.roles:
+        # uvicorn imports src.main afresh; it reads the roles from the shared settings
+        parse_runtime_roles(args.roles)
+        settings.SERVICE_ROLES = args.roles
     uvicorn.run("src.main:app", host="0.0.0.0",
                 port=settings.HTTP_PORT, log_level=logging.INFO, reload=False)
@@ -11,7 +11,13 @@ from src.domain.exceptions.exceptions import DomainException
 from src.application.dtos.get_order_dto import GetOrderDto
 from src.application.dtos.get_orders_by_user_dto import GetOrdersByUserDto
 from src.application.use_cases.order.get_order_use_case import GetOrderUseCase
+from src.application.use_cases.order.get_order_status_use_case import GetOrderStatusUseCase
+from src.application.use_cases.order.watch_order_status_use_case import WatchOrderStatusUseCase
 from src.application.use_cases.order.get_orders_use_case import GetOrdersUseCase
+from src.application.use_cases.order.batch_get_orders_use_case import BatchGetOrdersUseCase
+from src.application.use_cases.order.stream_orders_use_case import StreamOrdersUseCase
+from src.application.dtos.stream_orders_dto import StreamOrdersDto
+from src.application.dtos.batch_get_orders_dto import BatchGetOrdersDto
 from src.application.interfaces.logging_interface import ILoggingService
 from src.application.interfaces.metrics_interface import IMetricsService
 from src.application.interfaces.tracing_interface import ITracingService
@@ -22,8 +28,14 @@ from src.application.dtos.session_booking_create_dto import SessionBookingCreate
 from src.application.use_cases.session_booking.session_booking_use_case import BookSessionUseCase
 from src.infrastructure.grpc.auth_guard import AuthGuard
 from src.infrastructure.grpc.generated.order_service_pb2 import (
+    BatchGetOrdersRequest,
+    BatchGetOrdersResponse,
+    BatchOrdersSuccess,
     GetOrdersRequest,
     GetRevenueStatsResponse,
+    OrderStreamItem,
+    StreamOrdersRequest,
+    StreamOrdersResponse,
     OrderResponse,
     OrderStatus,
     OrderStatusResponse,
@@ -38,10 +50,14 @@ from src.infrastructure.grpc.generated.order_service_pb2_grpc import OrderServic
 from src.application.use_cases.order.place_order_use_case import PlaceOrderUseCase
 from src.application.use_cases.order.restore_order_use_case import RestoreOrderUseCase
 from src.infrastructure.grpc.interceptors.server_interceptor import (
+    ServerAdmissionControlInterceptor,
+    ServerDeadlineInterceptor,
     ServerLoggingInterceptor,
     ServerMetricsInterceptor,
+    ServerPreSerializedResponseInterceptor,
     ServerTracingInterceptor,
 )
+from src.infrastructure.redis.order_response_cache import OrderResponseCache
 from src.infrastructure.config.settings import settings
 
 
@@ -49,18 +65,27 @@ class OrderServiceImpl(OrderServiceServicer):
     def __init__(self,
                  place_order_use_case: PlaceOrderUseCase,
                  get_order_use_case: GetOrderUseCase,
+                 get_order_status_use_case: GetOrderStatusUseCase,
+                 watch_order_status_use_case: WatchOrderStatusUseCase,
                  get_revenue_stats_use_case: GetRevenueStatsUseCase,
                  restore_order_use_case: RestoreOrderUseCase,
                  get_orders_use_case: GetOrdersUseCase,
+                 batch_get_orders_use_case: BatchGetOrdersUseCase,
+                 stream_orders_use_case: StreamOrdersUseCase,
                 #  book_session_use_case: BookSessionUseCase,
-                 logger: ILoggingService
+                 logger: ILoggingService,
+                 order_response_cache: OrderResponseCache | None = None,
                  ):
         self.place_order_use_case = place_order_use_case
         self.get_order_use_case = get_order_use_case
-        self.get_order_use_case = get_order_use_case
+        self.get_order_status_use_case = get_order_status_use_case
+        self.watch_order_status_use_case = watch_order_status_use_case
         self.get_revenue_stats_use_case = get_revenue_stats_use_case
         self.restore_order_use_case = restore_order_use_case
         self.get_orders_use_case = get_orders_use_case
+        self.batch_get_orders_use_case = batch_get_orders_use_case
+        self.stream_orders_use_case = stream_orders_use_case
+        self.order_response_cache = order_response_cache
         # self.book_session_use_case = book_session_use_case
         self.logger = logger.get_logger("OrderServiceImpl")
 
@@ -103,12 +128,20 @@ class OrderServiceImpl(OrderServiceServicer):
         self.logger.info(
             f"Received GetOrderById request for user {request.order_id}")
         try:
+            if self.order_response_cache is not None:
+                cached = await self.order_response_cache.get_response(request.order_id)
+                if cached is not None:
+                    # Already-serialized OrderResponse; see ServerPreSerializedResponseInterceptor
+                    return cached
             order_dto = GetOrderDto(
                 order_id=request.order_id)
             result = await self.get_order_use_case.execute(order_dto)
             self.logger.info(f"fetched order with id {request.order_id}")
+            order_data = result.to_response_data()
+            if self.order_response_cache is not None:
+                await self.order_response_cache.put(result.id, order_data)
             return OrderResponse(
-                success=OrderSuccess(order=result.to_response_data())
+                success=OrderSuccess(order=order_data)
 
             )
 
@@ -178,11 +211,11 @@ class OrderServiceImpl(OrderServiceServicer):
         try:
             order_dto = GetOrderDto(
                 order_id=request.order_id)
-            result = await self.get_order_use_case.execute(order_dto)
+            status = await self.get_order_status_use_case.execute(order_dto)
             self.logger.info(f"fetched status with id {request.order_id}")
             return OrderStatusResponse(
-                success=OrderStatus(order_id=result.id,
-                                    status=result.status.value)
+                success=OrderStatus(order_id=request.order_id,
+                                    status=status.value)
 
             )
 
@@ -191,12 +224,35 @@ class OrderServiceImpl(OrderServiceServicer):
             return await handle_grpc_exception(
                 exc=e,
                 ctx=context,
-                response_model=OrderResponse,
+                response_model=OrderStatusResponse,
                 operation="place order",
                 default_message="Failed to get order status",
                 logger=self.logger
             )
 
+    async def WatchOrderStatus(self, request, context: aio.ServicerContext):
+        self.logger.info(
+            f"Received WatchOrderStatus request for order {request.order_id}")
+        try:
+            order_dto = GetOrderDto(
+                order_id=request.order_id)
+            async for status in self.watch_order_status_use_case.execute(order_dto):
+                yield OrderStatusResponse(
+                    success=OrderStatus(order_id=request.order_id,
+                                        status=status.value)
+                )
+
+        except Exception as e:
+            self.logger.error(f"Failed to watch order status: {str(e)}")
+            yield await handle_grpc_exception(
+                exc=e,
+                ctx=context,
+                response_model=OrderStatusResponse,
+                operation="watch order status",
+                default_message="Failed to watch order status",
+                logger=self.logger
+            )
+
     async def GetOrders(self, request: GetOrdersRequest, context: aio.ServicerContext):
         self.logger.info(
             f"Received GetOrders request for user {request.user_id}")
@@ -226,6 +282,54 @@ class OrderServiceImpl(OrderServiceServicer):
                 logger=self.logger
             )
 
+    async def StreamOrders(self, request: StreamOrdersRequest, context: aio.ServicerContext):
+        self.logger.info(
+            f"Received StreamOrders request for user {request.user_id}")
+        try:
+            stream_dto = StreamOrdersDto.from_proto(request)
+            async for order, cursor in self.stream_orders_use_case.execute(stream_dto):
+                yield StreamOrdersResponse(
+                    success=OrderStreamItem(
+                        order=order.to_response_data(), cursor=cursor)
+                )
+
+        except Exception as e:
+            self.logger.error(f"Failed to stream orders: {str(e)}")
+            yield await handle_grpc_exception(
+                e,
+                context,
+                StreamOrdersResponse,
+                operation="stream orders",
+                default_message="Failed to stream orders",
+                logger=self.logger
+            )
+
+    async def BatchGetOrders(self, request: BatchGetOrdersRequest, context: aio.ServicerContext):
+        self.logger.info(
+            f"Received BatchGetOrders request for {len(request.order_ids)} orders")
+        try:
+            batch_dto = BatchGetOrdersDto(order_ids=list(request.order_ids))
+            result = await self.batch_get_orders_use_case.execute(batch_dto)
+            self.logger.info(
+                f"Fetched {len(result['orders'])} orders, {len(result['missing_ids'])} missing")
+            return BatchGetOrdersResponse(
+                success=BatchOrdersSuccess(
+                    orders=[order.to_response_data()
+                            for order in result["orders"]],
+                    missing_ids=result["missing_ids"]),
+            )
+
+        except Exception as e:
+            self.logger.error(f"Failed to batch get orders: {str(e)}")
+            return await handle_grpc_exception(
+                e,
+                context,
+                BatchGetOrdersResponse,
+                operation="batch get orders",
+                default_message="Failed to get orders",
+                logger=self.logger
+            )
+
     # async def BookSession(self, request, context: aio.ServicerContext):
     #     self.logger.info(
     #         f"Received BookSession request for user {request.user_id}")
@@ -290,30 +394,64 @@ async def start_grpc_server(
     place_order_use_case: PlaceOrderUseCase,
     # book_session_use_case: BookSessionUseCase,
     get_order_use_case: GetOrderUseCase,
+    get_order_status_use_case: GetOrderStatusUseCase,
+    watch_order_status_use_case: WatchOrderStatusUseCase,
     get_revenue_stats_use_case: GetRevenueStatsUseCase,
     restore_order_use_case: RestoreOrderUseCase,
     get_orders_use_case: GetOrdersUseCase,
+    batch_get_orders_use_case: BatchGetOrdersUseCase,
+    stream_orders_use_case: StreamOrdersUseCase,
     auth_guard: AuthGuard,
     logger_service: ILoggingService,
     metrics: IMetricsService,
     tracer: ITracingService,
+    order_response_cache: OrderResponseCache | None = None,
 ):
+    interceptors: list[aio.ServerInterceptor] = [
+        ServerPreSerializedResponseInterceptor(),
+        ServerLoggingInterceptor(logger_service),
+        # Tracing outside metrics so latency exemplars see the server span
+        ServerTracingInterceptor(),
+        ServerMetricsInterceptor(logger=logger_service, metrics=metrics),
+        ServerDeadlineInterceptor(
+            default_timeout_sec=settings.GRPC_SERVER_DEFAULT_DEADLINE_MS / 1000
+            if settings.GRPC_SERVER_DEFAULT_DEADLINE_MS else None),
+        # ServerAuthInterceptor(auth_guard, logger_service),
+    ]
+    if settings.ADMISSION_CONTROL_ENABLED:
+        interceptors.append(ServerAdmissionControlInterceptor(
+            metrics=metrics,
+            logger=logger_service,
+            method_priorities={
+                "PlaceOrder": 1.0,
+                "GetOrders": settings.ADMISSION_LOW_PRIORITY_SHARE,
+                "BatchGetOrders": settings.ADMISSION_LOW_PRIORITY_SHARE,
+                "GetRevenueStats": settings.ADMISSION_LOW_PRIORITY_SHARE,
+            },
+            latency_target_sec=settings.ADMISSION_LATENCY_TARGET_MS / 1000,
+            method_max_limit=settings.ADMISSION_METHOD_MAX_LIMIT,
+            global_max_limit=settings.ADMISSION_GLOBAL_MAX_LIMIT,
+        ))
     server = aio.server(
-        interceptors=[
-            ServerLoggingInterceptor(logger_service),
-            ServerMetricsInterceptor(logger=logger_service, metrics=metrics),
-            ServerTracingInterceptor(),
-            # ServerAuthInterceptor(auth_guard, logger_service),
-        ]
+        interceptors=interceptors,
+        maximum_concurrent_rpcs=settings.GRPC_MAX_CONCURRENT_RPCS,
+        # Lets several worker processes (src.serve) bind GRPC_PORT; the kernel
+        # balances new connections between them
+        options=[("grpc.so_reuseport", 1)],
     )
     add_OrderServiceServicer_to_server(
         OrderServiceImpl(place_order_use_case,
                          get_order_use_case,
+                         get_order_status_use_case,
+                         watch_order_status_use_case,
                          get_revenue_stats_use_case,
                          restore_order_use_case,
                          get_orders_use_case,
+                         batch_get_orders_use_case,
+                         stream_orders_use_case,
                         #  book_session_use_case,
-                         logger_service),
+                         logger_service,
+                         order_response_cache),
                          server
     )
     logger = logger_service.get_logger("start_grpc_server")
@@ -328,4 +466,4 @@ async def start_grpc_server(
         raise
     finally:
         # Ensure server is stopped before the event loop closes to avoid warnings
-        await server.stop(grace=1)
+        await server.stop(grace=settings.GRPC_SHUTDOWN_GRACE_SEC)
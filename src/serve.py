@@ -0,0 +1,222 @@
+"""
+Multi-process gRPC serving.
+
+`python -m src.serve` starts a supervisor that runs GRPC_WORKERS worker processes.
+Each worker binds GRPC_PORT with SO_REUSEPORT, so the kernel spreads incoming
+connections across them, and owns its event loop, DB pool and gRPC channel pools.
+The supervisor restarts workers that die, drains them gracefully on SIGTERM/SIGINT
+and serves Prometheus metrics aggregated across workers on PROMETHEUS_PORT.
+
+The HTTP app and Kafka consumer keep running from `src.main`; the gRPC server is
+not started there while GRPC_WORKERS > 0.
+"""
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import asyncio
+import logging
+import multiprocessing
+import shutil
+import signal
+import time
+from multiprocessing.connection import wait
+
+from src.infrastructure.config.settings import settings
+
+
+logger = logging.getLogger("GrpcSupervisor")
+
+
+async def serve_worker() -> None:
+    # Imported here so each spawned worker builds its own container, pools and
+    # metrics after PROMETHEUS_MULTIPROC_DIR is in its environment.
+    from src.infrastructure.di.container import Container
+    from src.background_tasks import refresh_course_price_snapshot
+    from src.presentation.grpc.order_server import start_grpc_server
+
+    container = Container()
+    logging_service = container.logging_service()
+    logging_service.initialize()
+    container.tracing_service().setup_tracing()
+
+    place_order_use_case = container.place_order_use_case()
+    refresher = asyncio.create_task(
+        refresh_course_price_snapshot(place_order_use_case, logging_service))
+    server_task = asyncio.create_task(
+        start_grpc_server(
+            place_order_use_case=place_order_use_case,
+            get_orders_use_case=container.get_orders_use_case(),
+            batch_get_orders_use_case=container.batch_get_orders_use_case(),
+            stream_orders_use_case=container.stream_orders_use_case(),
+            get_revenue_stats_use_case=container.get_revenue_stats_use_case(),
+            get_order_use_case=container.get_order_use_case(),
+            get_order_status_use_case=container.get_order_status_use_case(),
+            watch_order_status_use_case=container.watch_order_status_use_case(),
+            restore_order_use_case=container.restore_order_use_case(),
+            auth_guard=container.auth_guard(),
+            logger_service=logging_service,
+            metrics=container.metrics_service(),
+            tracer=container.tracing_service(),
+            order_response_cache=(
+                container.order_response_cache() if settings.ORDER_RESPONSE_CACHE_ENABLED else None),
+        )
+    )
+
+    # Cancelling the server task makes start_grpc_server stop with its drain grace
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, server_task.cancel)
+
+    try:
+        await server_task
+    except asyncio.CancelledError:
+        pass
+    finally:
+        refresher.cancel()
+        await container.redis_client().close()
+        for client in (
+            container.user_service_client(),
+            container.course_service_client(),
+            container.session_service_client(),
+        ):
+            await client.close()
+        container.tracing_service().shutdown()
+
+
+def run_worker(index: int) -> None:
+    logging.getLogger("GrpcWorker").info(f"gRPC worker {index} starting (pid {os.getpid()})")
+    asyncio.run(serve_worker())
+
+
+class WorkerSupervisor:
+    # A worker dying sooner than this after start counts as a crash loop
+    MIN_UPTIME_SEC = 5
+    MAX_RESTART_DELAY_SEC = 30
+    POLL_INTERVAL_SEC = 1.0
+
+    def __init__(self, worker_count: int, shutdown_grace_sec: float):
+        self.worker_count = worker_count
+        self.shutdown_grace_sec = shutdown_grace_sec
+        self._ctx = multiprocessing.get_context("spawn")
+        self._workers: dict[int, multiprocessing.Process] = {}
+        self._started_at: dict[int, float] = {}
+        self._restart_delay: dict[int, float] = {}
+        # Workers that exited and are waiting out their backoff, by restart time
+        self._restart_at: dict[int, float] = {}
+        self._stopping = False
+
+    def run(self) -> None:
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+
+        for index in range(self.worker_count):
+            self._start(index)
+
+        while not self._stopping:
+            self._step()
+
+        self._drain()
+
+    def _step(self) -> None:
+        """
+        One supervisor iteration: starts workers whose backoff is over, then waits for
+        a live worker to exit (or the next restart to fall due) and schedules its
+        restart. Never sleeps out a backoff, so other exits and stop requests are
+        handled while a crash-looping worker waits.
+        """
+        now = time.monotonic()
+        for index, restart_at in list(self._restart_at.items()):
+            if restart_at <= now:
+                del self._restart_at[index]
+                self._start(index)
+
+        timeout = self.POLL_INTERVAL_SEC
+        if self._restart_at:
+            timeout = min(timeout, max(0.0, min(self._restart_at.values()) - now))
+        sentinels = {
+            p.sentinel: i for i, p in self._workers.items() if i not in self._restart_at}
+        for sentinel in wait(list(sentinels), timeout=timeout):
+            if not self._stopping:
+                self._schedule_restart(sentinels[sentinel])
+
+    def _start(self, index: int) -> None:
+        process = self._ctx.Process(
+            target=run_worker, args=(index,), name=f"grpc-worker-{index}", daemon=False)
+        process.start()
+        self._workers[index] = process
+        self._started_at[index] = time.monotonic()
+        logger.info(f"Started gRPC worker {index} (pid {process.pid})")
+
+    def _schedule_restart(self, index: int) -> None:
+        process = self._workers[index]
+        process.join()
+        _mark_metrics_process_dead(process.pid)
+
+        now = time.monotonic()
+        uptime = now - self._started_at[index]
+        if uptime < self.MIN_UPTIME_SEC:
+            delay = min(self.MAX_RESTART_DELAY_SEC, max(1.0, self._restart_delay.get(index, 0) * 2))
+        else:
+            delay = 0.0
+        self._restart_delay[index] = delay
+        self._restart_at[index] = now + delay
+        logger.warning(
+            f"gRPC worker {index} (pid {process.pid}) exited with code {process.exitcode} "
+            f"after {uptime:.1f}s; restarting in {delay:.0f}s")
+
+    def _request_stop(self, signum, frame) -> None:
+        logger.info(f"Received signal {signum}; draining gRPC workers")
+        self._stopping = True
+
+    def _drain(self) -> None:
+        for process in self._workers.values():
+            if process.is_alive():
+                process.terminate()  # SIGTERM: the worker stops its server with grace
+
+        deadline = time.monotonic() + self.shutdown_grace_sec + 5
+        for process in self._workers.values():
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning(f"gRPC worker pid {process.pid} did not drain in time; killing")
+                process.kill()
+                process.join()
+            _mark_metrics_process_dead(process.pid)
+
+
+def _mark_metrics_process_dead(pid: int | None) -> None:
+    if pid is None or not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(pid)
+
+
+def _prepare_metrics_dir() -> None:
+    # Must happen before prometheus_client is imported anywhere: it picks its value
+    # backend (per-process mmap files vs in-memory) from the environment at import time.
+    metrics_dir = settings.PROMETHEUS_MULTIPROC_DIR
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = metrics_dir
+
+
+def _serve_aggregated_metrics() -> None:
+    from prometheus_client import CollectorRegistry, start_http_server, multiprocess
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    start_http_server(settings.PROMETHEUS_PORT, registry=registry)
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    worker_count = settings.GRPC_WORKERS or os.cpu_count() or 1
+    _prepare_metrics_dir()
+    _serve_aggregated_metrics()
+    logger.info(f"Starting {worker_count} gRPC workers on port {settings.GRPC_PORT}")
+    WorkerSupervisor(worker_count, settings.GRPC_SHUTDOWN_GRACE_SEC).run()
+
+
+if __name__ == "__main__":
+    main()
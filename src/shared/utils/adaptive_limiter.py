@@ -0,0 +1,54 @@
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limit driven by observed latency.
+
+    Every request that finishes within `latency_target_sec` while the limit is at
+    least half used grows the limit by 1/limit, i.e. roughly +1 per limit's worth of
+    requests. A slow or overloaded completion multiplies it by `backoff_ratio`.
+    Admission is a plain in-flight check, so a rejected request costs nothing.
+
+    `share` lets lower-priority callers use only part of the limit, keeping the rest
+    as headroom for higher-priority ones. Not thread-safe; one event loop only.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        latency_target_sec: float = 0.5,
+        backoff_ratio: float = 0.9,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("expected 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target_sec = latency_target_sec
+        self.backoff_ratio = backoff_ratio
+        self._limit = float(initial_limit)
+        self.in_flight = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def try_acquire(self, share: float = 1.0) -> bool:
+        if self.in_flight >= max(self.min_limit, int(self._limit * share)):
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self, latency_sec: float, overloaded: bool = False) -> None:
+        """Frees a slot and adapts the limit to how the request went."""
+        saturated = self.in_flight * 2 >= self._limit
+        self.in_flight -= 1
+        if overloaded or latency_sec > self.latency_target_sec:
+            self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+        elif saturated:
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+    def cancel(self) -> None:
+        """Frees a slot without feedback, for a request that never ran."""
+        self.in_flight -= 1
@@ -0,0 +1,34 @@
+import hashlib
+import math
+
+
+class BloomFilterSpec:
+    """
+    Sizing and bit positions for a Bloom filter, independent of where the bits live.
+
+    `bit_size` and `hash_count` are the optimal values for holding `capacity` keys at
+    `error_rate`. Bit 0 is reserved (see `READY_BIT`), so key offsets start at 1 and
+    the backing bitmap needs `bit_size + 1` bits.
+    """
+
+    READY_BIT = 0
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bit_size = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.hash_count = max(1, round(self.bit_size / capacity * math.log(2)))
+
+    def offsets(self, key: str) -> list[int]:
+        # Kirsch-Mitzenmacher double hashing over one 128-bit digest
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [1 + (h1 + i * h2) % self.bit_size for i in range(self.hash_count)]
+
+    def estimated_false_positive_rate(self, fill_ratio: float) -> float:
+        return fill_ratio ** self.hash_count
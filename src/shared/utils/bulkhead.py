@@ -0,0 +1,100 @@
+import asyncio
+from collections import deque
+from typing import Callable, Optional
+
+from src.domain.exceptions.exceptions import DeadlineExceededException, UpstreamSaturatedException
+from src.shared.utils.adaptive_limiter import AdaptiveConcurrencyLimiter
+from src.shared.utils.deadline import remaining, timeout_for
+
+
+class Bulkhead:
+    """
+    Caps concurrent calls to one dependency with an AdaptiveConcurrencyLimiter, so a
+    slow dependency can only hold `limiter.limit` callers at a time.
+
+    Callers beyond the limit wait FIFO for up to `queue_timeout_sec` (bounded by the
+    request deadline), with at most `max_queue` waiting. A full queue, or a
+    `queue_timeout_sec` of 0, fails fast. Either way the caller gets
+    UpstreamSaturatedException. A freed slot goes straight to the oldest waiter.
+
+    `on_change` is called whenever the limit, in-flight count or queue depth may
+    have changed, for exporting them. Not thread-safe; one event loop only.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limiter: AdaptiveConcurrencyLimiter,
+        max_queue: int = 50,
+        queue_timeout_sec: float = 0.1,
+        on_change: Optional[Callable[["Bulkhead"], None]] = None,
+    ) -> None:
+        self.name = name
+        self.limiter = limiter
+        self.max_queue = max_queue
+        self.queue_timeout_sec = queue_timeout_sec
+        self._on_change = on_change
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        if not self._waiters and self.limiter.try_acquire():
+            self._changed()
+            return
+        if self.queue_timeout_sec <= 0 or len(self._waiters) >= self.max_queue:
+            raise UpstreamSaturatedException(f"{self.name} is saturated")
+
+        timeout = timeout_for(self.queue_timeout_sec)
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._changed()
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except BaseException as e:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            if waiter.done() and not waiter.cancelled():
+                # A slot was handed over just as we gave up; pass it on
+                self.limiter.cancel()
+                self._wake()
+            self._changed()
+            if isinstance(e, asyncio.TimeoutError):
+                left = remaining()
+                if left is not None and left <= 0:
+                    raise DeadlineExceededException("Request deadline exceeded")
+                raise UpstreamSaturatedException(
+                    f"{self.name} is saturated (queued {self.queue_timeout_sec}s)")
+            raise
+
+    def try_acquire(self) -> bool:
+        """Takes a slot only if one is free right now and nobody is queued for it."""
+        if self._waiters or not self.limiter.try_acquire():
+            return False
+        self._changed()
+        return True
+
+    def release(self, latency_sec: float, overloaded: bool = False) -> None:
+        self.limiter.release(latency_sec, overloaded=overloaded)
+        self._wake()
+        self._changed()
+
+    def cancel(self) -> None:
+        """Frees a slot without latency feedback, for a call abandoned before it finished."""
+        self.limiter.cancel()
+        self._wake()
+        self._changed()
+
+    def _wake(self) -> None:
+        while self._waiters and self.limiter.try_acquire():
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                self.limiter.cancel()
+                continue
+            waiter.set_result(None)
+
+    def _changed(self) -> None:
+        if self._on_change is not None:
+            self._on_change(self)
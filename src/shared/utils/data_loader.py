@@ -0,0 +1,86 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+from src.shared.utils.deadline import detached_from_deadline, within_deadline
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Coalesces individual `load(key)` calls made by concurrent coroutines into one
+    `batch_fn(keys)` call.
+
+    Keys requested within `batch_window_sec` of the first key of a batch (or until
+    `max_batch_size` distinct keys are queued) are dispatched together. A key that is
+    already queued or in flight is not requested again; every caller awaiting it shares
+    the same future. Nothing is cached once a batch completes.
+
+    `batch_fn` returns a mapping of the keys it found; keys missing from the mapping
+    resolve to None. If `batch_fn` raises, every caller in that batch receives the error.
+
+    A batch serves several callers, so it runs without any one caller's request
+    deadline; each caller instead stops waiting once its own deadline passes.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[K]], Awaitable[dict[K, V]]],
+        max_batch_size: int = 100,
+        batch_window_sec: float = 0.005,
+    ) -> None:
+        self._batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.batch_window_sec = batch_window_sec
+        self._queued: dict[K, asyncio.Future] = {}
+        self._in_flight: dict[K, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        future = self._queued.get(key) or self._in_flight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._queued[key] = future
+            if len(self._queued) >= self.max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.batch_window_sec, self._dispatch)
+        # Shield so one cancelled caller does not cancel the result for the others
+        return await within_deadline(asyncio.shield(future))
+
+    async def load_many(self, keys: list[K]) -> list[Optional[V]]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._queued:
+            return
+        batch, self._queued = self._queued, {}
+        self._in_flight.update(batch)
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: dict[K, asyncio.Future]) -> None:
+        try:
+            with detached_from_deadline():
+                results = await self._batch_fn(list(batch.keys()))
+        except BaseException as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+        else:
+            for key, future in batch.items():
+                if not future.done():
+                    future.set_result(results.get(key))
+        finally:
+            for key, future in batch.items():
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
@@ -0,0 +1,83 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+from src.domain.exceptions.exceptions import DeadlineExceededException
+
+T = TypeVar("T")
+
+# Absolute time.monotonic() by which the current request must be answered, if any
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(timeout_sec: Optional[float]) -> Iterator[None]:
+    """
+    Sets the request deadline to `timeout_sec` from now for the enclosed code (and any
+    task it creates). A scope never extends an outer deadline; None clears it, which
+    is meant for work shared between requests such as DataLoader batches.
+    """
+    if timeout_sec is None:
+        deadline = None
+    else:
+        deadline = time.monotonic() + max(0.0, timeout_sec)
+        outer = _deadline.get()
+        if outer is not None:
+            deadline = min(deadline, outer)
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def detached_from_deadline() -> Iterator[None]:
+    with deadline_scope(None):
+        yield
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline, or None when there is none."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def timeout_for(default: Optional[float] = None) -> Optional[float]:
+    """
+    Timeout to give a downstream call: the smaller of `default` and the time left.
+    Raises DeadlineExceededException when the budget is already spent.
+    """
+    left = remaining()
+    if left is None:
+        return default
+    if left <= 0:
+        raise DeadlineExceededException("Request deadline exceeded")
+    return left if default is None else min(default, left)
+
+
+async def within_deadline(aw: Awaitable[T]) -> T:
+    """Awaits `aw`, giving up with DeadlineExceededException once the deadline passes."""
+    timeout = timeout_for()
+    if timeout is None:
+        return await aw
+    try:
+        return await asyncio.wait_for(aw, timeout)
+    except asyncio.TimeoutError:
+        raise DeadlineExceededException("Request deadline exceeded")
+
+
+def stop_on_deadline(retry_state) -> bool:
+    """
+    Tenacity stop condition: give up once the deadline has passed or would pass
+    during the next backoff sleep. Combine with the existing stop, e.g.
+    `stop=stop_after_attempt(3) | stop_on_deadline`.
+    """
+    left = remaining()
+    if left is None:
+        return False
+    return left <= (retry_state.upcoming_sleep or 0)
@@ -0,0 +1,27 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+CURSOR_VERSION = 1
+
+
+def encode_cursor(position: dict[str, Any]) -> str:
+    """
+    Encodes a keyset position (the sort key values of the last row returned, plus
+    anything the query must match on resume) as an opaque URL-safe token.
+    """
+    payload = json.dumps({"v": CURSOR_VERSION, **position}, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """Inverse of `encode_cursor`. Raises ValueError for a malformed or foreign token."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Malformed cursor: {e}") from e
+    if not isinstance(position, dict) or position.pop("v", None) != CURSOR_VERSION:
+        raise ValueError("Unsupported cursor version")
+    return position
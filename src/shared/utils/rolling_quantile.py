@@ -0,0 +1,38 @@
+import math
+from collections import deque
+from typing import Optional
+
+
+class RollingQuantile:
+    """
+    Tracks a quantile (e.g. p95) over the last `window` observations.
+
+    `value()` is None until `min_samples` observations have been seen, so callers can
+    tell "no estimate yet" from a real one. The sorted view is rebuilt lazily, only
+    when asked for after new observations. Not thread-safe; one event loop only.
+    """
+
+    def __init__(self, quantile: float = 0.95, window: int = 200, min_samples: int = 20) -> None:
+        if not 0 < quantile < 1:
+            raise ValueError("quantile must be between 0 and 1")
+        if not 1 <= min_samples <= window:
+            raise ValueError("expected 1 <= min_samples <= window")
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+        self._cached: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def observe(self, value: float) -> None:
+        self._samples.append(value)
+        self._cached = None
+
+    def value(self) -> Optional[float]:
+        if len(self._samples) < self.min_samples:
+            return None
+        if self._cached is None:
+            ordered = sorted(self._samples)
+            self._cached = ordered[min(len(ordered) - 1, math.ceil(self.quantile * len(ordered)) - 1)]
+        return self._cached
@@ -0,0 +1,69 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+# on_stage_complete(stage, duration_sec, status) with status "ok", "error" or "cancelled"
+StageCallback = Callable[[str, float, str], None]
+
+
+class StageGraph:
+    """
+    Runs a small dependency graph of async stages concurrently under one TaskGroup.
+
+    Each stage starts as soon as the stages it depends on have finished and is called
+    with their results as keyword arguments. The first failing stage cancels every
+    stage still running, and `run` re-raises that stage's exception as-is (not wrapped
+    in an ExceptionGroup) so callers can keep handling domain exceptions directly.
+    """
+
+    def __init__(self, on_stage_complete: Optional[StageCallback] = None) -> None:
+        self._stages: dict[str, tuple[Callable[..., Awaitable[Any]], tuple[str, ...]]] = {}
+        self._on_stage_complete = on_stage_complete
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[..., Awaitable[Any]],
+        depends_on: Sequence[str] = (),
+    ) -> "StageGraph":
+        if name in self._stages:
+            raise ValueError(f"Stage {name} already added")
+        missing = [dep for dep in depends_on if dep not in self._stages]
+        if missing:
+            # Dependencies must be added first, which also rules out cycles
+            raise ValueError(f"Stage {name} depends on unknown stages: {missing}")
+        self._stages[name] = (fn, tuple(depends_on))
+        return self
+
+    async def run(self) -> dict[str, Any]:
+        tasks: dict[str, asyncio.Task] = {}
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for name, (fn, depends_on) in self._stages.items():
+                    tasks[name] = tg.create_task(
+                        self._run_stage(name, fn, {dep: tasks[dep] for dep in depends_on}),
+                        name=f"stage:{name}",
+                    )
+        except BaseExceptionGroup as eg:
+            raise eg.exceptions[0] from None
+        return {name: task.result() for name, task in tasks.items()}
+
+    async def _run_stage(
+        self,
+        name: str,
+        fn: Callable[..., Awaitable[Any]],
+        dependencies: dict[str, asyncio.Task],
+    ) -> Any:
+        kwargs = {dep: await task for dep, task in dependencies.items()}
+        started = time.perf_counter()
+        status = "error"
+        try:
+            result = await fn(**kwargs)
+            status = "ok"
+            return result
+        except asyncio.CancelledError:
+            status = "cancelled"
+            raise
+        finally:
+            if self._on_stage_complete is not None:
+                self._on_stage_complete(name, time.perf_counter() - started, status)
@@ -0,0 +1,102 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Iterable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    In-process LRU cache with a per-entry TTL.
+
+    Bounded by `max_entries`: inserting past the limit evicts the least recently
+    used entry. Entries past their expiry are treated as absent and dropped on read.
+    Entries read through `get` since they were last set are tracked as accessed, so
+    refresh-ahead can skip the ones nobody is reading.
+    Not thread-safe; intended to be shared by coroutines on a single event loop.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_sec: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if ttl_sec <= 0:
+            raise ValueError("ttl_sec must be positive")
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self._clock = clock
+        self._entries: "OrderedDict[K, tuple[float, V]]" = OrderedDict()
+        self._accessed: set[K] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        if entry[0] <= self._clock():
+            self.delete(key)
+            return False
+        return True
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            self.delete(key)
+            return None
+        self._entries.move_to_end(key)
+        self._accessed.add(key)
+        return value
+
+    def set(self, key: K, value: V, ttl_sec: Optional[float] = None) -> None:
+        expires_at = self._clock() + (ttl_sec or self.ttl_sec)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        self._accessed.discard(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._accessed.discard(evicted)
+
+    def set_many(self, items: dict[K, V], ttl_sec: Optional[float] = None) -> None:
+        for key, value in items.items():
+            self.set(key, value, ttl_sec)
+
+    def delete(self, key: K) -> None:
+        self._entries.pop(key, None)
+        self._accessed.discard(key)
+
+    def delete_many(self, keys: Iterable[K]) -> None:
+        for key in keys:
+            self.delete(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._accessed.clear()
+
+    def expiring_keys(self, within_sec: float, accessed_only: bool = False) -> list[K]:
+        """
+        Keys that are still live but expire within `within_sec`, for refresh-ahead.
+        With `accessed_only`, only keys read since they were last set are returned.
+        Already expired entries are dropped rather than returned.
+        """
+        now = self._clock()
+        horizon = now + within_sec
+        expired: list[K] = []
+        expiring: list[K] = []
+        for key, (expires_at, _) in self._entries.items():
+            if expires_at <= now:
+                expired.append(key)
+            elif expires_at <= horizon and (not accessed_only or key in self._accessed):
+                expiring.append(key)
+        for key in expired:
+            self.delete(key)
+        return expiring
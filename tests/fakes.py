@@ -0,0 +1,412 @@
+"""
+In-memory stand-ins shared by the unit tests; fixtures wrapping them live in
+tests/conftest.py. Each fake covers only what the code under test calls.
+"""
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Sequence
+from unittest.mock import AsyncMock
+
+import grpc
+from sqlalchemy.orm import Session
+
+from src.application.interfaces.logging_interface import ILoggingService
+from src.application.interfaces.redis_interface import IRedisService
+from src.domain.entities.outbox_event import OutboxEvent
+from src.domain.repositories.outbox_repository import IOutboxRepository
+
+
+class FakeClock:
+    """Callable clock for TTLCache and friends; advance it by setting `now`."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeLoggingService(ILoggingService):
+    def get_logger(self, name: str):
+        return logging.getLogger(name)
+
+    def bind(self, **kwargs: Any) -> None:
+        pass
+
+    def unbind(self, *keys: str) -> None:
+        pass
+
+
+class FakeAsyncSession:
+    """
+    Stands in for AsyncSession: `execute` returns the scripted `results` in order,
+    while `sync_session` is a real Session, so after_commit/after_rollback hooks
+    registered on it fire from `commit()`/`rollback()`.
+    """
+
+    def __init__(self, *results) -> None:
+        self.execute = AsyncMock(side_effect=list(results))
+        self.sync_session = Session()
+        self.sync_session.begin()
+
+    async def commit(self) -> None:
+        self.sync_session.commit()
+
+    async def rollback(self) -> None:
+        self.sync_session.rollback()
+
+
+class FakeServicerContext:
+    """The parts of grpc.aio.ServicerContext the interceptors and servicers read."""
+
+    def __init__(self, code=None, time_remaining: Optional[float] = None) -> None:
+        self._code = code
+        self._time_remaining = time_remaining
+        self.trailing_metadata = None
+
+    def code(self):
+        return self._code
+
+    def set_code(self, code) -> None:
+        self._code = code
+
+    def time_remaining(self) -> Optional[float]:
+        return self._time_remaining
+
+    def set_trailing_metadata(self, metadata) -> None:
+        self.trailing_metadata = metadata
+
+    async def abort(self, code, details: str = "") -> None:
+        self._code = code
+        raise RuntimeError(f"aborted with {code}: {details}")
+
+
+class FakeStub:
+    """A generated-stub stand-in: remembers the channel it was built on."""
+
+    def __init__(self, channel) -> None:
+        self.channel = channel
+
+
+class FakeChannel:
+    """An aio.Channel stand-in whose connectivity state tests move with `set_state()`."""
+
+    def __init__(self, target: str = "", options=None, interceptors=None) -> None:
+        self.target = target
+        self.options = options
+        self.interceptors = interceptors
+        self.state = grpc.ChannelConnectivity.IDLE
+        self.closed = False
+        self._changed = asyncio.Event()
+
+    def get_state(self, try_to_connect: bool = False) -> grpc.ChannelConnectivity:
+        return self.state
+
+    async def wait_for_state_change(self, last_observed_state: grpc.ChannelConnectivity) -> None:
+        while self.state == last_observed_state:
+            self._changed.clear()
+            await self._changed.wait()
+
+    def set_state(self, state: grpc.ChannelConnectivity) -> None:
+        self.state = state
+        self._changed.set()
+
+    async def close(self) -> None:
+        self.closed = True
+        self.set_state(grpc.ChannelConnectivity.SHUTDOWN)
+
+
+class FakeChannelManager:
+    """Replaces a client's ChannelManager: every call goes straight to `stub`."""
+
+    def __init__(self, stub) -> None:
+        self._stub = stub
+        self.methods: list[str] = []
+
+    @asynccontextmanager
+    async def stub(self, stub_cls, method: str):
+        self.methods.append(method)
+        yield self._stub
+
+    async def call(self, stub_cls, method: str, invoke, hedge: bool = False):
+        self.methods.append(method)
+        return await invoke(self._stub)
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeRawRedis:
+    """
+    The redis.asyncio.Redis calls made on `IRedisService.client`, over the store of
+    the FakeRedis it belongs to. Pipelines run their commands on execute().
+    """
+
+    def __init__(self, redis: "FakeRedis") -> None:
+        self._redis = redis
+
+    async def get(self, key: str):
+        return self._redis.store.get(key)
+
+    async def set(self, key: str, value: Any, ex: int | None = None, nx: bool = False):
+        if nx and key in self._redis.store:
+            return None
+        self._redis._set(key, value, ex)
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        present = [key for key in keys if key in self._redis.store]
+        for key in keys:
+            self._redis._delete(key)
+        return len(present)
+
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = True):
+        yield _FakePipeline(self)
+
+    def lock(self, name: str, timeout: float | None = None, blocking: bool = True) -> "_FakeLock":
+        return _FakeLock(self._redis, name)
+
+    async def publish(self, channel: str, message: Any) -> int:
+        subscribers = [pubsub for pubsub in self._redis.subscribers if channel in pubsub.channels]
+        for pubsub in subscribers:
+            pubsub.messages.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(subscribers)
+
+    def pubsub(self, ignore_subscribe_messages: bool = False) -> "_FakePubSub":
+        return _FakePubSub(self._redis)
+
+
+class _FakeLock:
+    """Non-blocking lease over `FakeRedis.locks`; it never expires on its own."""
+
+    def __init__(self, redis: "FakeRedis", name: str) -> None:
+        self._redis = redis
+        self.name = name
+
+    async def acquire(self) -> bool:
+        if self.name in self._redis.locks:
+            return False
+        self._redis.locks.add(self.name)
+        return True
+
+    async def release(self) -> None:
+        if self.name not in self._redis.locks:
+            raise RuntimeError(f"lock {self.name} is not held")
+        self._redis.locks.discard(self.name)
+
+
+class _FakePubSub:
+    """
+    Subscription over `FakeRedis.subscribers`. An exception put on `messages` is
+    raised from listen(), as a dropped connection would be.
+    """
+
+    def __init__(self, redis: "FakeRedis") -> None:
+        self._redis = redis
+        self.channels: set[str] = set()
+        self.messages: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, *channels: str) -> None:
+        self.channels.update(channels)
+        self._redis.subscribers.append(self)
+
+    async def get_message(self, ignore_subscribe_messages: bool = False, timeout: float = 0.0):
+        try:
+            return await asyncio.wait_for(self.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def listen(self):
+        while True:
+            message = await self.messages.get()
+            if isinstance(message, Exception):
+                raise message
+            yield message
+
+    async def aclose(self) -> None:
+        self.channels.clear()
+        if self in self._redis.subscribers:
+            self._redis.subscribers.remove(self)
+
+
+class _FakePipeline:
+    def __init__(self, client: FakeRawRedis) -> None:
+        self._client = client
+        self._commands: list = []
+
+    def __getattr__(self, name: str):
+        command = getattr(self._client, name)
+        return lambda *args, **kwargs: self._commands.append((command, args, kwargs))
+
+    async def execute(self) -> list:
+        commands, self._commands = self._commands, []
+        return [await command(*args, **kwargs) for command, args, kwargs in commands]
+
+
+class FakeRedis(IRedisService):
+    """
+    Dict-backed IRedisService. Expiry is recorded but not enforced; `expiries`
+    lets tests assert on it. `calls` records the name of every method called.
+    """
+
+    def __init__(self) -> None:
+        self.store: dict[str, Any] = {}
+        self.expiries: dict[str, Optional[int]] = {}
+        self.indexes: dict[str, set[str]] = {}
+        self.calls: list[str] = []
+        self.locks: set[str] = set()
+        self.subscribers: list[_FakePubSub] = []
+        self._client = FakeRawRedis(self)
+
+    @property
+    def client(self) -> FakeRawRedis:
+        return self._client
+
+    async def get(self, key: str) -> Optional[str]:
+        self.calls.append("get")
+        value = self.store.get(key)
+        return value.decode() if isinstance(value, bytes) else value
+
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        self.calls.append("get_bytes")
+        value = self.store.get(key)
+        return value.encode() if isinstance(value, str) else value
+
+    async def get_many(self, keys: list[str]) -> list[Optional[str]]:
+        self.calls.append("get_many")
+        return [self.store.get(key) for key in keys]
+
+    async def set(self, key: str, value: Any, expire: int | None = None) -> None:
+        self.calls.append("set")
+        self._set(key, value, expire)
+
+    async def set_many(
+        self,
+        values: dict[str, Any],
+        expire: int | None = None,
+        clear_indexes: Sequence[str] = (),
+        delete: Sequence[str] = (),
+    ) -> None:
+        self.calls.append("set_many")
+        for key, value in values.items():
+            self._set(key, value, expire)
+        for index in clear_indexes:
+            self._clear_index(index)
+        for key in delete:
+            self._delete(key)
+
+    async def set_indexed(self, key: str, value: Any, index: str, expire: int | None = None) -> None:
+        self.calls.append("set_indexed")
+        self._set(key, value, expire)
+        self.indexes.setdefault(index, set()).add(key)
+
+    async def delete_indexed(self, index: str) -> None:
+        self.calls.append("delete_indexed")
+        self._clear_index(index)
+
+    async def delete(self, key: str) -> None:
+        self.calls.append("delete")
+        self._delete(key)
+
+    async def delete_pattern(self, key: str) -> None:
+        raise NotImplementedError("use set_indexed/delete_indexed")
+
+    @asynccontextmanager
+    async def lock(self, key: str, timeout: int = 10):
+        yield
+
+    async def close(self) -> None:
+        pass
+
+    def _set(self, key: str, value: Any, expire: int | None) -> None:
+        if not isinstance(value, (str, bytes)):
+            value = json.dumps(value)
+        self.store[key] = value
+        self.expiries[key] = expire
+
+    def _delete(self, key: str) -> None:
+        self.store.pop(key, None)
+        self.expiries.pop(key, None)
+
+    def _clear_index(self, index: str) -> None:
+        for key in self.indexes.pop(index, set()):
+            self._delete(key)
+
+
+class FakeOutboxRepository(IOutboxRepository):
+    """List-backed outbox; `sent` holds the ids marked as published, in order."""
+
+    def __init__(self) -> None:
+        self.events: list[OutboxEvent] = []
+        self.sent: list[int] = []
+
+    async def add(self, topic: str, event: dict[str, Any], session=None) -> None:
+        self.events.append(OutboxEvent(
+            id=len(self.events) + 1, topic=topic, payload=event,
+            created_at=datetime.now(timezone.utc)))
+
+    async def claim_pending(self, limit: int, session=None) -> list[OutboxEvent]:
+        return [event for event in self.events if event.id not in self.sent][:limit]
+
+    async def mark_sent(self, event_ids: list[int], session=None) -> None:
+        self.sent.extend(event_ids)
+
+    async def purge_sent(self, older_than: timedelta, limit: int, session=None) -> int:
+        purged = [event for event in self.events if event.id in self.sent][:limit]
+        self.events = [event for event in self.events if event not in purged]
+        return len(purged)
+
+
+class FakeProcess:
+    """A multiprocessing.Process stand-in; tests end it with `exit()`."""
+
+    def __init__(self, pid: int, stops_on_terminate: bool = True) -> None:
+        self.pid = pid
+        self.sentinel = pid
+        self.exitcode: Optional[int] = None
+        self.stops_on_terminate = stops_on_terminate
+        self.terminated = self.killed = False
+        self._alive = False
+
+    def start(self) -> None:
+        self._alive = True
+
+    def is_alive(self) -> bool:
+        return self._alive
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        pass
+
+    def exit(self, code: int) -> None:
+        self._alive, self.exitcode = False, code
+
+    def terminate(self) -> None:
+        self.terminated = True
+        if self.stops_on_terminate:
+            self.exit(-15)
+
+    def kill(self) -> None:
+        self.killed = True
+        self.exit(-9)
+
+
+class FakeProcessContext:
+    """multiprocessing context whose Process() hands out FakeProcesses, in `processes`."""
+
+    def __init__(self) -> None:
+        self.processes: list[FakeProcess] = []
+
+    def Process(self, target=None, args=(), name=None, daemon=None) -> FakeProcess:
+        process = FakeProcess(pid=1000 + len(self.processes))
+        self.processes.append(process)
+        return process
+
+
+async def settle() -> None:
+    """Lets tasks scheduled by after-commit hooks (and what they await) run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
@@ -0,0 +1,90 @@
+import json
+import pytest
+from unittest.mock import AsyncMock
+
+from src.application.use_cases.course.sync_course_price_use_case import SyncCoursePriceUseCase
+from src.application.use_cases.order.place_order_use_case import PlaceOrderUseCase
+from src.domain.events.course_changed_event import CourseChangedEventDto
+from src.shared.events.topics import EVENT_TOPICS
+
+UPDATED = EVENT_TOPICS.COURSE_UPDATED.value
+UNPUBLISHED = EVENT_TOPICS.COURSE_UNPUBLISHED.value
+
+
+@pytest.fixture
+def sync_course_price(fake_redis, price_snapshot, logging_service, metrics_service):
+    return SyncCoursePriceUseCase(fake_redis, price_snapshot, logging_service, metrics_service)
+
+
+def course_event(**payload):
+    payload = {"courseId": "course1", "status": "published", "price": 20.0,
+               "discountPrice": 15.0, "instructorId": "instructor1", **payload}
+    return CourseChangedEventDto.from_payload(
+        {"timestamp": 0, "eventId": "event1", "eventType": UPDATED, "payload": payload})
+
+
+def upstream_course(price):
+    return {"course_id": "course1", "status": "published", "price": price,
+            "discount_price": price, "instructor_id": "instructor1"}
+
+
+@pytest.mark.asyncio
+async def test_sync_writes_price_to_redis_and_snapshot(sync_course_price, fake_redis, price_snapshot):
+    await sync_course_price.execute(UPDATED, course_event())
+
+    expected = {"discounted_price": 15.0, "price": 20.0, "instructor_id": "instructor1"}
+    assert json.loads(fake_redis.store["course_price:course1"]) == expected
+    assert fake_redis.expiries["course_price:course1"] == PlaceOrderUseCase.CACHE_EXPIRATION_SEC
+    assert price_snapshot.get("course1") == expected
+
+
+@pytest.mark.asyncio
+async def test_sync_leaves_short_lived_tombstone_on_unpublish(sync_course_price, fake_redis, price_snapshot):
+    await sync_course_price.execute(UPDATED, course_event())
+    await sync_course_price.execute(UNPUBLISHED, course_event(status="draft"))
+
+    assert json.loads(fake_redis.store["course_price:course1"]) == {"status": "draft"}
+    assert fake_redis.expiries["course_price:course1"] == SyncCoursePriceUseCase.EVICTION_TOMBSTONE_SEC
+    assert "course1" not in price_snapshot
+
+
+@pytest.mark.asyncio
+async def test_in_flight_fetch_does_not_overwrite_price_from_event(
+        sync_course_price, place_order_use_case, course_service_client, fake_redis, price_snapshot):
+    async def fetch_racing_with_event(course_ids):
+        await sync_course_price.execute(UPDATED, course_event(price=30.0, discountPrice=None))
+        return [upstream_course(20.0)]
+
+    course_service_client.get_courses_by_ids = AsyncMock(side_effect=fetch_racing_with_event)
+    await place_order_use_case.validate_and_fetch_course_prices(["course1"])
+
+    assert json.loads(fake_redis.store["course_price:course1"])["price"] == 30.0
+    # The next process to miss its snapshot reads the event's price
+    price_snapshot.clear()
+    prices = await place_order_use_case.validate_and_fetch_course_prices(["course1"])
+    assert prices["course1"]["price"] == 30.0
+    course_service_client.get_courses_by_ids.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_in_flight_fetch_does_not_undo_eviction(
+        sync_course_price, place_order_use_case, course_service_client, fake_redis):
+    async def fetch_racing_with_unpublish(course_ids):
+        await sync_course_price.execute(UNPUBLISHED, course_event(status="draft"))
+        return [upstream_course(20.0)]
+
+    course_service_client.get_courses_by_ids = AsyncMock(side_effect=fetch_racing_with_unpublish)
+    await place_order_use_case.validate_and_fetch_course_prices(["course1"])
+
+    assert json.loads(fake_redis.store["course_price:course1"]) == {"status": "draft"}
+
+
+@pytest.mark.asyncio
+async def test_tombstone_reads_as_miss(place_order_use_case, course_service_client, fake_redis):
+    await fake_redis.client.set("course_price:course1", json.dumps({"status": "draft"}))
+    course_service_client.get_courses_by_ids = AsyncMock(return_value=[upstream_course(20.0)])
+
+    prices = await place_order_use_case.validate_and_fetch_course_prices(["course1"])
+
+    assert prices["course1"]["price"] == 20.0
+    course_service_client.get_courses_by_ids.assert_awaited_once_with(["course1"])
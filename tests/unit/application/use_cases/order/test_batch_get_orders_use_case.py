@@ -0,0 +1,57 @@
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+from pydantic import ValidationError
+
+from src.application.dtos.batch_get_orders_dto import BatchGetOrdersDto
+from src.application.use_cases.order.batch_get_orders_use_case import BatchGetOrdersUseCase
+from src.domain.entities.order import Order
+from src.domain.entities.order_items import OrderItem
+from src.domain.value_objects.money import Money
+from src.infrastructure.config.settings import settings
+
+
+@pytest.fixture
+def order_repository():
+    return AsyncMock()
+
+
+@pytest.fixture
+def batch_get_orders(order_repository, logging_service, metrics_service, monkeypatch):
+    @asynccontextmanager
+    async def get_db():
+        yield MagicMock()
+
+    monkeypatch.setattr("src.application.use_cases.order.batch_get_orders_use_case.get_db", get_db)
+    return BatchGetOrdersUseCase(order_repository, logging_service, metrics_service)
+
+
+def make_order(order_id):
+    order = Order.create(
+        user_id="user1", idempotency_key=None,
+        items=[OrderItem(id=f"item-{order_id}", course_id="course1", price=10.0)],
+        amount=Money(amount=10.0, currency="USD"), discount=None, sub_total=10.0,
+        sales_tax=0.0, payment_details=None)
+    order.id = order_id
+    return order
+
+
+@pytest.mark.asyncio
+async def test_batch_get_returns_orders_in_request_order_and_reports_missing(batch_get_orders, order_repository):
+    order_repository.find_by_ids.return_value = {"b": make_order("b"), "a": make_order("a")}
+
+    response = await batch_get_orders.execute(BatchGetOrdersDto(order_ids=["a", "x", "b", "a"]))
+
+    order_repository.find_by_ids.assert_awaited_once()
+    assert order_repository.find_by_ids.await_args.args[0] == ["a", "x", "b"]
+    assert [order.id for order in response["orders"]] == ["a", "b"]
+    assert response["missing_ids"] == ["x"]
+
+
+def test_batch_get_dto_caps_ids_per_request():
+    BatchGetOrdersDto(order_ids=[f"o{i}" for i in range(settings.BATCH_GET_ORDERS_MAX_IDS)])
+    with pytest.raises(ValidationError):
+        BatchGetOrdersDto(order_ids=[f"o{i}" for i in range(settings.BATCH_GET_ORDERS_MAX_IDS + 1)])
+    with pytest.raises(ValidationError):
+        BatchGetOrdersDto(order_ids=["a", " "])
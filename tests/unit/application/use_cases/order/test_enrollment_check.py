@@ -0,0 +1,79 @@
+import json
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from src.application.use_cases.order.order_success_use_case import OrderSuccessUseCase
+from src.domain.entities.order import OrderStatus
+from src.domain.entities.order_items import OrderItem
+from src.domain.exceptions.exceptions import CourseAlreadyEnrolledException
+from tests.fakes import FakeAsyncSession
+
+
+@pytest.fixture
+def order_success_use_case(kafka_producer, fake_redis, logging_service, metrics_service, monkeypatch):
+    @asynccontextmanager
+    async def get_db():
+        yield FakeAsyncSession()
+
+    monkeypatch.setattr("src.application.use_cases.order.order_success_use_case.get_db", get_db)
+    order = SimpleNamespace(
+        id="order1", user_id="user1", status=OrderStatus.SUCCEEDED,
+        items=[OrderItem(id="item1", course_id="course1", price=10.0)],
+        amount=SimpleNamespace(amount=10.0, currency="USD"))
+    repository = AsyncMock()
+    repository.transition_status.return_value = order
+    return OrderSuccessUseCase(
+        repository, kafka_producer, AsyncMock(), fake_redis, logging_service, metrics_service)
+
+
+def payment_success_event():
+    return SimpleNamespace(
+        timestamp=str(int(datetime.now(timezone.utc).timestamp() * 1000)),
+        payload=SimpleNamespace(
+            order_id="order1", payment_id="pay1", provider="razorpay", provider_order_id="po1"))
+
+
+@pytest.mark.asyncio
+async def test_enrollment_check_uses_cached_enrollment_set(place_order_use_case, fake_redis, course_service_client):
+    await fake_redis.set("user_enrollments:user1", json.dumps(["course1"]))
+
+    with pytest.raises(CourseAlreadyEnrolledException):
+        await place_order_use_case.ensure_user_not_already_enrolled("user1", ["course1", "course2"])
+    course_service_client.get_user_enrolled_course_ids.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_enrollment_check_caches_fetched_enrollment_set(place_order_use_case, fake_redis, course_service_client):
+    course_service_client.get_user_enrolled_course_ids.return_value = {"course3"}
+
+    await place_order_use_case.ensure_user_not_already_enrolled("user1", ["course1"])
+    assert json.loads(fake_redis.store["user_enrollments:user1"]) == ["course3"]
+
+
+@pytest.mark.asyncio
+async def test_order_success_marks_purchase_and_evicts_enrollment_cache(order_success_use_case, fake_redis):
+    await fake_redis.set("user_enrollments:user1", json.dumps([]))
+
+    await order_success_use_case.execute(payment_success_event())
+
+    assert "user_enrollments:user1" not in fake_redis.store
+    assert fake_redis.expiries["user_purchased_course:user1:course1"] == (
+        OrderSuccessUseCase.PURCHASE_MARKER_EXPIRATION_SEC)
+
+
+@pytest.mark.asyncio
+async def test_enrollment_check_blocks_purchase_not_yet_enrolled_upstream(
+        order_success_use_case, place_order_use_case, fake_redis, course_service_client):
+    await order_success_use_case.execute(payment_success_event())
+    # The course service has not consumed the succeeded event yet, and the stale
+    # set it returns is cached again
+    course_service_client.get_user_enrolled_course_ids.return_value = set()
+
+    with pytest.raises(CourseAlreadyEnrolledException):
+        await place_order_use_case.ensure_user_not_already_enrolled("user1", ["course1"])
+    assert json.loads(fake_redis.store["user_enrollments:user1"]) == []
+    with pytest.raises(CourseAlreadyEnrolledException):
+        await place_order_use_case.ensure_user_not_already_enrolled("user1", ["course1"])
@@ -0,0 +1,93 @@
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+from src.application.dtos.order_create_dto import OrderCreateDto
+from src.domain.exceptions.exceptions import IdempotencyKeyInProgressException
+
+LEASE = "order_idempotency_lease:idem1"
+CHANNEL = "order_idempotency_released:idem1"
+
+
+@pytest.fixture
+def use_case(place_order_use_case, monkeypatch):
+    @asynccontextmanager
+    async def get_db():
+        yield MagicMock()
+
+    monkeypatch.setattr("src.application.use_cases.order.place_order_use_case.get_db", get_db)
+    place_order_use_case._order_repository.find_by_idempotency_key = AsyncMock(return_value=None)
+    place_order_use_case._place_order = AsyncMock(return_value="placed")
+    return place_order_use_case
+
+
+def order_dto():
+    return OrderCreateDto(user_id="user1", course_ids=["course1"])
+
+
+async def release_by_owner(fake_redis):
+    """What the owning process does once its order is committed (or abandoned)."""
+    fake_redis.locks.discard(LEASE)
+    await fake_redis.client.publish(CHANNEL, "released")
+
+
+@pytest.mark.asyncio
+async def test_owner_reserves_places_and_releases(use_case, fake_redis):
+    assert await use_case.execute(order_dto(), "idem1") == "placed"
+
+    use_case._place_order.assert_awaited_once()
+    assert LEASE not in fake_redis.locks
+
+
+@pytest.mark.asyncio
+async def test_waiter_blocks_until_owner_releases_then_returns_its_order(use_case, fake_redis, monkeypatch):
+    fake_redis.locks.add(LEASE)
+    from_domain = MagicMock(return_value="owner's order")
+    monkeypatch.setattr("src.application.use_cases.order.place_order_use_case.OrderDto.from_domain", from_domain)
+    waiter = asyncio.create_task(use_case.execute(order_dto(), "idem1"))
+
+    await asyncio.sleep(0.3)
+    # Blocked on the release channel, not polling the database
+    use_case._order_repository.find_by_idempotency_key.assert_not_awaited()
+    assert not waiter.done()
+
+    use_case._order_repository.find_by_idempotency_key.return_value = object()
+    await release_by_owner(fake_redis)
+    assert await asyncio.wait_for(waiter, 1) == "owner's order"
+    use_case._order_repository.find_by_idempotency_key.assert_awaited_once()
+    use_case._place_order.assert_not_awaited()
+    assert fake_redis.subscribers == []
+
+
+@pytest.mark.asyncio
+async def test_waiter_takes_over_when_owner_releases_without_an_order(use_case, fake_redis):
+    fake_redis.locks.add(LEASE)
+    waiter = asyncio.create_task(use_case.execute(order_dto(), "idem1"))
+    await asyncio.sleep(0.05)
+
+    await release_by_owner(fake_redis)
+    assert await asyncio.wait_for(waiter, 1) == "placed"
+    use_case._place_order.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_waiter_retries_on_backoff_when_release_is_not_announced(use_case, fake_redis):
+    fake_redis.locks.add(LEASE)
+    waiter = asyncio.create_task(use_case.execute(order_dto(), "idem1"))
+    await asyncio.sleep(0.05)
+
+    # The owner's lease expired without a release message
+    fake_redis.locks.discard(LEASE)
+    assert await asyncio.wait_for(waiter, 1) == "placed"
+
+
+@pytest.mark.asyncio
+async def test_waiter_gives_up_after_one_lease_period(use_case, fake_redis):
+    fake_redis.locks.add(LEASE)
+    use_case.IDEMPOTENCY_LEASE_SEC = 0.3
+
+    with pytest.raises(IdempotencyKeyInProgressException):
+        await use_case.execute(order_dto(), "idem1")
+    use_case._order_repository.find_by_idempotency_key.assert_not_awaited()
+    use_case._place_order.assert_not_awaited()
@@ -0,0 +1,20 @@
+import pytest
+from unittest.mock import AsyncMock
+
+PRICE = {"price": 10.0, "discounted_price": 10.0, "instructor_id": "instructor1"}
+
+
+@pytest.mark.asyncio
+async def test_refresh_reloads_only_entries_read_since_last_load(place_order_use_case, price_snapshot, clock):
+    price_snapshot.set_many({"hot": PRICE, "cold": PRICE})
+    assert await place_order_use_case.validate_and_fetch_course_prices(["hot"]) == {"hot": PRICE}
+    place_order_use_case._load_course_prices = AsyncMock(
+        side_effect=lambda course_ids, **_: price_snapshot.set_many({cid: PRICE for cid in course_ids}))
+
+    clock.now = price_snapshot.ttl_sec - 1
+    assert await place_order_use_case.refresh_price_snapshot() == 1
+    place_order_use_case._load_course_prices.assert_awaited_once_with(["hot"], raise_on_unpublished=False)
+
+    # Not read again since the reload: left to expire like "cold"
+    clock.now += price_snapshot.ttl_sec - 1
+    assert await place_order_use_case.refresh_price_snapshot() == 0
@@ -0,0 +1,320 @@
+import json
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from sqlalchemy import select
+
+from src.domain.entities.order import Order, OrderLifecycleException, OrderStatus
+from src.domain.entities.order_items import OrderItem
+from src.domain.entities.payment_details import PaymentDetails, PaymentLifecycleException
+from src.domain.exceptions.exceptions import OrderNotFoundException
+from src.domain.value_objects.money import Money
+from src.infrastructure.database.mappers.entity_mapper import EntityMapper
+from src.infrastructure.database.models.order_model import OrderItemModel, OrderModel, PaymentDetailsModel
+from src.infrastructure.database.repositories.sql_order_repository import SqlOrderRepository
+from tests.fakes import FakeAsyncSession, settle
+
+
+@pytest.fixture
+def repository(fake_redis, logging_service):
+    return SqlOrderRepository(fake_redis, logging_service)
+
+
+def rows_result(rows):
+    result = MagicMock()
+    result.mappings.return_value.all.return_value = rows
+    return result
+
+
+def status_result(status):
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = status
+    return result
+
+
+def insert_result():
+    now = datetime.now(timezone.utc)
+    result = MagicMock()
+    result.one.return_value = MagicMock(created_at=now, updated_at=now)
+    return result
+
+
+def transition_rows(status="succeeded"):
+    now = datetime.now(timezone.utc)
+    return [
+        dict(id="order1", user_id="user1", idempotency_key="idem1", amount=10.0, currency="USD",
+             sub_total=10.0, sales_tax=0.0, discount=None, status=status,
+             created_at=now, updated_at=now,
+             item_id="item1", item_course_id="course1", item_price=10.0,
+             payment_id="pd1", payment_order_id="order1", payment_payment_id="pay1",
+             payment_provider="razorpay", payment_provider_order_id="po1",
+             payment_payment_status="pending", payment_updated_at=now,
+             upserted_id="pd1", upserted_order_id="order1", upserted_payment_id="pay1",
+             upserted_provider="razorpay", upserted_provider_order_id="po1",
+             upserted_payment_status="success", upserted_updated_at=now),
+    ]
+
+
+def make_order():
+    return Order.create(
+        user_id="user1",
+        idempotency_key="idem1",
+        items=[OrderItem(id="item1", course_id="course1", price=10.0)],
+        amount=Money(amount=10.0, currency="USD"),
+        discount=None,
+        sub_total=10.0,
+        sales_tax=0.0,
+        payment_details=None,
+    )
+
+
+def make_payment(status):
+    return PaymentDetails(
+        id="pd1", payment_id="pay1", provider="razorpay", provider_order_id="po1",
+        payment_status=status, updated_at=datetime.now(timezone.utc))
+
+
+@pytest.mark.asyncio
+async def test_insert_writes_cache_only_after_commit(repository, fake_redis):
+    await fake_redis.set_indexed("user_orders:user1:page1", "[]", "user_orders_index:user1")
+    session = FakeAsyncSession(insert_result())
+    order = make_order()
+
+    await repository.insert(order, session)
+    assert f"orders:{order.id}" not in fake_redis.store
+
+    await session.commit()
+    await settle()
+    assert set(fake_redis.store) == {
+        f"orders:{order.id}", f"order_status:{order.id}", "orders:idempotency_key:idem1"}
+    assert fake_redis.store[f"order_status:{order.id}"] == "created"
+
+
+@pytest.mark.asyncio
+async def test_insert_drops_cache_writes_on_rollback(repository, fake_redis):
+    session = FakeAsyncSession(insert_result())
+
+    await repository.insert(make_order(), session)
+    await session.rollback()
+    await settle()
+
+    assert fake_redis.store == {}
+
+
+async def seed_order(session, status, payment_status=None, order_id="order1"):
+    """Adds an order (one item, optionally a payment row) to the test database."""
+    now = datetime.now(timezone.utc)
+    session.add(OrderModel(
+        id=order_id, user_id="user1", idempotency_key=f"idem-{order_id}", amount=10.0,
+        currency="USD", sub_total=10, sales_tax=0, status=status, created_at=now, updated_at=now))
+    await session.flush()
+    session.add(OrderItemModel(id=f"item-{order_id}", order_id=order_id, course_id="course1", price=10.0))
+    if payment_status is not None:
+        session.add(PaymentDetailsModel(
+            id=f"pd-{order_id}", order_id=order_id, payment_id="pay1", provider="razorpay",
+            provider_order_id="po1", payment_status=payment_status, updated_at=now))
+    await session.flush()
+
+
+async def stored_statuses(session):
+    order_status = (await session.execute(
+        select(OrderModel.status).where(OrderModel.id == "order1"))).scalar_one()
+    payment_status = (await session.execute(
+        select(PaymentDetailsModel.payment_status)
+        .where(PaymentDetailsModel.order_id == "order1"))).scalar_one_or_none()
+    return order_status, payment_status
+
+
+@pytest.mark.asyncio
+async def test_transition_applies_allowed_move_and_inserts_payment(repository, db_session):
+    await seed_order(db_session, "pending_payment")
+
+    order = await repository.transition_status(
+        "order1", OrderStatus.PROCESSING, db_session, payment_details=make_payment("pending"))
+
+    assert order.status == OrderStatus.PROCESSING
+    assert [item.id for item in order.items] == ["item-order1"]
+    assert await stored_statuses(db_session) == ("processing", "pending")
+
+
+@pytest.mark.asyncio
+async def test_transition_leaves_row_unchanged_when_status_does_not_allow_it(repository, db_session):
+    await seed_order(db_session, "failed", payment_status="failed")
+
+    with pytest.raises(OrderLifecycleException, match="from failed to succeeded"):
+        await repository.transition_status(
+            "order1", OrderStatus.SUCCEEDED, db_session,
+            payment_details=make_payment("success"), overwrite_payment_status=True)
+    assert await stored_statuses(db_session) == ("failed", "failed")
+
+
+@pytest.mark.asyncio
+async def test_transition_keeps_existing_payment_without_overwrite(repository, db_session):
+    await seed_order(db_session, "processing", payment_status="pending")
+
+    order = await repository.transition_status(
+        "order1", OrderStatus.SUCCEEDED, db_session, payment_details=make_payment("success"))
+
+    assert order.payment_details.payment_status == "pending"
+    assert await stored_statuses(db_session) == ("succeeded", "pending")
+
+
+@pytest.mark.asyncio
+async def test_transition_overwrites_payment_status_where_payment_lifecycle_allows(repository, db_session):
+    await seed_order(db_session, "processing", payment_status="pending")
+
+    order = await repository.transition_status(
+        "order1", OrderStatus.SUCCEEDED, db_session,
+        payment_details=make_payment("success"), overwrite_payment_status=True)
+
+    assert order.status == OrderStatus.SUCCEEDED
+    assert order.payment_details.payment_status == "success"
+    assert await stored_statuses(db_session) == ("succeeded", "success")
+
+
+@pytest.mark.asyncio
+async def test_transition_raises_when_payment_lifecycle_rejects_overwrite(repository, db_session):
+    await seed_order(db_session, "processing", payment_status="failed")
+
+    with pytest.raises(PaymentLifecycleException, match="from failed to success"):
+        await repository.transition_status(
+            "order1", OrderStatus.SUCCEEDED, db_session,
+            payment_details=make_payment("success"), overwrite_payment_status=True)
+
+
+@pytest.mark.asyncio
+async def test_transition_raises_not_found_for_unknown_order(repository, fake_redis):
+    session = FakeAsyncSession(rows_result([]), status_result(None))
+
+    with pytest.raises(OrderNotFoundException):
+        await repository.transition_status("order1", OrderStatus.SUCCEEDED, session)
+    assert fake_redis.calls == []
+
+
+@pytest.mark.asyncio
+async def test_transition_raises_lifecycle_error_when_status_does_not_allow_it(repository, fake_redis):
+    session = FakeAsyncSession(rows_result([]), status_result("failed"))
+
+    with pytest.raises(OrderLifecycleException, match="from failed to succeeded"):
+        await repository.transition_status("order1", OrderStatus.SUCCEEDED, session)
+    assert fake_redis.calls == []
+
+
+@pytest.mark.asyncio
+async def test_transition_drops_cache_now_and_rewrites_it_after_commit(repository, fake_redis):
+    for key in ("orders:order1", "order_status:order1", "orders:idempotency_key:idem1", "order_pb:order1"):
+        await fake_redis.set(key, "stale")
+    session = FakeAsyncSession(rows_result(transition_rows()))
+
+    await repository.transition_status("order1", OrderStatus.SUCCEEDED, session)
+    assert fake_redis.store == {}
+
+    await session.commit()
+    await settle()
+    assert fake_redis.store["order_status:order1"] == "succeeded"
+    assert "order_pb:order1" not in fake_redis.store
+
+
+@pytest.mark.asyncio
+async def test_transition_deletes_order_pb_cached_before_commit(repository, fake_redis):
+    session = FakeAsyncSession(rows_result(transition_rows()))
+
+    await repository.transition_status("order1", OrderStatus.SUCCEEDED, session)
+    # A GetOrderById between the transition and the commit still reads the old row
+    await fake_redis.set("order_pb:order1", b"old")
+
+    await session.commit()
+    await settle()
+    assert "order_pb:order1" not in fake_redis.store
+
+
+@pytest.mark.asyncio
+async def test_find_by_ids_reads_cache_then_database_and_back_fills(repository, fake_redis, db_session):
+    for order_id in ("cached", "stored", "corrupt"):
+        await seed_order(db_session, "created", order_id=order_id)
+    cached = await repository.find_by_id("cached", db_session)
+    await fake_redis.set("orders:corrupt", "{not json")
+    fake_redis.calls.clear()
+
+    orders = await repository.find_by_ids(["stored", "missing", "cached", "corrupt", "stored"], db_session)
+
+    assert set(orders) == {"stored", "cached", "corrupt"}
+    assert orders["cached"].id == cached.id
+    assert [item.id for item in orders["stored"].items] == ["item-stored"]
+    # One MGET, one query, one pipelined back-fill of what the database returned
+    assert fake_redis.calls == ["get_many", "set_many"]
+    assert json.loads(fake_redis.store["orders:corrupt"])["id"] == "corrupt"
+    assert "orders:missing" not in fake_redis.store
+
+
+@pytest.mark.asyncio
+async def test_find_by_ids_served_from_cache_skips_database(repository, fake_redis):
+    session = FakeAsyncSession()
+    order = make_order()
+    await fake_redis.set(f"orders:{order.id}", EntityMapper.serialize_order_to_json(order))
+
+    orders = await repository.find_by_ids([order.id], session)
+
+    assert orders[order.id].user_id == "user1"
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_find_status_served_from_status_cache(repository, fake_redis):
+    session = FakeAsyncSession()
+    await fake_redis.set("order_status:order1", "processing")
+
+    assert await repository.find_status("order1", session) == OrderStatus.PROCESSING
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_find_status_falls_back_to_status_column_and_caches_it(repository, fake_redis):
+    session = FakeAsyncSession(status_result("succeeded"))
+
+    assert await repository.find_status("order1", session) == OrderStatus.SUCCEEDED
+    statement = str(session.execute.await_args.args[0])
+    assert statement.startswith("SELECT orders.status \nFROM orders")
+    assert fake_redis.store["order_status:order1"] == "succeeded"
+
+
+@pytest.mark.asyncio
+async def test_find_status_replaces_invalid_cached_status(repository, fake_redis, db_session):
+    await seed_order(db_session, "failed")
+    await fake_redis.set("order_status:order1", "bogus")
+
+    assert await repository.find_status("order1", db_session) == OrderStatus.FAILED
+    assert fake_redis.store["order_status:order1"] == "failed"
+
+
+@pytest.mark.asyncio
+async def test_find_status_of_unknown_order_is_none_and_not_cached(repository, fake_redis, db_session):
+    assert await repository.find_status("missing", db_session) is None
+    assert fake_redis.store == {}
+
+
+@pytest.mark.asyncio
+async def test_save_deletes_order_pb_cached_before_commit(repository, fake_redis, db_session):
+    await seed_order(db_session, "pending_payment")
+    order = await repository.find_by_id("order1", db_session)
+    order.status = OrderStatus.PROCESSING
+
+    await repository.save(order, db_session)
+    await fake_redis.set("order_pb:order1", b"old")
+
+    await db_session.commit()
+    await settle()
+    assert "order_pb:order1" not in fake_redis.store
+
+
+@pytest.mark.asyncio
+async def test_attach_payment_details_deletes_order_pb_cached_before_commit(repository, fake_redis, db_session):
+    await seed_order(db_session, "pending_payment")
+
+    await repository.attach_payment_details("order1", make_payment("pending"), db_session)
+    await fake_redis.set("order_pb:order1", b"old")
+
+    await db_session.commit()
+    await settle()
+    assert "order_pb:order1" not in fake_redis.store
@@ -0,0 +1,48 @@
+import pytest
+from datetime import timedelta
+
+from sqlalchemy import func, select, update
+
+from src.infrastructure.database.models.outbox_model import OutboxEventModel
+from src.infrastructure.database.repositories.sql_outbox_repository import SqlOutboxRepository
+
+
+@pytest.fixture
+def outbox(logging_service):
+    return SqlOutboxRepository(logging_service)
+
+
+async def add_events(outbox, session, *order_ids):
+    for order_id in order_ids:
+        await outbox.add("order.course.created.v1", {"orderId": order_id}, session)
+    await session.flush()
+
+
+async def remaining_ids(session):
+    return (await session.execute(select(OutboxEventModel.id).order_by(OutboxEventModel.id))).scalars().all()
+
+
+@pytest.mark.asyncio
+async def test_claim_pending_returns_unsent_events_in_insertion_order(outbox, db_session):
+    await add_events(outbox, db_session, "o1", "o2", "o3")
+    first, second, third = await remaining_ids(db_session)
+    await outbox.mark_sent([second], db_session)
+
+    events = await outbox.claim_pending(10, db_session)
+
+    assert [event.id for event in events] == [first, third]
+    assert [event.payload["orderId"] for event in events] == ["o1", "o3"]
+
+
+@pytest.mark.asyncio
+async def test_purge_sent_deletes_only_events_published_before_retention(outbox, db_session):
+    await add_events(outbox, db_session, "old", "recent", "unsent")
+    old, recent, unsent = await remaining_ids(db_session)
+    await outbox.mark_sent([old, recent], db_session)
+    await db_session.execute(
+        update(OutboxEventModel)
+        .where(OutboxEventModel.id == old)
+        .values(sent_at=func.now() - timedelta(hours=25)))
+
+    assert await outbox.purge_sent(timedelta(hours=24), limit=100, session=db_session) == 1
+    assert await remaining_ids(db_session) == [recent, unsent]
@@ -0,0 +1,40 @@
+import grpc
+import pytest
+
+from src.infrastructure.grpc.interceptors.server_interceptor import ServerAdmissionControlInterceptor
+from src.shared.utils.deadline import deadline_scope
+from tests.fakes import FakeServicerContext
+
+METHOD = "/order.OrderService/GetOrderById"
+
+
+@pytest.fixture
+def interceptor(metrics_service, logging_service):
+    return ServerAdmissionControlInterceptor(metrics_service, logging_service, latency_target_sec=10)
+
+
+async def run_call(interceptor, context):
+    async with interceptor._admit(METHOD, context):
+        pass
+    return interceptor._method_limiters[METHOD]
+
+
+@pytest.mark.asyncio
+async def test_admission_backs_off_on_overload_status_code(interceptor):
+    limiter = await run_call(interceptor, FakeServicerContext(grpc.StatusCode.OK))
+    limit = limiter._limit
+
+    await run_call(interceptor, FakeServicerContext(grpc.StatusCode.RESOURCE_EXHAUSTED))
+    assert limiter._limit < limit
+
+
+@pytest.mark.asyncio
+async def test_admission_backs_off_when_deadline_ran_out_in_handler(interceptor):
+    limiter = await run_call(interceptor, FakeServicerContext())
+    limit = limiter._limit
+
+    # The handler answered with an error payload, but the budget was spent
+    with deadline_scope(0):
+        await run_call(interceptor, FakeServicerContext())
+    assert limiter._limit < limit
+    assert limiter.in_flight == 0
@@ -1,32 +1,78 @@
+import hashlib
 import pytest
-from unittest.mock import AsyncMock
-import logging
+import time
+from unittest.mock import AsyncMock, MagicMock
 
+from jose import jwt
+
+from src.infrastructure.config.settings import settings
 from src.infrastructure.grpc.auth_guard import AuthGuard
+from src.shared.utils.ttl_cache import TTLCache
+
+
+def make_token(exp_in_sec=60, role="STUDENT"):
+    claims = {"sub": "user1", "role": role, "exp": int(time.time() + exp_in_sec)}
+    return jwt.encode(claims, settings.JWT_SECRET, algorithm="HS256")
+
+
+def digest_of(token):
+    return hashlib.sha256(token.encode()).digest()
 
-@pytest.mark.asyncio
-async def test_auth_guard_success(user_service_client):
-    # Arrange
-    logger = logging.getLogger("test")
-    auth_guard = AuthGuard(user_service_client, logger)
-    token = "valid_token"
 
-    # Act
-    user_info = await auth_guard.validate_token(token)
+@pytest.fixture
+def token_cache():
+    return TTLCache(max_entries=10, ttl_sec=300)
+
+
+@pytest.fixture
+def auth_guard(logging_service, metrics_service, token_cache):
+    return AuthGuard(AsyncMock(), logging_service, metrics_service, token_cache=token_cache)
+
+
+@pytest.mark.asyncio
+async def test_auth_guard_success(auth_guard):
+    user_info = await auth_guard.validate_token(make_token())
 
-    # Assert
     assert user_info == {"user_id": "user1", "role": "STUDENT"}
-    user_service_client.verify_user.assert_called_once_with("user1", token)
+
 
 @pytest.mark.asyncio
-async def test_auth_guard_authorize_failure(user_service_client):
-    # Arrange
-    logger = logging.getLogger("test")
-    auth_guard = AuthGuard(user_service_client, logger)
-    user_service_client.verify_user.return_value = {"user_id": "user1", "role": "INSTRUCTOR"}
-    token = "valid_token"
-
-    # Act & Assert
-    user_info = await auth_guard.validate_token(token)
+async def test_auth_guard_authorize_failure(auth_guard):
+    user_info = await auth_guard.validate_token(make_token(role="INSTRUCTOR"))
     with pytest.raises(ValueError, match="User role INSTRUCTOR not authorized for this action"):
-        await auth_guard.authorize(user_info, required_role="STUDENT")
\ No newline at end of file
+        await auth_guard.authorize(user_info, required_role="STUDENT")
+
+
+@pytest.mark.asyncio
+async def test_auth_guard_serves_repeated_token_from_cache(auth_guard, metrics_service, monkeypatch):
+    token = make_token()
+    await auth_guard.validate_token(token)
+
+    decode = MagicMock(side_effect=AssertionError("should not verify again"))
+    monkeypatch.setattr("src.infrastructure.grpc.auth_guard.jwt.decode", decode)
+    assert await auth_guard.validate_token(token) == {"user_id": "user1", "role": "STUDENT"}
+    metrics_service.cache_hits.assert_called_once_with(type="jwt")
+
+
+@pytest.mark.asyncio
+async def test_auth_guard_cache_entry_lives_until_exp(logging_service, metrics_service, clock):
+    cache = TTLCache(max_entries=10, ttl_sec=300, clock=clock)
+    auth_guard = AuthGuard(AsyncMock(), logging_service, metrics_service, token_cache=cache)
+    token = make_token(exp_in_sec=30)
+    await auth_guard.validate_token(token)
+
+    clock.now = 29
+    assert digest_of(token) in cache
+    clock.now = 31
+    assert digest_of(token) not in cache
+
+
+@pytest.mark.asyncio
+async def test_auth_guard_rejects_expired_token_still_in_cache(auth_guard, token_cache):
+    token = make_token(exp_in_sec=-10)
+    # An entry whose cache TTL outlived the token's exp (e.g. wall clock jumped)
+    token_cache.set(digest_of(token), ({"user_id": "user1", "role": "STUDENT"}, time.time() - 10))
+
+    with pytest.raises(ValueError, match="Invalid JWT token"):
+        await auth_guard.validate_token(token)
+    assert len(token_cache) == 0
@@ -0,0 +1,154 @@
+import asyncio
+import grpc
+import pytest
+import pytest_asyncio
+from unittest.mock import MagicMock
+
+from src.infrastructure.grpc.clients.channel_manager import ChannelManager, _HedgeState, _ManagedChannel
+from tests.fakes import FakeChannel, FakeStub, settle
+
+READY = grpc.ChannelConnectivity.READY
+TRANSIENT_FAILURE = grpc.ChannelConnectivity.TRANSIENT_FAILURE
+
+
+@pytest.fixture
+def manager(logging_service, metrics_service):
+    return ChannelManager("CourseService", "localhost:50051", logging_service, metrics_service, size=1)
+
+
+@pytest.mark.asyncio
+async def test_hedge_latency_records_failed_attempts(manager):
+    hedging = _HedgeState()
+
+    async def invoke(stub):
+        raise ValueError("upstream error")
+
+    with pytest.raises(ValueError):
+        await manager._attempt(_ManagedChannel(0, MagicMock()), FakeStub, None, invoke, hedging, 0.2)
+    assert len(hedging.latency) == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_latency_counts_cancelled_attempts_as_at_least_the_delay(manager):
+    hedging = _HedgeState()
+
+    async def invoke(stub):
+        await asyncio.sleep(10)
+
+    attempt = asyncio.create_task(
+        manager._attempt(_ManagedChannel(0, MagicMock()), FakeStub, None, invoke, hedging, 0.2))
+    await asyncio.sleep(0)
+    attempt.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await attempt
+
+    assert list(hedging.latency._samples) == [0.2]
+
+
+@pytest.fixture
+def opened_channels(monkeypatch):
+    channels = []
+
+    def insecure_channel(target, options=None, interceptors=None):
+        channels.append(FakeChannel(target, options, interceptors))
+        return channels[-1]
+
+    monkeypatch.setattr("src.infrastructure.grpc.clients.channel_manager.aio.insecure_channel", insecure_channel)
+    return channels
+
+
+@pytest_asyncio.fixture
+async def pool(logging_service, metrics_service, opened_channels):
+    manager = ChannelManager("CourseService", "localhost:50051", logging_service, metrics_service, size=3)
+    manager._pick()
+    await settle()
+    yield manager
+    await manager.close()
+
+
+def channel_counts(metrics_service):
+    """The last count published per connectivity state, leaving out zeros."""
+    counts = {}
+    for call in metrics_service.upstream_channels.call_args_list:
+        service, state, count = call.args
+        counts[state] = count
+    return {state: count for state, count in counts.items() if count}
+
+
+def picked(manager, calls):
+    return [manager._pick().index for _ in range(calls)]
+
+
+@pytest.mark.asyncio
+async def test_channels_open_on_first_pick_with_keepalive_and_own_subchannel_pool(pool, opened_channels):
+    assert len(opened_channels) == 3
+    assert {channel.target for channel in opened_channels} == {"localhost:50051"}
+    options = dict(opened_channels[0].options)
+    assert options["grpc.use_local_subchannel_pool"] == 1
+    assert options["grpc.keepalive_permit_without_calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pick_round_robins_and_caches_stubs_per_channel(pool):
+    assert picked(pool, 4) == [1, 2, 0, 1]
+
+    stubs = []
+    for _ in range(6):
+        async with pool.stub(FakeStub, "GetCourse") as stub:
+            stubs.append(stub)
+    assert len({id(stub.channel) for stub in stubs[:3]}) == 3
+    assert stubs[:3] == stubs[3:]
+
+
+@pytest.mark.asyncio
+async def test_watcher_tracks_state_and_publishes_channel_counts(pool, opened_channels, metrics_service):
+    for channel in opened_channels:
+        channel.set_state(READY)
+    await settle()
+    assert [managed.state for managed in pool._channels] == [READY] * 3
+    assert channel_counts(metrics_service) == {"ready": 3}
+
+    opened_channels[1].set_state(TRANSIENT_FAILURE)
+    await settle()
+    assert channel_counts(metrics_service) == {"ready": 2, "transient_failure": 1}
+
+
+@pytest.mark.asyncio
+async def test_pick_skips_failing_channel_until_it_recovers(pool, opened_channels):
+    opened_channels[1].set_state(TRANSIENT_FAILURE)
+    await settle()
+    assert 1 not in picked(pool, 6)
+
+    opened_channels[1].set_state(READY)
+    await settle()
+    assert 1 in picked(pool, 3)
+
+
+@pytest.mark.asyncio
+async def test_pick_uses_failing_channel_when_none_is_usable(pool, opened_channels):
+    for channel in opened_channels:
+        channel.set_state(TRANSIENT_FAILURE)
+    await settle()
+
+    # The call then surfaces UNAVAILABLE (or waits for ready) instead of failing here
+    assert sorted(picked(pool, 3)) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_hedge_goes_to_another_healthy_channel(pool, opened_channels):
+    opened_channels[2].set_state(TRANSIENT_FAILURE)
+    await settle()
+
+    assert {pool._pick(exclude=pool._channels[0]).index for _ in range(4)} == {1}
+
+
+@pytest.mark.asyncio
+async def test_close_shuts_channels_and_zeroes_channel_counts(pool, opened_channels, metrics_service):
+    watchers = [managed.watcher for managed in pool._channels]
+
+    await pool.close()
+    await settle()
+
+    assert all(channel.closed for channel in opened_channels)
+    assert all(watcher.done() for watcher in watchers)
+    assert channel_counts(metrics_service) == {}
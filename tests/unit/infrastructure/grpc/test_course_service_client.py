@@ -0,0 +1,68 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.infrastructure.grpc.clients.couser_service_client import CourseServiceClient
+from src.infrastructure.grpc.generated.course.types.enrollment_pb2 import (
+    EnrollmentData,
+    EnrollmentsResponse,
+)
+from tests.fakes import FakeChannelManager
+
+
+def enrollment(course_id, status="active", deleted_at=None):
+    data = EnrollmentData(course_id=course_id, status=status)
+    if deleted_at is not None:
+        data.deleted_at = deleted_at
+    return data
+
+
+def page(enrollments, total):
+    response = EnrollmentsResponse()
+    response.enrollments.enrollments.extend(enrollments)
+    response.enrollments.total = total
+    return response
+
+
+@pytest.fixture
+def make_client(logging_service, metrics_service):
+    def make(pages):
+        client = CourseServiceClient(logging_service, metrics_service)
+        stub = MagicMock()
+        stub.GetEnrollmentsByUser = AsyncMock(side_effect=pages)
+        client.channels = FakeChannelManager(stub)
+        return client, stub
+    return make
+
+
+@pytest.mark.asyncio
+async def test_enrolled_course_ids_skip_deleted_enrollments(make_client):
+    client, _ = make_client([page([
+        enrollment("c1", "active"),
+        enrollment("c2", "COMPLETED"),
+        enrollment("c3", "active", deleted_at="2024-01-01T00:00:00Z"),
+    ], total=3)])
+
+    assert await client.get_user_enrolled_course_ids("user1") == {"c1", "c2"}
+
+
+@pytest.mark.asyncio
+async def test_enrolled_course_ids_walk_pages_until_total(make_client):
+    client, stub = make_client([
+        page([enrollment("c1"), enrollment("c2")], total=3),
+        page([enrollment("c3")], total=3),
+    ])
+
+    assert await client.get_user_enrolled_course_ids("user1") == {"c1", "c2", "c3"}
+    assert [call.args[0].pagination.page for call in stub.GetEnrollmentsByUser.call_args_list] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_enrolled_course_ids_stop_on_empty_page(make_client):
+    # total overstates what the upstream actually returns
+    client, stub = make_client([
+        page([enrollment("c1")], total=10),
+        page([], total=10),
+    ])
+
+    assert await client.get_user_enrolled_course_ids("user1") == {"c1"}
+    assert stub.GetEnrollmentsByUser.call_count == 2
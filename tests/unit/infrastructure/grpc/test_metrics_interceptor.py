@@ -0,0 +1,115 @@
+import asyncio
+import grpc
+import pytest
+from types import SimpleNamespace
+from unittest.mock import call
+
+from src.infrastructure.grpc.generated.order_service_pb2 import OrderStatus, OrderStatusResponse
+from src.infrastructure.grpc.interceptors.server_interceptor import ServerMetricsInterceptor
+from tests.fakes import FakeServicerContext
+
+METHOD = "/order.OrderService/GetOrderStatus"
+
+RESPONSE = OrderStatusResponse(success=OrderStatus(order_id="order1", status="processing"))
+
+
+@pytest.fixture
+def interceptor(metrics_service, logging_service):
+    return ServerMetricsInterceptor(metrics_service, logging_service)
+
+
+async def intercept(interceptor, handler):
+    async def continuation(handler_call_details):
+        return handler
+
+    return await interceptor.intercept_service(continuation, SimpleNamespace(method=METHOD))
+
+
+def recorded_status(metrics_service):
+    return metrics_service.request_counter.call_args.kwargs["status"]
+
+
+@pytest.mark.asyncio
+async def test_unary_call_in_flight_while_handler_runs(interceptor, metrics_service):
+    async def behavior(request, context):
+        assert metrics_service.requests_in_flight.call_args_list == [call(method=METHOD, delta=1)]
+        await asyncio.sleep(0.01)
+        return RESPONSE
+
+    handler = await intercept(interceptor, grpc.unary_unary_rpc_method_handler(behavior))
+    assert await handler.unary_unary(None, FakeServicerContext()) == RESPONSE
+
+    assert metrics_service.requests_in_flight.call_args_list == [
+        call(method=METHOD, delta=1), call(method=METHOD, delta=-1)]
+    assert metrics_service.request_latency.call_args.kwargs["latency"] >= 0.01
+    metrics_service.response_size.assert_called_once_with(method=METHOD, size_bytes=RESPONSE.ByteSize())
+    assert recorded_status(metrics_service) == "OK"
+
+
+@pytest.mark.asyncio
+async def test_pre_serialized_response_size_is_its_length(interceptor, metrics_service):
+    async def behavior(request, context):
+        return b"\x0a\x03abc"
+
+    handler = await intercept(interceptor, grpc.unary_unary_rpc_method_handler(behavior))
+    await handler.unary_unary(None, FakeServicerContext())
+
+    metrics_service.response_size.assert_called_once_with(method=METHOD, size_bytes=5)
+
+
+@pytest.mark.asyncio
+async def test_status_comes_from_code_set_by_handler(interceptor, metrics_service):
+    async def behavior(request, context):
+        # Handlers answer most errors with an error payload and a status code
+        context.set_code(grpc.StatusCode.NOT_FOUND)
+        return RESPONSE
+
+    handler = await intercept(interceptor, grpc.unary_unary_rpc_method_handler(behavior))
+    await handler.unary_unary(None, FakeServicerContext())
+
+    assert recorded_status(metrics_service) == "NOT_FOUND"
+
+
+@pytest.mark.asyncio
+async def test_status_of_aborted_call_is_the_abort_code(interceptor, metrics_service):
+    async def behavior(request, context):
+        await context.abort(grpc.StatusCode.PERMISSION_DENIED, "not yours")
+
+    handler = await intercept(interceptor, grpc.unary_unary_rpc_method_handler(behavior))
+    with pytest.raises(RuntimeError):
+        await handler.unary_unary(None, FakeServicerContext())
+
+    assert recorded_status(metrics_service) == "PERMISSION_DENIED"
+    assert metrics_service.requests_in_flight.call_args == call(method=METHOD, delta=-1)
+
+
+@pytest.mark.asyncio
+async def test_status_of_unhandled_exception_is_unknown(interceptor, metrics_service):
+    async def behavior(request, context):
+        raise ValueError("boom")
+
+    handler = await intercept(interceptor, grpc.unary_unary_rpc_method_handler(behavior))
+    with pytest.raises(ValueError):
+        await handler.unary_unary(None, FakeServicerContext())
+
+    assert recorded_status(metrics_service) == "UNKNOWN"
+
+
+@pytest.mark.asyncio
+async def test_stream_is_measured_until_its_last_message(interceptor, metrics_service):
+    async def behavior(request, context):
+        for status in ("processing", "succeeded"):
+            await asyncio.sleep(0.01)
+            yield OrderStatusResponse(success=OrderStatus(order_id="order1", status=status))
+
+    handler = await intercept(interceptor, grpc.unary_stream_rpc_method_handler(behavior))
+    responses = []
+    async for response in handler.unary_stream(None, FakeServicerContext()):
+        responses.append(response)
+        assert metrics_service.requests_in_flight.call_count == 1
+
+    assert metrics_service.requests_in_flight.call_args == call(method=METHOD, delta=-1)
+    assert metrics_service.request_latency.call_args.kwargs["latency"] >= 0.02
+    metrics_service.response_size.assert_called_once_with(
+        method=METHOD, size_bytes=sum(response.ByteSize() for response in responses))
+    assert recorded_status(metrics_service) == "OK"
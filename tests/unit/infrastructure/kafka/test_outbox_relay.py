@@ -0,0 +1,78 @@
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+from src.infrastructure.kafka.outbox_relay import OutboxRelay
+from tests.fakes import FakeOutboxRepository
+
+TOPIC = "order.course.created.v1"
+
+
+@pytest.fixture
+def outbox():
+    return FakeOutboxRepository()
+
+
+@pytest.fixture
+def relay(outbox, kafka_producer, logging_service, monkeypatch):
+    @asynccontextmanager
+    async def get_db():
+        yield MagicMock()
+
+    monkeypatch.setattr("src.infrastructure.kafka.outbox_relay.get_db", get_db)
+    return OutboxRelay(outbox, kafka_producer, logging_service, batch_size=10)
+
+
+def publish_results(*errors):
+    return AsyncMock(return_value=list(errors))
+
+
+@pytest.mark.asyncio
+async def test_relay_publishes_batch_in_order_and_marks_it_sent(relay, outbox, kafka_producer):
+    for order_id in ("o1", "o2", "o1"):
+        await outbox.add(TOPIC, {"orderId": order_id})
+    kafka_producer.publish_events = publish_results(None, None, None)
+
+    assert await relay.relay_once() == 3
+    kafka_producer.publish_events.assert_awaited_once_with(
+        [(TOPIC, {"orderId": "o1"}), (TOPIC, {"orderId": "o2"}), (TOPIC, {"orderId": "o1"})])
+    assert outbox.sent == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_relay_holds_back_later_events_of_a_failed_key(relay, outbox, kafka_producer):
+    for order_id in ("o1", "o2", "o1", "o2"):
+        await outbox.add(TOPIC, {"orderId": order_id})
+    # o1's first event fails; its second was acked but must not overtake it
+    kafka_producer.publish_events = publish_results(RuntimeError("broker down"), None, None, None)
+
+    assert await relay.relay_once() == 2
+    assert outbox.sent == [2, 4]
+
+    kafka_producer.publish_events = publish_results(None, None)
+    assert await relay.relay_once() == 2
+    kafka_producer.publish_events.assert_awaited_once_with(
+        [(TOPIC, {"orderId": "o1"}), (TOPIC, {"orderId": "o1"})])
+    assert outbox.sent == [2, 4, 1, 3]
+
+
+@pytest.mark.asyncio
+async def test_relay_does_not_hold_back_unkeyed_events(relay, outbox, kafka_producer):
+    await outbox.add(TOPIC, {"note": "a"})
+    await outbox.add(TOPIC, {"note": "b"})
+    kafka_producer.publish_events = publish_results(RuntimeError("broker down"), None)
+
+    assert await relay.relay_once() == 1
+    assert outbox.sent == [2]
+
+
+@pytest.mark.asyncio
+async def test_purge_deletes_published_events_in_batches(relay, outbox, kafka_producer):
+    relay.PURGE_BATCH_SIZE = 2
+    for order_id in ("o1", "o2", "o3", "o4", "o5"):
+        await outbox.add(TOPIC, {"orderId": order_id})
+    kafka_producer.publish_events = publish_results(None, None, None, None, RuntimeError("broker down"))
+    await relay.relay_once()
+
+    assert await relay.purge_once() == 4
+    assert [event.id for event in outbox.events] == [5]
@@ -0,0 +1,43 @@
+import pytest
+
+from src.infrastructure.grpc.generated.order_service_pb2 import (
+    MoneyData, OrderData, OrderItemsData, OrderResponse, OrderSuccess, PaymentDetailsData)
+from src.infrastructure.redis.order_response_cache import OrderResponseCache, order_response_bytes
+
+
+def make_order_data(items=1):
+    return OrderData(
+        id="order1", user_id="user1", status="succeeded",
+        created_at="2026-01-01T00:00:00", updated_at="2026-01-01T00:05:00",
+        amount=MoneyData(total=10.0 * items, currency="USD", discount=0.0, sales_tax=0.0, sub_total=10.0 * items),
+        items=[OrderItemsData(course_id=f"course{i}", price=10.0) for i in range(items)],
+        payment_details=PaymentDetailsData(
+            payment_id="pay1", provider="razorpay", provider_order_id="po1",
+            payment_status="success", updated_at="2026-01-01T00:05:00"),
+    )
+
+
+# 1, 2 and 3-byte varint length prefixes
+@pytest.mark.parametrize("order_data", [
+    OrderData(id="order1", status="created"),
+    make_order_data(),
+    make_order_data(items=1000),
+])
+def test_framed_bytes_parse_as_order_response(order_data):
+    response = OrderResponse.FromString(order_response_bytes(order_data.SerializeToString()))
+
+    assert response == OrderResponse(success=OrderSuccess(order=order_data))
+
+
+@pytest.mark.asyncio
+async def test_cached_order_round_trips_to_order_response(fake_redis, logging_service):
+    cache = OrderResponseCache(fake_redis, logging_service)
+    order_data = make_order_data()
+
+    assert await cache.get_response("order1") is None
+    await cache.put("order1", order_data)
+
+    response = OrderResponse.FromString(await cache.get_response("order1"))
+    assert response.WhichOneof("result") == "success"
+    assert response.success.order == order_data
+    assert fake_redis.expiries["order_pb:order1"] == 3600
@@ -0,0 +1,90 @@
+import asyncio
+import json
+import pytest
+import pytest_asyncio
+
+from src.domain.entities.order import OrderStatus
+from src.infrastructure.redis.order_status_notifier import RedisOrderStatusNotifier
+from tests.fakes import FakeAsyncSession, settle
+
+
+@pytest_asyncio.fixture
+async def notifier(fake_redis, logging_service):
+    notifier = RedisOrderStatusNotifier(fake_redis, logging_service)
+    yield notifier
+    if notifier._listener is not None:
+        notifier._listener.cancel()
+        await asyncio.gather(notifier._listener, return_exceptions=True)
+
+
+def drain(queue):
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+@pytest.mark.asyncio
+async def test_publishes_last_status_of_a_transaction_after_commit(notifier):
+    session = FakeAsyncSession()
+    async with notifier.watch("order1") as changes:
+        notifier.publish_after_commit(session, "order1", OrderStatus.PROCESSING)
+        notifier.publish_after_commit(session, "order1", OrderStatus.SUCCEEDED)
+        await settle()
+        assert changes.empty()
+
+        await session.commit()
+        await settle()
+        assert drain(changes) == ["succeeded"]
+
+
+@pytest.mark.asyncio
+async def test_drops_status_changes_on_rollback(notifier):
+    session = FakeAsyncSession()
+    async with notifier.watch("order1") as changes:
+        notifier.publish_after_commit(session, "order1", OrderStatus.SUCCEEDED)
+        await session.rollback()
+        session.sync_session.begin()
+        await session.commit()
+        await settle()
+
+        assert changes.empty()
+
+
+@pytest.mark.asyncio
+async def test_routes_changes_only_to_watchers_of_that_order(notifier):
+    session = FakeAsyncSession()
+    async with notifier.watch("order1") as first, notifier.watch("order2") as second:
+        notifier.publish_after_commit(session, "order2", "failed")
+        await session.commit()
+        await settle()
+
+        assert drain(first) == []
+        assert drain(second) == ["failed"]
+    assert notifier._watchers == {}
+
+
+@pytest.mark.asyncio
+async def test_watchers_are_told_to_re_read_after_reconnect(notifier, fake_redis, monkeypatch):
+    monkeypatch.setattr(RedisOrderStatusNotifier, "RECONNECT_DELAY_SEC", 0)
+    async with notifier.watch("order1") as changes:
+        [pubsub] = fake_redis.subscribers
+        pubsub.messages.put_nowait(ConnectionError("connection lost"))
+        await settle()
+
+        # Anything published while disconnected is lost, so the watcher gets None
+        assert drain(changes) == [None]
+        assert len(fake_redis.subscribers) == 1
+        assert fake_redis.subscribers[0] is not pubsub
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_status(notifier, fake_redis, monkeypatch):
+    monkeypatch.setattr(RedisOrderStatusNotifier, "QUEUE_SIZE", 2)
+    async with notifier.watch("order1") as changes:
+        for status in ("pending_payment", "processing", "succeeded"):
+            await fake_redis.client.publish(
+                notifier._channel, json.dumps({"order_id": "order1", "status": status}))
+        await settle()
+
+        assert drain(changes) == ["processing", "succeeded"]
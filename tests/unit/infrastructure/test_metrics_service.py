@@ -0,0 +1,36 @@
+import pytest
+
+from src.infrastructure.observability.metrics.metrics_service import MetricsService
+
+
+def latency_exemplars(metrics):
+    return [sample.exemplar for family in metrics._request_latency.collect()
+            for sample in family.samples if sample.exemplar is not None]
+
+
+@pytest.fixture
+def new_metrics_service(monkeypatch):
+    def build(multiproc_dir=None):
+        if multiproc_dir is None:
+            monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+        else:
+            monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", multiproc_dir)
+        monkeypatch.setattr(MetricsService, "_instance", None)
+        return MetricsService()
+    return build
+
+
+def test_request_latency_carries_trace_id_exemplar(new_metrics_service):
+    metrics = new_metrics_service()
+
+    metrics.request_latency("m", "m", 0.02, trace_id="ab" * 16)
+
+    assert [exemplar.labels for exemplar in latency_exemplars(metrics)] == [{"trace_id": "ab" * 16}]
+
+
+def test_request_latency_skips_exemplar_in_multiprocess_mode(new_metrics_service, tmp_path):
+    metrics = new_metrics_service(str(tmp_path))
+
+    metrics.request_latency("m", "m", 0.02, trace_id="ab" * 16)
+
+    assert latency_exemplars(metrics) == []
@@ -0,0 +1,26 @@
+from src.shared.utils.adaptive_limiter import AdaptiveConcurrencyLimiter
+
+
+def test_limiter_rejects_beyond_limit_and_reserves_headroom():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=10)
+
+    assert all(limiter.try_acquire(share=0.5) for _ in range(5))
+    assert not limiter.try_acquire(share=0.5)
+    assert all(limiter.try_acquire() for _ in range(5))
+    assert not limiter.try_acquire()
+
+
+def test_limiter_backs_off_on_slow_requests_and_grows_when_saturated():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, latency_target_sec=0.1)
+
+    limiter.try_acquire()
+    limiter.release(latency_sec=0.5)
+    assert limiter.limit == 9
+
+    for _ in range(200):
+        for _ in range(limiter.limit):
+            limiter.try_acquire()
+        for _ in range(limiter.limit):
+            limiter.release(latency_sec=0.01)
+    assert limiter.limit > 9
+    assert limiter.in_flight == 0
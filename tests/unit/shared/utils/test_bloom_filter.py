@@ -0,0 +1,33 @@
+from src.shared.utils.bloom_filter import BloomFilterSpec
+
+
+def test_bloom_filter_spec_sizing():
+    spec = BloomFilterSpec(capacity=1_000_000, error_rate=0.01)
+
+    assert spec.bit_size == 9_585_059
+    assert spec.hash_count == 7
+
+
+def test_bloom_filter_offsets_are_stable_and_skip_ready_bit():
+    spec = BloomFilterSpec(capacity=1000, error_rate=0.01)
+    offsets = spec.offsets("idem-key-1")
+
+    assert offsets == spec.offsets("idem-key-1")
+    assert len(offsets) == spec.hash_count
+    assert all(1 <= offset <= spec.bit_size for offset in offsets)
+    assert BloomFilterSpec.READY_BIT not in offsets
+
+
+def test_bloom_filter_false_positive_rate_matches_target_at_capacity():
+    spec = BloomFilterSpec(capacity=2000, error_rate=0.01)
+    bits = set()
+    for i in range(spec.capacity):
+        bits.update(spec.offsets(f"key-{i}"))
+
+    probes = 20_000
+    false_positives = sum(
+        all(offset in bits for offset in spec.offsets(f"other-{i}"))
+        for i in range(probes)
+    )
+    assert false_positives / probes < 0.02
+    assert spec.estimated_false_positive_rate(len(bits) / spec.bit_size) < 0.02
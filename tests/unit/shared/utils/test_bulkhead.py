@@ -0,0 +1,61 @@
+import asyncio
+import pytest
+
+from src.domain.exceptions.exceptions import UpstreamSaturatedException
+from src.shared.utils.adaptive_limiter import AdaptiveConcurrencyLimiter
+from src.shared.utils.bulkhead import Bulkhead
+
+
+def make_bulkhead(limit, **kwargs):
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=limit, max_limit=limit)
+    return Bulkhead("CourseService.GetCoursesByIds", limiter, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_fails_fast_without_queue():
+    bulkhead = make_bulkhead(1, queue_timeout_sec=0)
+    await bulkhead.acquire()
+
+    with pytest.raises(UpstreamSaturatedException):
+        await bulkhead.acquire()
+
+    bulkhead.release(latency_sec=0.01)
+    await bulkhead.acquire()
+    assert bulkhead.limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_hands_freed_slot_to_oldest_waiter():
+    bulkhead = make_bulkhead(1, queue_timeout_sec=1)
+    await bulkhead.acquire()
+
+    first = asyncio.create_task(bulkhead.acquire())
+    second = asyncio.create_task(bulkhead.acquire())
+    await asyncio.sleep(0)
+    assert bulkhead.queue_depth == 2
+
+    bulkhead.release(latency_sec=0.01)
+    await first
+    assert not second.done()
+    assert bulkhead.queue_depth == 1
+
+    bulkhead.release(latency_sec=0.01)
+    await second
+    assert bulkhead.queue_depth == 0
+    assert bulkhead.limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_rejects_after_queue_timeout_or_when_queue_is_full():
+    bulkhead = make_bulkhead(1, max_queue=1, queue_timeout_sec=0.01)
+    await bulkhead.acquire()
+
+    waiter = asyncio.create_task(bulkhead.acquire())
+    await asyncio.sleep(0)
+    with pytest.raises(UpstreamSaturatedException):
+        await bulkhead.acquire()
+    with pytest.raises(UpstreamSaturatedException):
+        await waiter
+
+    assert bulkhead.queue_depth == 0
+    assert bulkhead.limiter.in_flight == 1
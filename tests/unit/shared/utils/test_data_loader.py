@@ -0,0 +1,46 @@
+import asyncio
+import pytest
+
+from src.shared.utils.data_loader import DataLoader
+
+
+@pytest.mark.asyncio
+async def test_data_loader_coalesces_concurrent_loads():
+    calls = []
+
+    async def batch_fn(keys):
+        calls.append(sorted(keys))
+        return {key: key.upper() for key in keys if key != "missing"}
+
+    loader = DataLoader(batch_fn, max_batch_size=10, batch_window_sec=0.01)
+    results = await asyncio.gather(
+        loader.load("a"), loader.load("b"), loader.load("a"), loader.load("missing")
+    )
+
+    assert results == ["A", "B", "A", None]
+    assert calls == [["a", "b", "missing"]]
+
+
+@pytest.mark.asyncio
+async def test_data_loader_dispatches_when_batch_is_full():
+    calls = []
+
+    async def batch_fn(keys):
+        calls.append(list(keys))
+        return {key: key for key in keys}
+
+    loader = DataLoader(batch_fn, max_batch_size=2, batch_window_sec=10)
+    results = await asyncio.gather(loader.load("a"), loader.load("b"))
+
+    assert results == ["a", "b"]
+    assert calls == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_data_loader_propagates_batch_errors():
+    async def batch_fn(keys):
+        raise ValueError("upstream down")
+
+    loader = DataLoader(batch_fn, batch_window_sec=0)
+    with pytest.raises(ValueError, match="upstream down"):
+        await asyncio.gather(loader.load("a"), loader.load("b"))
@@ -0,0 +1,50 @@
+import asyncio
+import pytest
+from tenacity import retry, stop_after_attempt, wait_fixed
+
+from src.domain.exceptions.exceptions import DeadlineExceededException
+from src.shared.utils.deadline import (
+    deadline_scope,
+    remaining,
+    stop_on_deadline,
+    timeout_for,
+    within_deadline,
+)
+
+
+def test_timeout_for_caps_default_by_remaining_budget():
+    assert timeout_for(5.0) == 5.0
+    with deadline_scope(1.0):
+        assert 0.9 < timeout_for(5.0) <= 1.0
+        # Inner scopes never extend the outer deadline
+        with deadline_scope(10.0):
+            assert remaining() <= 1.0
+    assert remaining() is None
+
+
+def test_timeout_for_raises_once_budget_is_spent():
+    with deadline_scope(0):
+        with pytest.raises(DeadlineExceededException):
+            timeout_for(5.0)
+
+
+@pytest.mark.asyncio
+async def test_within_deadline_abandons_slow_calls():
+    with deadline_scope(0.02):
+        with pytest.raises(DeadlineExceededException):
+            await within_deadline(asyncio.sleep(1))
+
+
+@pytest.mark.asyncio
+async def test_retries_stop_when_backoff_would_overrun_deadline():
+    attempts = []
+
+    @retry(stop=(stop_after_attempt(5) | stop_on_deadline), wait=wait_fixed(0.05), reraise=True)
+    async def flaky():
+        attempts.append(1)
+        raise ConnectionError("upstream unavailable")
+
+    with deadline_scope(0.08):
+        with pytest.raises(ConnectionError):
+            await flaky()
+    assert len(attempts) == 2
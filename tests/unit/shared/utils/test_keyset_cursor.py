@@ -0,0 +1,17 @@
+import pytest
+
+from src.shared.utils.keyset_cursor import decode_cursor, encode_cursor
+
+
+def test_keyset_cursor_round_trips_position():
+    position = {"created_at": "2026-10-18T10:00:00+00:00", "id": "order-1", "sort_order": "desc"}
+    cursor = encode_cursor(position)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == position
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor!", encode_cursor({"id": "x"})[:-3], "e30"])
+def test_keyset_cursor_rejects_malformed_tokens(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
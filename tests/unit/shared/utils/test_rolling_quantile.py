@@ -0,0 +1,25 @@
+from src.shared.utils.rolling_quantile import RollingQuantile
+
+
+def test_rolling_quantile_needs_min_samples():
+    tracker = RollingQuantile(quantile=0.95, window=100, min_samples=10)
+    for i in range(9):
+        tracker.observe(float(i))
+
+    assert tracker.value() is None
+    tracker.observe(9.0)
+    assert tracker.value() == 9.0
+
+
+def test_rolling_quantile_over_window():
+    tracker = RollingQuantile(quantile=0.95, window=100, min_samples=10)
+    for i in range(1, 101):
+        tracker.observe(i / 1000)
+
+    assert tracker.value() == 0.095
+
+    # Older samples fall out of the window
+    for _ in range(100):
+        tracker.observe(0.001)
+    assert tracker.value() == 0.001
+    assert len(tracker) == 100
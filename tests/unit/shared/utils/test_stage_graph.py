@@ -0,0 +1,54 @@
+import asyncio
+import pytest
+
+from src.shared.utils.stage_graph import StageGraph
+
+
+@pytest.mark.asyncio
+async def test_stage_graph_runs_independent_stages_concurrently():
+    timings = {}
+
+    async def slow(value):
+        await asyncio.sleep(0.05)
+        return value
+
+    async def total(a, b):
+        return a + b
+
+    graph = StageGraph(on_stage_complete=lambda name, sec, status: timings.__setitem__(name, status))
+    graph.add("a", lambda: slow(1)).add("b", lambda: slow(2)).add("total", total, depends_on=["a", "b"])
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = await graph.run()
+
+    assert results == {"a": 1, "b": 2, "total": 3}
+    assert loop.time() - started < 0.09
+    assert timings == {"a": "ok", "b": "ok", "total": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_stage_graph_cancels_siblings_and_reraises_first_failure():
+    statuses = {}
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise LookupError("user missing")
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    graph = StageGraph(on_stage_complete=lambda name, sec, status: statuses.__setitem__(name, status))
+    graph.add("user", fail).add("prices", hang)
+
+    with pytest.raises(LookupError, match="user missing"):
+        await asyncio.wait_for(graph.run(), timeout=1)
+    assert statuses == {"user": "error", "prices": "cancelled"}
+
+
+def test_stage_graph_rejects_unknown_dependencies():
+    async def noop():
+        return None
+
+    with pytest.raises(ValueError):
+        StageGraph().add("ownership", noop, depends_on=["prices"])
@@ -0,0 +1,48 @@
+from src.shared.utils.ttl_cache import TTLCache
+
+
+def test_ttl_cache_expires_entries(clock):
+    cache = TTLCache(max_entries=10, ttl_sec=5, clock=clock)
+    cache.set("course1", {"price": 100.0})
+
+    assert cache.get("course1") == {"price": 100.0}
+    clock.now = 5
+    assert cache.get("course1") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_entries=2, ttl_sec=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expiring_keys(clock):
+    cache = TTLCache(max_entries=10, ttl_sec=60, clock=clock)
+    cache.set("old", 1, ttl_sec=10)
+    cache.set("soon", 2, ttl_sec=30)
+    cache.set("later", 3, ttl_sec=120)
+
+    clock.now = 20
+    assert cache.expiring_keys(within_sec=15) == ["soon"]
+    assert "old" not in cache
+
+
+def test_ttl_cache_expiring_keys_accessed_only(clock):
+    cache = TTLCache(max_entries=10, ttl_sec=30, clock=clock)
+    cache.set_many({"hot": 1, "cold": 2, "reloaded": 3})
+    cache.get("hot")
+    cache.get("reloaded")
+    cache.set("reloaded", 4)
+
+    clock.now = 20
+    assert cache.expiring_keys(within_sec=15) == ["cold", "hot", "reloaded"]
+    assert cache.expiring_keys(within_sec=15, accessed_only=True) == ["hot"]
+    assert "cold" in cache
+    assert cache.expiring_keys(within_sec=15, accessed_only=True) == ["hot"]
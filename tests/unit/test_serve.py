@@ -0,0 +1,84 @@
+import pytest
+from types import SimpleNamespace
+
+from src.serve import WorkerSupervisor
+from tests.fakes import FakeProcessContext
+
+
+@pytest.fixture
+def waits(monkeypatch):
+    """Replaces multiprocessing's wait(): returns the exited workers, records timeouts."""
+    waits = SimpleNamespace(exited=set(), timeouts=[])
+
+    def wait(sentinels, timeout=None):
+        waits.timeouts.append(timeout)
+        return [s for s in sentinels if s in waits.exited]
+
+    monkeypatch.setattr("src.serve.wait", wait)
+    return waits
+
+
+@pytest.fixture
+def supervisor(clock, waits, monkeypatch):
+    monkeypatch.setattr("src.serve.time", SimpleNamespace(monotonic=clock))
+    supervisor = WorkerSupervisor(worker_count=2, shutdown_grace_sec=1)
+    supervisor._ctx = FakeProcessContext()
+    for index in range(supervisor.worker_count):
+        supervisor._start(index)
+    return supervisor
+
+
+def exit_worker(supervisor, waits, index, code=1):
+    process = supervisor._workers[index]
+    process.exit(code)
+    waits.exited.add(process.sentinel)
+
+
+def test_crash_looping_worker_restarts_after_backoff_without_blocking(supervisor, clock, waits):
+    clock.now = 1
+    exit_worker(supervisor, waits, 0)
+    supervisor._step()
+    assert supervisor._restart_at == {0: 2}
+
+    # Still waiting out worker 0's backoff; worker 1 exiting is handled meanwhile
+    clock.now = 1.5
+    exit_worker(supervisor, waits, 1)
+    supervisor._step()
+    assert waits.timeouts[-1] == pytest.approx(0.5)
+    assert set(supervisor._restart_at) == {0, 1}
+    assert len(supervisor._ctx.processes) == 2
+
+    clock.now = 2
+    supervisor._step()
+    assert supervisor._workers[0].is_alive()
+    assert set(supervisor._restart_at) == {1}
+
+
+def test_restart_delay_doubles_while_crash_looping_and_resets_after_uptime(supervisor, clock, waits):
+    delays = []
+    for _ in range(7):
+        exit_worker(supervisor, waits, 0)
+        supervisor._step()
+        delays.append(supervisor._restart_at[0] - clock.now)
+        clock.now = supervisor._restart_at[0]
+        supervisor._step()
+    assert delays == [1, 2, 4, 8, 16, 30, 30]
+
+    clock.now += WorkerSupervisor.MIN_UPTIME_SEC
+    exit_worker(supervisor, waits, 0)
+    supervisor._step()
+    assert supervisor._restart_at[0] == clock.now
+
+
+def test_stop_drains_workers_and_skips_pending_restarts(supervisor, waits, monkeypatch):
+    exit_worker(supervisor, waits, 0)
+    supervisor._step()
+    stuck = supervisor._workers[1]
+    stuck.stops_on_terminate = False
+    monkeypatch.setattr(stuck, "join", lambda timeout=None: None)
+
+    supervisor._request_stop(15, None)
+    supervisor._drain()
+
+    assert stuck.terminated and stuck.killed
+    assert len(supervisor._ctx.processes) == 2